@@ -16,7 +16,7 @@ class ActionResult(Enum):
     PARTIAL = "partial"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionOutcome:
     """Result of executing an action."""
     result: ActionResult
@@ -97,7 +97,7 @@ class ExplorationAction(BaseAction):
         # Step 2: Discover planets (if system not already explored)
         if player.player_id not in star_system.explored_by:
             result.planets_discovered, result.star_card_drawn = self._discover_planets(star_system, game_state)
-            star_system.explored_by.add(player.player_id)
+            game_state.galaxy.mark_explored(location, player.player_id)
         
         # Step 3: Reveal enemy colonies and ships
         result.colonies_revealed = self._reveal_enemy_colonies(location, player, game_state)
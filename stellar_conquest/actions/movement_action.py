@@ -1,16 +1,36 @@
 """Ship movement actions."""
 
+import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 
+import numpy as np
+
 from .base_action import BaseAction, ActionResult, ActionOutcome
 from ..game.game_state import GameState
 from ..entities.ship import ShipType
 from ..entities.fleet import Fleet
-import random
+from ..utils.hex_utils import find_path
+from ..core.constants import SHIP_TYPE_INDEX
+
+log = logging.getLogger(__name__)
+
+# stellar_conquest.ai imports this module, so the redirect helper is resolved
+# on first use rather than at import time (see _get_taskforce_redirector)
+_taskforce_redirector = None
 
 
-@dataclass
+def _get_taskforce_redirector():
+    """Return handle_taskforce_combat_redirect, importing it once."""
+    global _taskforce_redirector
+    if _taskforce_redirector is None:
+        from ..ai.destination_selector import handle_taskforce_combat_redirect
+        _taskforce_redirector = handle_taskforce_combat_redirect
+    return _taskforce_redirector
+
+
+@dataclass(frozen=True, slots=True)
 class MovementOrder:
     """Individual ship movement order."""
     fleet_location: str  # Current hex
@@ -18,6 +38,14 @@ class MovementOrder:
     ship_count: int
     destination: str  # Target hex
     path: Optional[List[str]] = None  # Calculated path
+    task_force_id: Optional[int] = None  # Task force the moved ships form, if reserved
+
+
+@lru_cache(maxsize=4096)
+def make_order(fleet_location: str, ship_type: ShipType, ship_count: int, destination: str,
+               task_force_id: Optional[int] = None) -> MovementOrder:
+    """Return a shared MovementOrder; orders are immutable, so identical ones are interned."""
+    return MovementOrder(fleet_location, ship_type, ship_count, destination, task_force_id=task_force_id)
 
 
 class MovementAction(BaseAction):
@@ -26,6 +54,7 @@ class MovementAction(BaseAction):
     def __init__(self, player_id: int, movement_orders: List[MovementOrder]):
         super().__init__(player_id, "movement")
         self.movement_orders = movement_orders
+        self._prevalidated = False  # Set by subclasses whose orders are known valid before execute
     
     def validate(self, game_state: GameState) -> bool:
         """Validate all movement orders."""
@@ -97,7 +126,7 @@ class MovementAction(BaseAction):
     
     def execute(self, game_state: GameState) -> ActionOutcome:
         """Execute all movement orders."""
-        if not self.validate(game_state):
+        if not self._prevalidated and not self.validate(game_state):
             return ActionOutcome(ActionResult.INVALID, "Movement validation failed")
         
         player = game_state.players[self.player_id]
@@ -111,6 +140,9 @@ class MovementAction(BaseAction):
             except Exception as e:
                 failed_moves.append((order, str(e)))
         
+        if successful_moves:
+            game_state.bump_generation()
+        
         # Determine result
         if failed_moves:
             result = ActionResult.PARTIAL if successful_moves else ActionResult.FAILURE
@@ -216,7 +248,7 @@ class MovementAction(BaseAction):
         for ship_group in unarmed_ships:
             for _ in range(ship_group.count):
                 # Each unarmed ship faces attack from enemy warships
-                if self._attempt_unarmed_ship_destruction(ship_group.ship_type, enemy_warships):
+                if self._attempt_unarmed_ship_destruction(ship_group.ship_type, enemy_warships, game_state.rng):
                     losses.append({
                         "ship_type": ship_group.ship_type.value,
                         "location": location,
@@ -255,7 +287,7 @@ class MovementAction(BaseAction):
         
         return enemy_warships
     
-    def _attempt_unarmed_ship_destruction(self, target_ship_type: ShipType, enemy_warships) -> bool:
+    def _attempt_unarmed_ship_destruction(self, target_ship_type: ShipType, enemy_warships, rng) -> bool:
         """Attempt to destroy an unarmed ship using enemy warships."""
         # Use simplified attack resolution - stronger warships have better chances
         # Death stars auto-kill scouts/transports, fighters are very effective, corvettes less so
@@ -266,11 +298,11 @@ class MovementAction(BaseAction):
                 return True
             elif enemy_ship.ship_type == ShipType.FIGHTER:
                 # Fighters very effective against unarmed ships (1-5 on 1 die)
-                if random.randint(1, 6) <= 5:
+                if rng.integers(1, 7) <= 5:
                     return True
             elif enemy_ship.ship_type == ShipType.CORVETTE:
                 # Corvettes moderately effective (1-3 on 1 die) 
-                if random.randint(1, 6) <= 3:
+                if rng.integers(1, 7) <= 3:
                     return True
         
         return False  # Ship survives all attacks
@@ -287,38 +319,42 @@ class MovementAction(BaseAction):
             return  # Nowhere to flee
         
         # Choose random adjacent hex for immediate fleeing
-        flee_destination = random.choice(adjacent_hexes)
+        flee_destination = adjacent_hexes[game_state.rng.integers(len(adjacent_hexes))]
         
-        # Group ships by taskforce to handle redirection properly
+        fleeing_groups = [g for g in surviving_ships if g.count > 0]  # Still has ships after attacks
+        
+        # Group ships by taskforce to handle redirection properly. TF1 (main base)
+        # never has a movement plan, so only the other taskforces are collected.
+        # Each taskforce maps to a ship count array indexed by SHIP_TYPE_INDEX.
         taskforce_ships = {}
-        for ship_group in surviving_ships:
-            if ship_group.count > 0:
-                tf_id = getattr(ship_group, 'task_force_id', 1)
-                if tf_id not in taskforce_ships:
-                    taskforce_ships[tf_id] = {}
-                if ship_group.ship_type not in taskforce_ships[tf_id]:
-                    taskforce_ships[tf_id][ship_group.ship_type] = 0
-                taskforce_ships[tf_id][ship_group.ship_type] += ship_group.count
+        for ship_group in fleeing_groups:
+            tf_id = getattr(ship_group, 'task_force_id', 1)
+            if tf_id == 1:
+                continue
+            if tf_id not in taskforce_ships:
+                taskforce_ships[tf_id] = np.zeros(len(SHIP_TYPE_INDEX), dtype=np.uint16)
+            taskforce_ships[tf_id][SHIP_TYPE_INDEX[ship_group.ship_type]] += ship_group.count
         
         # Move surviving ships to flee destination
-        for ship_group in surviving_ships:
-            if ship_group.count > 0:  # Still has ships after attacks
-                # Create new fleet at flee destination or add to existing
-                flee_fleet = player.get_fleet_at_location(flee_destination)
-                if not flee_fleet:
-                    flee_fleet = Fleet(player.player_id, flee_destination)
-                    player.fleets.append(flee_fleet)
-                
+        if fleeing_groups:
+            # Both fleets are fixed for the whole flee, so look them up once
+            flee_fleet = player.get_fleet_at_location(flee_destination)
+            if not flee_fleet:
+                flee_fleet = Fleet(player.player_id, flee_destination)
+                player.fleets.append(flee_fleet)
+            original_fleet = player.get_fleet_at_location(location)
+            
+            for ship_group in fleeing_groups:
                 # Move all remaining ships of this type
                 flee_fleet.add_ships(ship_group.ship_type, ship_group.count, flee_destination)
                 
                 # Remove from original location
-                original_fleet = player.get_fleet_at_location(location)
                 if original_fleet:
                     original_fleet.remove_ships(ship_group.ship_type, ship_group.count)
         
         # Now handle redirection of movement plans to avoid returning to the problem location
-        self._redirect_fled_taskforces(game_state, player, taskforce_ships, location, flee_destination)
+        if taskforce_ships:
+            self._redirect_fled_taskforces(game_state, player, taskforce_ships, location, flee_destination)
         
         game_state.log_action("unarmed_ships_flee", {
             "from_location": location,
@@ -329,19 +365,16 @@ class MovementAction(BaseAction):
     
     def _redirect_fled_taskforces(self, game_state: GameState, player, taskforce_ships, fled_from_location, current_location):
         """Redirect taskforce movement plans after fleeing to avoid returning to problem location."""
-        from stellar_conquest.ai.destination_selector import handle_taskforce_combat_redirect
-        
         if not hasattr(game_state, 'movement_plans'):
             return
         
         if player.player_id not in game_state.movement_plans:
             return
         
+        handle_taskforce_combat_redirect = _get_taskforce_redirector()
+        
         # Handle redirection for each taskforce that fled
         for tf_id, ship_composition in taskforce_ships.items():
-            if tf_id == 1:  # TF1 (main base) doesn't have movement plans
-                continue
-                
             if tf_id not in game_state.movement_plans[player.player_id]:
                 continue  # No movement plan to redirect
             
@@ -359,11 +392,11 @@ class MovementAction(BaseAction):
             
             if new_destination and new_destination != original_destination:
                 # Calculate new path from current flee location to new destination
-                from stellar_conquest.utils.hex_utils import find_path
                 new_path = find_path(current_location, new_destination)
                 
                 if new_path:
-                    print(f"   🔄 TF{tf_id} flight path redirected from {original_destination} to {new_destination}")
+                    log.debug("TF%d flight path redirected from %s to %s",
+                              tf_id, original_destination, new_destination)
                     movement_plan.update({
                         'final_destination': new_destination,
                         'planned_path': new_path,
@@ -375,9 +408,11 @@ class MovementAction(BaseAction):
                         'redirect_reason': f"Fled from combat at {fled_from_location}, avoiding return"
                     })
                 else:
-                    print(f"   ❌ Could not find path to new destination {new_destination} for fled TF{tf_id}")
+                    log.debug("Could not find path to new destination %s for fled TF%d",
+                              new_destination, tf_id)
             else:
-                print(f"   ➡️  TF{tf_id} will continue toward original destination {original_destination} when safe")
+                log.debug("TF%d will continue toward original destination %s when safe",
+                          tf_id, original_destination)
 
 
 class FirstTurnEntryAction(MovementAction):
@@ -409,4 +444,15 @@ class FirstTurnEntryAction(MovementAction):
         
         # Entry hex must be available
         entry_hex = game_state.galaxy.entry_hexes.get(player.player_id)
-        return entry_hex is not None
\ No newline at end of file
+        return entry_hex is not None
+    
+    def execute(self, game_state: GameState) -> ActionOutcome:
+        """Run the first-turn checks, then move the starting fleet.
+        
+        The scripted starting fleet orders are valid by construction, so the
+        parent execute() is told not to validate them again.
+        """
+        if not self.validate(game_state):
+            return ActionOutcome(ActionResult.INVALID, "Movement validation failed")
+        self._prevalidated = True
+        return super().execute(game_state)
\ No newline at end of file
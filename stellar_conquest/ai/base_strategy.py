@@ -1,15 +1,23 @@
 """Base strategy class for AI decision making."""
 
+import functools
+import heapq
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Deque, Callable
 from enum import Enum
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..game.game_state import GameState
 from ..entities.player import Player
 from ..actions.base_action import BaseAction
-from ..actions.movement_action import MovementAction, MovementOrder
-from ..core.enums import ShipType
+from ..actions.movement_action import MovementAction, make_order
+from ..core.enums import ShipType, PlanetType
+from ..core.constants import SHIP_TYPE_INDEX
+from ..utils.hex_utils_numba import hex_to_axial, within_distance_mask
 
 
 class GamePhase(Enum):
@@ -28,6 +36,14 @@ class Priority(Enum):
     MINIMAL = 1
 
 
+# Game phase indexed by turn number (0-44); later turns clamp to the last entry
+PHASE_BY_TURN = tuple(
+    [GamePhase.EARLY_EXPLORATION] * 13 +
+    [GamePhase.MID_EXPANSION] * 16 +
+    [GamePhase.LATE_MILITARY] * 16
+)
+
+
 @dataclass
 class StrategyWeights:
     """Weights for different strategic priorities."""
@@ -38,13 +54,173 @@ class StrategyWeights:
     economy: float = 1.0
 
 
+@dataclass(frozen=True, slots=True)
+class ShipIndex:
+    """Flat per-turn view of a player's ships; row i describes ships[i] at locations[i]."""
+    locations: Tuple[str, ...]
+    ships: Tuple[Any, ...]
+    group_ids: np.ndarray  # Position of each row's ship group in player.ship_groups
+    type_ids: np.ndarray  # Position of each ship type in SHIP_TYPE_ORDER
+    counts: np.ndarray
+    is_warship: np.ndarray
+    loc_to_rows: Dict[str, np.ndarray]
+
+
+@dataclass(slots=True)
+class AttackTargetInfo:
+    """An enemy colony considered for attack; colony details are read on demand."""
+    enemy_player: str
+    colony: Any
+    location: str
+    value_score: float
+    
+    @property
+    def population(self) -> int:
+        return self.colony.population
+    
+    @property
+    def factories(self) -> int:
+        return self.colony.factories
+    
+    @property
+    def missile_bases(self) -> int:
+        return self.colony.missile_bases
+    
+    @property
+    def advanced_missile_bases(self) -> int:
+        return self.colony.advanced_missile_bases
+    
+    @property
+    def has_planet_shield(self) -> bool:
+        return self.colony.has_planet_shield
+    
+    @property
+    def planet_type(self) -> str:
+        return self.colony.planet.planet_type.value
+    
+    @property
+    def mineral_rich(self) -> bool:
+        return self.colony.planet.is_mineral_rich
+    
+    @property
+    def is_attackable(self) -> bool:
+        return not self.colony.has_planet_shield
+    
+    @property
+    def defense_strength(self) -> int:
+        return self.colony.missile_bases + (self.colony.advanced_missile_bases * 2)
+
+
+@dataclass(frozen=True, slots=True)
+class StrategyScoreboard:
+    """Per-system scores for one player and turn, indexed like galaxy.system_locations.
+    
+    NaN marks a system that is not a candidate for that objective.
+    """
+    locations: Tuple[str, ...]
+    exploration: np.ndarray
+    military: np.ndarray
+    victory_points: np.ndarray
+    colony_attacks: Tuple[Tuple[str, AttackTargetInfo], ...]  # Best first; several per system possible
+    
+    def ranked(self, scores: np.ndarray, k: Optional[int] = None) -> Tuple[Tuple[str, float], ...]:
+        """(location, score) for the candidates in a score column, best first; ties keep galaxy order.
+        
+        When k is given only the best k are ranked, with a bounded heap instead of a full sort.
+        """
+        candidates = np.flatnonzero(~np.isnan(scores))
+        if k is None:
+            order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        else:
+            order = heapq.nlargest(k, candidates.tolist(), key=scores.__getitem__)
+        return tuple((self.locations[idx], float(scores[idx])) for idx in order)
+
+
+# Exploration preference by star color
+_EXPLORATION_COLOR_BONUS = {
+    "yellow": 2.0,  # More likely to have Terran planets
+    "blue": 1.5,    # More likely to have mineral-rich planets
+    "green": 1.2,
+    "orange": 1.0,
+    "red": 0.8
+}
+
+
+# Relative combat value per ship type
+_SHIP_COMBAT_VALUE = {
+    ShipType.SCOUT: 0.0,
+    ShipType.COLONY_TRANSPORT: 0.0,
+    ShipType.CORVETTE: 1.0,
+    ShipType.FIGHTER: 2.5,
+    ShipType.DEATH_STAR: 6.0
+}
+
+# Colonization preference by planet type
+_COLONIZATION_TYPE_SCORE = {
+    PlanetType.TERRAN: 5.0,
+    PlanetType.SUB_TERRAN: 3.0,
+    PlanetType.MINIMAL_TERRAN: 1.5,
+    PlanetType.BARREN: 0.5
+}
+
+# Colony value multiplier by planet type (other types count once)
+_COLONY_TYPE_MULT = {
+    PlanetType.TERRAN: 2.0,
+    PlanetType.SUB_TERRAN: 1.5
+}
+
+# Plain type names ("corvette", "terran", ...) resolve to the same values
+_SHIP_COMBAT_VALUE.update({t.value: v for t, v in list(_SHIP_COMBAT_VALUE.items())})
+_COLONIZATION_TYPE_SCORE.update({t.value: v for t, v in list(_COLONIZATION_TYPE_SCORE.items())})
+_COLONY_TYPE_MULT.update({t.value: v for t, v in list(_COLONY_TYPE_MULT.items())})
+
+# Returned for locations without any enemy presence; shared, so read-only
+_NO_ENEMY_PRESENCE = MappingProxyType({
+    "total_strength": 0,
+    "colony_value": 0,
+    "ship_counts": MappingProxyType({})
+})
+
+
+# Scouts kept together in one task force before the rest are split off
+SCOUT_TASK_FORCE_LIMIT = 5
+_SCOUT_ID = SHIP_TYPE_INDEX[ShipType.SCOUT]
+
+
+def _once_per_turn(planner):
+    """Run a (player, game_state) planner once per turn, player and state generation, reusing its result."""
+    @functools.wraps(planner)
+    def wrapper(self, player, game_state):
+        self._refresh_turn_caches(game_state)
+        key = (game_state.current_turn, player.player_id, planner.__name__, game_state.generation)
+        return self._cached(key, lambda: planner(self, player, game_state))
+    return wrapper
+
+
 class BaseStrategy(ABC):
     """Base class for AI strategy implementations."""
     
+    # Most recent decisions kept for analysis; older entries are discarded
+    DECISION_HISTORY_LIMIT = 4096
+    
     def __init__(self, strategy_name: str, weights: StrategyWeights):
         self.strategy_name = strategy_name
         self.weights = weights
-        self.decision_history: List[Dict[str, Any]] = []
+        self.decision_history: Deque[Dict[str, Any]] = deque(maxlen=self.DECISION_HISTORY_LIMIT)
+        self.record_decisions = False  # Planner decisions reach decision_history only when enabled
+        
+        # Per-turn caches, dropped by _refresh_turn_caches when the turn changes;
+        # those that read game state are also dropped when its generation changes
+        self._cache_turn: Optional[int] = None
+        self._cache_generation: Optional[int] = None
+        self._distance_cache: Dict[Tuple[str, str], int] = {}
+        self._eval_cache: Dict[Tuple[Any, ...], Any] = {}
+        self._occupancy_index: Optional[Dict[str, List[Any]]] = None
+        self._loc2axial: Dict[str, Tuple[int, int]] = {}
+        self._enemy_presence_cache: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        self._fleet_locations: Dict[int, List[str]] = {}
+        self._enemy_warship_table: Dict[int, Dict[str, List[Tuple[str, int]]]] = {}
+        self._colony_value_cache: Dict[Tuple[str, Optional[int]], float] = {}
     
     @abstractmethod
     def decide_turn_actions(self, player: Player, game_state: GameState) -> List[BaseAction]:
@@ -57,90 +233,260 @@ class BaseStrategy(ABC):
         """Decide how to spend industrial points during production turns."""
         pass
     
+    def _refresh_turn_caches(self, game_state: GameState) -> None:
+        """Drop cached data once the turn changes or the game state is mutated.
+        
+        Distances and axial coordinates depend only on the board and are kept
+        for the whole turn; everything derived from players, ships or colonies
+        is dropped as soon as game_state.generation moves.
+        """
+        if self._cache_turn != game_state.current_turn:
+            self._cache_turn = game_state.current_turn
+            self._cache_generation = None
+            self._distance_cache.clear()
+            self._loc2axial.clear()
+        if self._cache_generation != game_state.generation:
+            self._cache_generation = game_state.generation
+            self._eval_cache.clear()
+            self._occupancy_index = None
+            self._enemy_presence_cache.clear()
+            self._fleet_locations.clear()
+            self._enemy_warship_table.clear()
+            self._colony_value_cache.clear()
+    
+    def clear_turn_caches(self) -> None:
+        """Force per-turn caches to rebuild, e.g. after the game state was changed mid-turn."""
+        self._cache_turn = None
+        self._cache_generation = None
+    
+    def _cached(self, key: Tuple[Any, ...], compute) -> Any:
+        """Return the cached evaluation for key, computing it on first use this turn."""
+        result = self._eval_cache.get(key)
+        if result is None:
+            result = compute()
+            self._eval_cache[key] = result
+        return result
+    
+    def _distance(self, loc_a: str, loc_b: str, game_state: GameState) -> int:
+        """Galaxy distance between two locations, cached for the current turn."""
+        self._refresh_turn_caches(game_state)
+        key = (loc_a, loc_b)
+        distance = self._distance_cache.get(key)
+        if distance is None:
+            distance = game_state.galaxy.calculate_distance(loc_a, loc_b)
+            self._distance_cache[key] = distance
+        return distance
+    
+    def _axial(self, location: str, game_state: GameState) -> Tuple[int, int]:
+        """Axial hex coordinates of a location, cached for the current turn."""
+        self._refresh_turn_caches(game_state)
+        axial = self._loc2axial.get(location)
+        if axial is None:
+            axial = self._loc2axial[location] = hex_to_axial(location)
+        return axial
+    
     def get_game_phase(self, game_state: GameState) -> GamePhase:
         """Determine current game phase for strategy adaptation."""
         turn = game_state.current_turn
-        if turn <= 12:
-            return GamePhase.EARLY_EXPLORATION
-        elif turn <= 28:
-            return GamePhase.MID_EXPANSION
-        else:
-            return GamePhase.LATE_MILITARY
+        return PHASE_BY_TURN[min(max(turn, 0), len(PHASE_BY_TURN) - 1)]
     
-    def evaluate_exploration_targets(self, player: Player, game_state: GameState) -> List[Tuple[str, float]]:
-        """Evaluate and rank star systems for exploration."""
-        candidates = []
-        
-        # Find unexplored star systems within range
-        for location, star_system in game_state.galaxy.star_systems.items():
-            if player.player_id not in star_system.explored_by:
-                # Check if player has ships that can reach this system
-                reachable = self._is_location_reachable(location, player, game_state)
-                if reachable:
-                    score = self._score_exploration_target(location, star_system, player, game_state)
-                    candidates.append((location, score))
-        
-        # Sort by score descending
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        return candidates
+    def evaluate_exploration_targets(self, player: Player, game_state: GameState,
+                                     k: Optional[int] = None) -> Tuple[Tuple[str, float], ...]:
+        """Evaluate and rank star systems for exploration; only the best k when k is given."""
+        self._refresh_turn_caches(game_state)
+        key = (game_state.current_turn, player.player_id, "exploration", k)
+        board = self.compute_scoreboard(player, game_state)
+        return self._cached(key, lambda: board.ranked(board.exploration, k))
+    
+    def _exploration_scores(self, player: Player, game_state: GameState) -> np.ndarray:
+        """Score every reachable unexplored star system; other systems are NaN."""
+        galaxy = game_state.galaxy
+        column = np.full(len(galaxy.system_locations), np.nan)
+        fleet_locations = self._get_fleet_locations(player, game_state)
+        unexplored_idx = np.flatnonzero(~galaxy.explored_mask(player.player_id))
+        if not fleet_locations or unexplored_idx.size == 0:
+            return column
+        unexplored = [galaxy.system_locations[idx] for idx in unexplored_idx]
+        
+        # Fleet x system distances; each system is scored from its nearest fleet
+        distances = np.array([
+            [self._distance(fleet_location, location, game_state) for location in unexplored]
+            for fleet_location in fleet_locations
+        ], dtype=np.float64)
+        min_distance = distances.min(axis=0)
+        reachable = min_distance <= player.current_ship_speed
+        
+        # Same scoring as _score_exploration_target, applied to every system at once
+        color_lut = np.array([_EXPLORATION_COLOR_BONUS.get(color.value, 1.0) for color in galaxy.STAR_COLORS])
+        color_bonus = color_lut[galaxy.system_color[unexplored_idx]]
+        scores = color_bonus * (1.0 / (1.0 + min_distance * 0.1))
+        
+        column[unexplored_idx[reachable]] = scores[reachable]
+        return column
+    
+    def evaluate_colonization_targets(self, player: Player, game_state: GameState,
+                                      k: Optional[int] = None) -> Tuple[Tuple[str, float], ...]:
+        """Evaluate and rank planets for colonization; only the best k when k is given."""
+        self._refresh_turn_caches(game_state)
+        key = (game_state.current_turn, player.player_id, "colonization", k)
+        return self._cached(key, lambda: self._rank_colonization_targets(player, game_state, k))
     
-    def evaluate_colonization_targets(self, player: Player, game_state: GameState) -> List[Tuple[str, float]]:
-        """Evaluate and rank planets for colonization."""
+    def _rank_colonization_targets(self, player: Player, game_state: GameState,
+                                   k: Optional[int] = None) -> Tuple[Tuple[str, float], ...]:
+        """Score every colonizable planet in explored systems, best first."""
         candidates = []
+        galaxy = game_state.galaxy
         
         # Find habitable planets that player has discovered
-        for location, star_system in game_state.galaxy.star_systems.items():
-            if player.player_id in star_system.explored_by:
-                for planet in star_system.planets:
-                    # Check if planet is colonizable and unoccupied
-                    if self._is_planet_colonizable(planet, player) and not self._is_planet_occupied(location, game_state):
-                        score = self._score_colonization_target(location, planet, player, game_state)
-                        candidates.append((location, score))
+        for idx in np.flatnonzero(galaxy.explored_mask(player.player_id)):
+            location = galaxy.system_locations[idx]
+            # Occupancy depends only on the system, so reject occupied systems outright
+            if self._is_planet_occupied(location, game_state):
+                continue
+            for planet in galaxy.systems_by_index[idx].planets:
+                if self._is_planet_colonizable(planet, player):
+                    score = self._score_colonization_target(location, planet, player, game_state)
+                    candidates.append((location, score))
         
+        if k is not None:
+            return tuple(heapq.nlargest(k, candidates, key=lambda x: x[1]))
         candidates.sort(key=lambda x: x[1], reverse=True)
-        return candidates
+        return tuple(candidates)
     
-    def evaluate_military_targets(self, player: Player, game_state: GameState) -> List[Tuple[str, float]]:
-        """Evaluate and rank military targets for attack."""
-        candidates = []
+    def evaluate_military_targets(self, player: Player, game_state: GameState,
+                                  k: Optional[int] = None) -> Tuple[Tuple[str, float], ...]:
+        """Evaluate and rank military targets for attack; only the best k when k is given."""
+        self._refresh_turn_caches(game_state)
+        key = (game_state.current_turn, player.player_id, "military", k)
+        board = self.compute_scoreboard(player, game_state)
+        return self._cached(key, lambda: board.ranked(board.military, k))
+    
+    def evaluate_colony_attack_targets(self, player: Player, game_state: GameState) -> Tuple[Tuple[str, AttackTargetInfo], ...]:
+        """Review discovered enemy colonies and evaluate them for attack opportunities."""
+        return self.compute_scoreboard(player, game_state).colony_attacks
+    
+    def compute_scoreboard(self, player: Player, game_state: GameState) -> StrategyScoreboard:
+        """Per-system exploration, military and victory point scores, computed once per turn."""
+        self._refresh_turn_caches(game_state)
+        key = (game_state.current_turn, player.player_id, "scoreboard")
+        return self._cached(key, lambda: self._build_scoreboard(player, game_state))
+    
+    def _build_scoreboard(self, player: Player, game_state: GameState) -> StrategyScoreboard:
+        """Score every objective in a single pass over the galaxy's systems."""
+        galaxy = game_state.galaxy
+        explored = galaxy.explored_mask(player.player_id)
+        total_vp_by_system = self._unoccupied_victory_points(player, game_state)
+        military = np.full(len(galaxy.system_locations), np.nan)
+        victory_points = np.full(len(galaxy.system_locations), np.nan)
+        attack_targets = []
         
-        for location in game_state.galaxy.star_systems.keys():
+        for idx, location in enumerate(galaxy.system_locations):
             # Look for enemy colonies or valuable systems to attack
             enemy_presence = self._assess_enemy_strength(location, player, game_state)
             if enemy_presence["total_strength"] > 0:
-                score = self._score_military_target(location, enemy_presence, player, game_state)
-                candidates.append((location, score))
+                military[idx] = self._score_military_target(location, enemy_presence, player, game_state)
+            
+            # Victory points and colony attacks only consider discovered systems (from exploration/intelligence)
+            if not explored[idx]:
+                continue
+            
+            if total_vp_by_system[idx]:
+                victory_points[idx] = self._score_victory_point_system(
+                    location, int(total_vp_by_system[idx]), enemy_presence, player)
+            
+            # Check each enemy player for colonies at this location
+            for other_player in game_state.players:
+                if other_player.player_id == player.player_id:
+                    continue
+                
+                enemy_colonies = other_player.get_colonies_at_location(location)
+                if enemy_colonies:
+                    # Rule: Can only attack if no enemy ships present
+                    enemy_ship_group = other_player.get_ship_group_at_location(location)
+                    has_enemy_ships = enemy_ship_group and enemy_ship_group.get_total_ships() > 0
+                    
+                    if not has_enemy_ships:
+                        for colony in enemy_colonies:
+                            # Shielded colonies cannot be attacked
+                            if colony.has_planet_shield:
+                                continue
+                            
+                            # Evaluate colony value and attack feasibility
+                            target_value = self._evaluate_colony_attack_value(colony, location, other_player, game_state)
+                            if target_value > 0:
+                                attack_targets.append((location, AttackTargetInfo(
+                                    enemy_player=other_player.name,
+                                    colony=colony,
+                                    location=location,
+                                    value_score=target_value
+                                )))
         
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        return candidates
+        # Sort by value (best targets first)
+        attack_targets.sort(key=lambda x: x[1].value_score, reverse=True)
+        
+        return StrategyScoreboard(
+            locations=tuple(galaxy.system_locations),
+            exploration=self._exploration_scores(player, game_state),
+            military=military,
+            victory_points=victory_points,
+            colony_attacks=tuple(attack_targets)
+        )
+    
+    def _get_ship_index(self, player: Player, game_state: GameState) -> ShipIndex:
+        """The player's ships as parallel arrays, built once per turn."""
+        self._refresh_turn_caches(game_state)
+        key = (game_state.current_turn, player.player_id, "ship_index")
+        return self._cached(key, lambda: self._build_ship_index(player))
+    
+    def _build_ship_index(self, player: Player) -> ShipIndex:
+        """Flatten every ship in every ship group into one row per ship, in group order."""
+        locations = []
+        ships = []
+        group_ids = []
+        for group_id, ship_group in enumerate(player.ship_groups):
+            for ship in ship_group.ships:
+                locations.append(ship_group.location)
+                ships.append(ship)
+                group_ids.append(group_id)
+        
+        loc_to_rows = {}
+        for row, location in enumerate(locations):
+            loc_to_rows.setdefault(location, []).append(row)
+        
+        return ShipIndex(
+            locations=tuple(locations),
+            ships=tuple(ships),
+            group_ids=np.array(group_ids, dtype=np.intp),
+            type_ids=np.array([SHIP_TYPE_INDEX[ship.ship_type] for ship in ships], dtype=np.int32),
+            counts=np.array([ship.count for ship in ships], dtype=np.int32),
+            is_warship=np.array([ship.is_warship for ship in ships], dtype=bool),
+            loc_to_rows={location: np.array(rows, dtype=np.intp) for location, rows in loc_to_rows.items()}
+        )
+    
+    def _get_fleet_locations(self, player: Player, game_state: GameState) -> List[str]:
+        """Locations of the player's fleets, collected once per turn."""
+        self._refresh_turn_caches(game_state)
+        locations = self._fleet_locations.get(player.player_id)
+        if locations is None:
+            locations = self._fleet_locations[player.player_id] = [fleet.location for fleet in player.fleets]
+        return locations
     
     def _is_location_reachable(self, location: str, player: Player, game_state: GameState) -> bool:
         """Check if player has ships that can reach the location."""
         max_speed = player.current_ship_speed
-        
-        for fleet in player.fleets:
-            distance = game_state.galaxy.calculate_distance(fleet.location, location)
-            if distance <= max_speed:
-                return True
-        return False
+        return any(self._distance(fleet_location, location, game_state) <= max_speed
+                   for fleet_location in self._get_fleet_locations(player, game_state))
     
     def _score_exploration_target(self, location: str, star_system, player: Player, game_state: GameState) -> float:
         """Score an exploration target based on strategy."""
         base_score = 1.0
         
         # Prefer star colors more likely to have valuable planets
-        color_bonus = {
-            "yellow": 2.0,  # More likely to have Terran planets
-            "blue": 1.5,    # More likely to have mineral-rich planets
-            "green": 1.2,
-            "orange": 1.0,
-            "red": 0.8
-        }
-        base_score *= color_bonus.get(star_system.color.value, 1.0)
+        base_score *= _EXPLORATION_COLOR_BONUS.get(star_system.color.value, 1.0)
         
         # Distance penalty (closer is better)
         min_distance = min(
-            game_state.galaxy.calculate_distance(fleet.location, location)
+            self._distance(fleet.location, location, game_state)
             for fleet in player.fleets
         )
         distance_penalty = 1.0 / (1.0 + min_distance * 0.1)
@@ -152,13 +498,7 @@ class BaseStrategy(ABC):
         base_score = 0.0
         
         # Score based on planet type
-        type_scores = {
-            "terran": 5.0,
-            "sub_terran": 3.0,
-            "minimal_terran": 1.5,
-            "barren": 0.5
-        }
-        base_score += type_scores.get(planet.planet_type.value, 0.0)
+        base_score += _COLONIZATION_TYPE_SCORE.get(planet.planet_type, 0.0)
         
         # Population capacity bonus
         base_score += planet.max_population * 0.05
@@ -187,161 +527,137 @@ class BaseStrategy(ABC):
             return player.can_colonize_barren()
         return True
     
+    def _get_occupancy_index(self, game_state: GameState) -> Dict[str, List[Any]]:
+        """Map each location to every colony there, built once per turn."""
+        self._refresh_turn_caches(game_state)
+        if self._occupancy_index is None:
+            index = {}
+            for player in game_state.players:
+                for colony in player.colonies:
+                    index.setdefault(colony.location, []).append(colony)
+            self._occupancy_index = index
+        return self._occupancy_index
+    
     def _is_planet_occupied(self, location: str, game_state: GameState) -> bool:
         """Check if any planet at location has a colony."""
-        for player in game_state.players.values():
-            if player.get_colony_at_location(location):
-                return True
-        return False
+        return location in self._get_occupancy_index(game_state)
     
     def _assess_enemy_strength(self, location: str, player: Player, game_state: GameState) -> Dict[str, Any]:
         """Assess enemy military strength at a location."""
-        total_strength = 0
-        colony_value = 0
-        ship_counts = {}
+        self._refresh_turn_caches(game_state)
+        presence = self._enemy_presence_cache.get(player.player_id)
+        if presence is None:
+            presence = self._enemy_presence_cache[player.player_id] = (
+                self._build_enemy_presence(player, game_state))
+        return presence.get(location, _NO_ENEMY_PRESENCE)
+    
+    def _build_enemy_presence(self, player: Player, game_state: GameState) -> Dict[str, Dict[str, Any]]:
+        """Aggregate enemy strength for every location in one pass over the other players."""
+        presence = {}
+        
+        def entry(location):
+            if location not in presence:
+                presence[location] = {"total_strength": 0, "colony_value": 0, "ship_counts": {}}
+            return presence[location]
         
-        for other_player_id, other_player in game_state.players.items():
-            if other_player_id == player.player_id:
+        for other_player in game_state.players:
+            if other_player.player_id == player.player_id:
                 continue
             
             # Count enemy ships
-            enemy_fleet = other_player.get_fleet_at_location(location)
-            if enemy_fleet:
+            for enemy_fleet in other_player.fleets:
+                target = entry(enemy_fleet.location)
+                ship_counts = target["ship_counts"]
                 for ship_type, count in enemy_fleet.ship_counts.items():
                     ship_counts[ship_type] = ship_counts.get(ship_type, 0) + count
-                    total_strength += self._get_ship_combat_value(ship_type) * count
+                    target["total_strength"] += self._get_ship_combat_value(ship_type) * count
             
             # Assess enemy colonies
-            enemy_colonies = other_player.get_colony_at_location(location)
-            for colony in enemy_colonies:
-                colony_value += self._get_colony_value(colony)
-                total_strength += colony.missile_bases + colony.advanced_missile_bases * 2
+            for colony in other_player.colonies:
+                target = entry(colony.location)
+                target["colony_value"] += self._get_colony_value(colony)
+                target["total_strength"] += colony.missile_bases + colony.advanced_missile_bases * 2
         
-        return {
-            "total_strength": total_strength,
-            "colony_value": colony_value,
-            "ship_counts": ship_counts
-        }
+        return presence
     
     def _get_ship_combat_value(self, ship_type) -> float:
         """Get relative combat value of ship type."""
-        values = {
-            "scout": 0.0,
-            "colony_transport": 0.0,
-            "corvette": 1.0,
-            "fighter": 2.5,
-            "death_star": 6.0
-        }
-        return values.get(ship_type.value if hasattr(ship_type, 'value') else str(ship_type), 0.0)
+        return _SHIP_COMBAT_VALUE.get(ship_type, 0.0)
     
     def _get_colony_value(self, colony) -> float:
+        """Estimate strategic value of a colony, computed once per colony per turn."""
+        key = (colony.id, self._cache_turn)
+        value = self._colony_value_cache.get(key)
+        if value is None:
+            value = self._colony_value_cache[key] = self._compute_colony_value(colony)
+        return value
+    
+    def _compute_colony_value(self, colony) -> float:
         """Estimate strategic value of a colony."""
-        base_value = colony.population * 0.1
-        base_value += colony.factories * 2.0
-        
-        if colony.planet.planet_type.value == "terran":
-            base_value *= 2.0
-        elif colony.planet.planet_type.value == "sub_terran":
-            base_value *= 1.5
+        planet = colony.planet
+        base_value = (colony.population * 0.1 + colony.factories * 2.0) * _COLONY_TYPE_MULT.get(planet.planet_type, 1.0)
         
-        if colony.planet.is_mineral_rich:
+        if planet.is_mineral_rich:
             base_value *= 1.5
         
         return base_value
     
-    def evaluate_victory_point_positions(self, player: Player, game_state: GameState) -> List[Tuple[str, float]]:
-        """Evaluate star systems for Rule C victory point control (ships in unoccupied systems)."""
-        candidates = []
+    def evaluate_victory_point_positions(self, player: Player, game_state: GameState,
+                                         k: Optional[int] = None) -> Tuple[Tuple[str, float], ...]:
+        """Evaluate star systems for Rule C victory point control (ships in unoccupied systems).
+        
+        Only the best k are returned when k is given.
+        """
+        self._refresh_turn_caches(game_state)
+        key = (game_state.current_turn, player.player_id, "victory_points", k)
+        board = self.compute_scoreboard(player, game_state)
+        return self._cached(key, lambda: board.ranked(board.victory_points, k))
+    
+    def _unoccupied_victory_points(self, player: Player, game_state: GameState) -> np.ndarray:
+        """Victory points per system from unoccupied planets in systems this player has explored."""
+        # Planets held by an active colony, keyed by (location, planet identity)
+        occupied = {
+            (location, id(colony.planet))
+            for location, colonies in self._get_occupancy_index(game_state).items()
+            for colony in colonies if colony.is_active
+        }
         
-        # Look for star systems with unoccupied planets that give victory points
-        for location, star_system in game_state.galaxy.star_systems.items():
-            if player.player_id in star_system.explored_by:
-                # Check if system has unoccupied planets with victory points
-                unoccupied_vp_planets = []
-                for planet in star_system.planets:
-                    if planet.victory_points > 0:
-                        # Check if this specific planet is unoccupied
-                        is_unoccupied = True
-                        for other_player in game_state.players:
-                            for colony in other_player.colonies:
-                                if (colony.location == location and colony.is_active and 
-                                    (colony.planet == planet or id(colony.planet) == id(planet))):
-                                    is_unoccupied = False
-                                    break
-                            if not is_unoccupied:
-                                break
-                        
-                        if is_unoccupied:
-                            unoccupied_vp_planets.append(planet)
-                
-                if unoccupied_vp_planets:
-                    # Calculate value of controlling this system
-                    total_vp = sum(planet.victory_points for planet in unoccupied_vp_planets)
-                    
-                    # Check if we already have ships there
-                    has_ships = player.get_ship_group_at_location(location) is not None
-                    
-                    # Check for enemy ships (reduces value)
-                    enemy_presence = self._assess_enemy_strength(location, player, game_state)
-                    enemy_penalty = enemy_presence["total_strength"] * 0.1
-                    
-                    score = total_vp - enemy_penalty
-                    if not has_ships:
-                        score *= 2.0  # Double value if we need to send ships
-                    
-                    candidates.append((location, score))
+        # Victory point planets in systems this player has explored
+        galaxy = game_state.galaxy
+        planets = galaxy.planet_arrays()
+        planet_system = planets["system"]
+        rows = np.flatnonzero((planets["victory_points"] > 0) &
+                              galaxy.explored_mask(player.player_id)[planet_system])
+        
+        # Keep only the unoccupied ones and total their victory points per system
+        rows = [row for row in rows
+                if (galaxy.system_locations[planet_system[row]], id(planets["planets"][row])) not in occupied]
+        return np.bincount(planet_system[rows], weights=planets["victory_points"][rows],
+                           minlength=len(galaxy.system_locations))
+    
+    def _score_victory_point_system(self, location: str, total_vp: int, enemy_presence: Dict[str, Any],
+                                    player: Player) -> float:
+        """Score holding a system worth total_vp unoccupied victory points."""
+        # Check if we already have ships there
+        has_ships = player.get_ship_group_at_location(location) is not None
         
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        return candidates
-
-    def evaluate_colony_attack_targets(self, player: Player, game_state: GameState) -> List[Tuple[str, Dict[str, Any]]]:
-        """Review discovered enemy colonies and evaluate them for attack opportunities."""
-        attack_targets = []
+        # Check for enemy ships (reduces value)
+        enemy_penalty = enemy_presence["total_strength"] * 0.1
         
-        # Look for discovered enemy colonies (from exploration/intelligence)
-        for location, star_system in game_state.galaxy.star_systems.items():
-            if player.player_id in star_system.explored_by:
-                # Check each enemy player for colonies at this location
-                for other_player in game_state.players:
-                    if other_player.player_id == player.player_id:
-                        continue
-                    
-                    enemy_colonies = other_player.get_colonies_at_location(location)
-                    if enemy_colonies:
-                        # Rule: Can only attack if no enemy ships present
-                        enemy_ship_group = other_player.get_ship_group_at_location(location)
-                        has_enemy_ships = enemy_ship_group and enemy_ship_group.get_total_ships() > 0
-                        
-                        if not has_enemy_ships:
-                            for colony in enemy_colonies:
-                                # Evaluate colony value and attack feasibility
-                                target_value = self._evaluate_colony_attack_value(colony, location, other_player, game_state)
-                                
-                                target_info = {
-                                    'enemy_player': other_player.name,
-                                    'colony': colony,
-                                    'location': location,
-                                    'value_score': target_value,
-                                    'population': colony.population,
-                                    'factories': colony.factories,
-                                    'missile_bases': colony.missile_bases,
-                                    'advanced_missile_bases': colony.advanced_missile_bases,
-                                    'has_planet_shield': colony.has_planet_shield,
-                                    'planet_type': colony.planet.planet_type.value,
-                                    'mineral_rich': colony.planet.is_mineral_rich,
-                                    'is_attackable': not colony.has_planet_shield,
-                                    'defense_strength': colony.missile_bases + (colony.advanced_missile_bases * 2)
-                                }
-                                
-                                if target_info['is_attackable'] and target_value > 0:
-                                    attack_targets.append((location, target_info))
+        score = total_vp - enemy_penalty
+        if not has_ships:
+            score *= 2.0  # Double value if we need to send ships
         
-        # Sort by value (best targets first)
-        attack_targets.sort(key=lambda x: x[1]['value_score'], reverse=True)
-        return attack_targets
-    
-    def evaluate_colony_defense_needs(self, player: Player, game_state: GameState) -> List[Tuple[str, Dict[str, Any]]]:
+        return score
+
+    def evaluate_colony_defense_needs(self, player: Player, game_state: GameState) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
         """Evaluate which of player's colonies need defensive reinforcement."""
+        self._refresh_turn_caches(game_state)
+        key = (game_state.current_turn, player.player_id, "colony_defense")
+        return self._cached(key, lambda: self._rank_colony_defense_needs(player, game_state))
+    
+    def _rank_colony_defense_needs(self, player: Player, game_state: GameState) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+        """Assess threats to each active colony, most threatened and valuable first."""
         defense_needs = []
         
         for colony in player.colonies:
@@ -372,7 +688,7 @@ class BaseStrategy(ABC):
         
         # Sort by threat level and colony value
         defense_needs.sort(key=lambda x: (x[1]['threat_level'], x[1]['colony_value']), reverse=True)
-        return defense_needs
+        return tuple(defense_needs)
 
     def _evaluate_colony_attack_value(self, colony, location: str, enemy_player: Player, game_state: GameState) -> float:
         """Calculate the strategic value of attacking an enemy colony."""
@@ -386,10 +702,7 @@ class BaseStrategy(ABC):
         base_value += colony.factories * 2.0  # Factory value
         
         # Planet type multiplier
-        if colony.planet.planet_type.value == "terran":
-            base_value *= 2.0
-        elif colony.planet.planet_type.value == "sub_terran":
-            base_value *= 1.5
+        base_value *= _COLONY_TYPE_MULT.get(colony.planet.planet_type, 1.0)
         
         # Mineral rich bonus
         if colony.planet.is_mineral_rich:
@@ -415,144 +728,138 @@ class BaseStrategy(ABC):
         """Assess the threat level to a specific colony."""
         threat_level = 0
         nearby_enemies = []
+        enemy_warships = self._get_enemy_warship_table(player, game_state)
         
         # Check for enemy ships in same system
-        for other_player in game_state.players:
-            if other_player.player_id == player.player_id:
-                continue
-            
-            enemy_ship_group = other_player.get_ship_group_at_location(location)
-            if enemy_ship_group and enemy_ship_group.get_total_ships() > 0:
-                warships = sum(ship.count for ship in enemy_ship_group.ships if ship.is_warship)
-                if warships > 0:
-                    threat_level = max(threat_level, 4)  # Direct threat
-                    nearby_enemies.append({
-                        'player': other_player.name,
-                        'location': location,
-                        'warships': warships,
-                        'distance': 0
-                    })
+        for enemy_name, warships in enemy_warships.get(location, ()):
+            threat_level = max(threat_level, 4)  # Direct threat
+            nearby_enemies.append({
+                'player': enemy_name,
+                'location': location,
+                'warships': warships,
+                'distance': 0
+            })
         
         # Check adjacent systems for enemy presence
         from ..utils.hex_utils import get_adjacent_hexes
         adjacent_hexes = get_adjacent_hexes(location)
         
         for adj_hex in adjacent_hexes:
-            for other_player in game_state.players:
-                if other_player.player_id == player.player_id:
-                    continue
-                
-                enemy_ship_group = other_player.get_ship_group_at_location(adj_hex)
-                if enemy_ship_group and enemy_ship_group.get_total_ships() > 0:
-                    warships = sum(ship.count for ship in enemy_ship_group.ships if ship.is_warship)
-                    if warships > 0:
-                        threat_level = max(threat_level, 2)  # Adjacent threat
-                        nearby_enemies.append({
-                            'player': other_player.name,
-                            'location': adj_hex,
-                            'warships': warships,
-                            'distance': 1
-                        })
+            for enemy_name, warships in enemy_warships.get(adj_hex, ()):
+                threat_level = max(threat_level, 2)  # Adjacent threat
+                nearby_enemies.append({
+                    'player': enemy_name,
+                    'location': adj_hex,
+                    'warships': warships,
+                    'distance': 1
+                })
         
         return {
             'threat_level': threat_level,
             'nearby_enemies': nearby_enemies
         }
 
+    def _get_enemy_warship_table(self, player: Player, game_state: GameState) -> Dict[str, List[Tuple[str, int]]]:
+        """Map each location to (enemy name, warship count) pairs, built once per turn."""
+        self._refresh_turn_caches(game_state)
+        table = self._enemy_warship_table.get(player.player_id)
+        if table is not None:
+            return table
+        
+        table = {}
+        for other_player in game_state.players:
+            if other_player.player_id == player.player_id:
+                continue
+            
+            seen_locations = set()  # Only the first group at a location counts, as before
+            for enemy_ship_group in other_player.ship_groups:
+                if enemy_ship_group.location in seen_locations:
+                    continue
+                seen_locations.add(enemy_ship_group.location)
+                
+                warships = sum(ship.count for ship in enemy_ship_group.ships if ship.is_warship)
+                if warships > 0:
+                    table.setdefault(enemy_ship_group.location, []).append((other_player.name, warships))
+        
+        self._enemy_warship_table[player.player_id] = table
+        return table
+    
     def _get_nearby_own_colonies(self, location: str, player: Player, game_state: GameState) -> List[str]:
         """Get list of player's colonies near a location."""
-        nearby_colonies = []
-        from ..utils.hex_utils import calculate_hex_distance
+        colony_locations = [colony.location for colony in player.colonies if colony.is_active]
+        if not colony_locations:
+            return []
         
-        for colony in player.colonies:
-            if colony.is_active:
-                distance = calculate_hex_distance(location, colony.location)
-                if distance <= 3:  # Within 3 hexes
-                    nearby_colonies.append(colony.location)
+        # One batched distance check against every active colony
+        q, r = self._axial(location, game_state)
+        coords = np.array([self._axial(loc, game_state) for loc in colony_locations], dtype=np.int64)
+        nearby = within_distance_mask(q, r, coords[:, 0], coords[:, 1], 3)  # Within 3 hexes
         
-        return nearby_colonies
+        return [loc for loc, is_near in zip(colony_locations, nearby) if is_near]
 
-    def split_oversized_scout_task_forces(self, player: Player, game_state: GameState) -> List[BaseAction]:
+    @_once_per_turn
+    def split_oversized_scout_task_forces(self, player: Player, game_state: GameState) -> Tuple[BaseAction, ...]:
         """Split task forces with >5 scouts into smaller exploration units."""
         actions = []
-        next_task_force_id = self._get_next_task_force_id(player)
-        
-        for ship_group in player.ship_groups[:]:  # Copy list to avoid modification issues
-            oversized_scout_groups = []
+        limit = SCOUT_TASK_FORCE_LIMIT
+        
+        # Find scout groups with more than 5 ships
+        index = self._get_ship_index(player, game_state)
+        oversized_rows = np.flatnonzero((index.type_ids == _SCOUT_ID) & (index.counts > limit))
+        if oversized_rows.size == 0:
+            return ()
+        
+        # Get potential exploration targets for new task forces
+        exploration_targets = self.evaluate_exploration_targets(player, game_state)
+        current_group = None
+        
+        for row in oversized_rows:
+            # Each ship group hands out targets from the best one down
+            if index.group_ids[row] != current_group:
+                current_group = index.group_ids[row]
+                target_index = 0
             
-            # Find scout groups with more than 5 ships
-            for ship in ship_group.ships:
-                if ship.ship_type.value == "scout" and ship.count > 5:
-                    oversized_scout_groups.append(ship)
+            total_scouts = int(index.counts[row])
+            location = index.locations[row]
             
-            if oversized_scout_groups:
-                # Get potential exploration targets for new task forces
-                exploration_targets = self.evaluate_exploration_targets(player, game_state)
-                target_index = 0
+            # Calculate how many new task forces we need
+            task_forces_needed = (total_scouts - 1) // limit  # Keep 5 or less in original
+            scouts_to_split = total_scouts - limit  # Keep 5 in original group
+            
+            if scouts_to_split > 0 and task_forces_needed > 0:
+                # Size each new task force (5 or the remainder) and pair it with a destination
+                sizes = [min(limit, scouts_to_split - limit * i) for i in range(task_forces_needed)]
+                sizes = [size for size in sizes if size > 0]
+                destinations = [
+                    exploration_targets[target_index + i][0]
+                    if target_index + i < len(exploration_targets) else location  # Default: stay put
+                    for i in range(len(sizes))
+                ]
+                target_index = min(target_index + len(sizes), len(exploration_targets))
                 
-                for scout_ship in oversized_scout_groups:
-                    total_scouts = scout_ship.count
-                    location = ship_group.location
-                    
-                    # Calculate how many new task forces we need
-                    task_forces_needed = (total_scouts - 1) // 5  # Keep 5 or less in original
-                    scouts_to_split = total_scouts - 5  # Keep 5 in original group
+                # Create movement orders to split scouts to new destinations
+                first_tf_id = self._get_next_task_force_id(player, len(sizes))
+                split_orders = [
+                    make_order(location, ShipType.SCOUT, size, destination, tf_id)
+                    for tf_id, (size, destination) in enumerate(zip(sizes, destinations), start=first_tf_id)
+                ]
+                
+                if split_orders:
+                    actions.append(MovementAction(player.player_id, split_orders))
                     
-                    if scouts_to_split > 0 and task_forces_needed > 0:
-                        split_orders = []
-                        scouts_split_so_far = 0
-                        
-                        for tf_num in range(task_forces_needed):
-                            # Determine size of new task force (5 or remaining)
-                            scouts_for_this_tf = min(5, scouts_to_split - scouts_split_so_far)
-                            
-                            if scouts_for_this_tf > 0:
-                                # Find destination for this new task force
-                                destination = location  # Default: stay at current location
-                                if target_index < len(exploration_targets):
-                                    destination = exploration_targets[target_index][0]
-                                    target_index += 1
-                                
-                                # Create movement order to split scouts to new destination
-                                split_orders.append(MovementOrder(
-                                    from_location=location,
-                                    ship_type=ShipType.SCOUT,
-                                    count=scouts_for_this_tf,
-                                    to_location=destination,
-                                    task_force_id=next_task_force_id
-                                ))
-                                
-                                scouts_split_so_far += scouts_for_this_tf
-                                next_task_force_id += 1
-                        
-                        if split_orders:
-                            actions.append(MovementAction(player.player_id, split_orders))
-                            
-                            self.log_decision("scout_task_force_split", {
-                                "original_location": location,
-                                "total_scouts": total_scouts,
-                                "new_task_forces": len(split_orders),
-                                "scouts_per_new_tf": [order.count for order in split_orders],
-                                "destinations": [order.to_location for order in split_orders]
-                            })
+                    self._log("scout_task_force_split", lambda: {
+                        "original_location": location,
+                        "total_scouts": total_scouts,
+                        "new_task_forces": len(split_orders),
+                        "scouts_per_new_tf": [order.ship_count for order in split_orders],
+                        "destinations": [order.destination for order in split_orders]
+                    })
         
-        return actions
+        return tuple(actions)
 
-    def _get_next_task_force_id(self, player: Player) -> int:
-        """Get the next available task force ID for a player."""
-        used_ids = set()
-        
-        for ship_group in player.ship_groups:
-            for ship in ship_group.ships:
-                if ship.task_force_id is not None:
-                    used_ids.add(ship.task_force_id)
-        
-        # Find first unused ID starting from 1
-        next_id = 1
-        while next_id in used_ids:
-            next_id += 1
-        
-        return next_id
+    def _get_next_task_force_id(self, player: Player, count: int = 1) -> int:
+        """Get the next available task force ID for a player, reserving count IDs."""
+        return player.reserve_task_force_ids(count)
 
     def log_decision(self, decision_type: str, decision_data: Dict[str, Any]):
         """Log a strategic decision for analysis."""
@@ -561,4 +868,9 @@ class BaseStrategy(ABC):
             "data": decision_data,
             "strategy": self.strategy_name
         }
-        self.decision_history.append(log_entry)
\ No newline at end of file
+        self.decision_history.append(log_entry)
+    
+    def _log(self, decision_type: str, make_payload: Callable[[], Dict[str, Any]]) -> None:
+        """Log a decision if record_decisions is set, building its payload only then."""
+        if self.record_decisions:
+            self.log_decision(decision_type, make_payload())
\ No newline at end of file
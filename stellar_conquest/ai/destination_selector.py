@@ -5,19 +5,139 @@ This module handles intelligent destination selection for taskforces that have b
 forced to retreat, fled from combat, or were pushed out due to having non-warship ships.
 """
 
-import random
+from random import Random
 from typing import List, Optional, Tuple, Dict, Any
+
+import numpy as np
+
 from ..core.enums import ShipType
+from ..core.constants import SHIP_TYPE_ORDER, SHIP_TYPE_INDEX
 from ..entities.player import Player
 from ..game.game_state import GameState
+from ..utils.hex_utils_numba import njit, prange
+
+
+# Positions in a ship count array (see SHIP_TYPE_ORDER) that decide how a redirected taskforce behaves
+_WARSHIP_IDX = np.array([SHIP_TYPE_INDEX[t] for t in (ShipType.CORVETTE, ShipType.FIGHTER, ShipType.DEATH_STAR)])
+_UNARMED_IDX = np.array([SHIP_TYPE_INDEX[t] for t in (ShipType.SCOUT, ShipType.COLONY_TRANSPORT)])
+
+# Log labels per ship count array position, resolved once at import
+_SHIP_TYPE_VALUE_CACHE = tuple(ship_type.value for ship_type in SHIP_TYPE_ORDER)
+
+
+@njit(parallel=True, cache=True)
+def _score_and_argmax(distance: np.ndarray, enemy: np.ndarray, unexplored: np.ndarray,
+                      friendly: np.ndarray, colonizable: np.ndarray, bonus: np.ndarray) -> Tuple[int, float]:
+    """Fused destination scoring over per-candidate factor arrays.
+    
+    Scores are computed in parallel; the argmax is reduced serially afterwards so
+    that ties go to the first candidate. Returns (best index, best score).
+    """
+    n = distance.shape[0]
+    score = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        # Distance factor: 3.0 very close (<=4), 2.0 close (<=6), 1.0 distant
+        value = 1.0 + (distance[i] <= 6) + (distance[i] <= 4)
+        
+        value -= 5.0 * enemy[i]        # Strong penalty for enemy presence
+        value += 2.0 * unexplored[i]   # Exploration opportunity
+        value += 1.5 * friendly[i]     # Safer with friendly forces nearby
+        value += 2.5 * colonizable[i]  # High value for colony opportunities
+        
+        score[i] = value + bonus[i]
+    
+    best_idx = 0
+    for i in range(1, n):
+        if score[i] > score[best_idx]:
+            best_idx = i
+    return best_idx, score[best_idx]
+
+
+def _command_hexes(galaxy, player: Player) -> Tuple[str, ...]:
+    """Command posts plus the entry hex, which also acts as a command post."""
+    entry_hex = galaxy.entry_hexes.get(player.player_id)
+    return tuple(player.command_posts) + ((entry_hex,) if entry_hex else ())
+
+
+def _has_colonization_potential(galaxy, location: str) -> bool:
+    """Check if location has planets that can be colonized."""
+    star_system = galaxy.star_systems.get(location)
+    if not star_system:
+        return False
+    
+    # Check for uncolonized habitable planets
+    for planet in star_system.planets:
+        if planet.is_habitable and not planet.colony:
+            return True
+    
+    return False
+
+
+def _defensive_position_bonus(galaxy, destination_indices: np.ndarray,
+                              colony_indices: np.ndarray) -> np.ndarray:
+    """Bonus scores for defensive positioning, one per destination board index."""
+    if not colony_indices.size:
+        return np.zeros(len(destination_indices), dtype=np.float64)  # No friendly territory
+    
+    # Positions closer to friendly territory get higher bonus
+    min_distance_to_friendly = galaxy.distance_table(destination_indices, colony_indices).min(axis=1)
+    
+    # 2.0 very close to friendly territory (<=2), 1.0 moderately close (<=4), else 0.0
+    return (min_distance_to_friendly <= 4).astype(np.float64) + (min_distance_to_friendly <= 2)
+
+
+def _protection_bonus(galaxy, player_id: int, destination: str) -> float:
+    """Bonus score for protective positioning."""
+    # Systems with defensive structures or friendly fleets get bonus
+    star_system = galaxy.star_systems.get(destination)
+    if not star_system:
+        return 0.0
+    
+    protection_bonus = 0.0
+    
+    # Check for defensive colonies
+    for planet in star_system.planets:
+        if planet.colony and planet.colony.player_id == player_id:
+            if planet.colony.missile_bases > 0:
+                protection_bonus += 1.5  # Missile base protection
+            if planet.colony.population > 5:  # 5M+ population
+                protection_bonus += 1.0  # Strong colony protection
+    
+    return protection_bonus
 
 
 class TaskforceDestinationSelector:
     """Handles intelligent destination selection for taskforces after combat events."""
     
+    __slots__ = (
+        "game_state", "_rng", "_enemy_occupied", "_fleet_location_masks", "_colony_hex_indices",
+        "_command_range_masks", "_redirect_turn", "_redirect_cache", "_mask_generation",
+    )
+    
     def __init__(self, game_state: GameState):
         self.game_state = game_state
-        
+        # Own random stream, seeded like the game so fallback picks are reproducible
+        self._rng = Random(game_state.random_seed)
+        # Player ID -> bool array over board hexes holding enemy ships
+        self._enemy_occupied: Dict[int, np.ndarray] = {}
+        # Player ID -> bool array over board hexes holding that player's own ships
+        self._fleet_location_masks: Dict[int, np.ndarray] = {}
+        # Player ID -> board indices of that player's colonies
+        self._colony_hex_indices: Dict[int, np.ndarray] = {}
+        # Game state generation the three tables above were built for
+        self._mask_generation: Optional[int] = None
+        # (player ID, command hexes, range) -> bool array over board hexes in command range
+        self._command_range_masks: Dict[Tuple[int, frozenset, int], np.ndarray] = {}
+        # Redirect decisions already made this turn, keyed by the selection inputs and state generation
+        self._redirect_turn: Optional[int] = None
+        self._redirect_cache: Dict[Tuple, Optional[str]] = {}
+        
+    def clear_turn_caches(self):
+        """Forget redirect decisions and command-range masks from earlier turns."""
+        self._redirect_turn = None
+        self._redirect_cache.clear()
+        self._command_range_masks.clear()
+    
     def select_new_destination_after_combat(
         self, 
         player: Player, 
@@ -43,6 +163,42 @@ class TaskforceDestinationSelector:
         Returns:
             New destination hex or None if no suitable destination found
         """
+        # Taskforces retreating from the same hex this turn get the same answer
+        # until ships or colonies change
+        if self._redirect_turn != self.game_state.current_turn:
+            self._redirect_turn = self.game_state.current_turn
+            self._redirect_cache.clear()
+        
+        key = (player.player_id, current_location, original_destination,
+               combat_result, has_warships, has_unarmed_ships, self.game_state.generation)
+        if key in self._redirect_cache:
+            return self._redirect_cache[key]
+        
+        destination = self._select_destination(
+            player, current_location, original_destination, combat_result, has_warships, has_unarmed_ships
+        )
+        self._redirect_cache[key] = destination
+        return destination
+    
+    def _select_destination(
+        self,
+        player: Player,
+        current_location: str,
+        original_destination: str,
+        combat_result: str,
+        has_warships: bool,
+        has_unarmed_ships: bool
+    ) -> Optional[str]:
+        """Run the candidate scan and scoring for one redirect."""
+        # Fleets and colonies may have changed since the last selection
+        generation = self.game_state.generation
+        if self._mask_generation != generation:
+            self._mask_generation = generation
+            self._enemy_occupied.clear()
+            self._fleet_location_masks.clear()
+            self._colony_hex_indices.clear()
+            self.game_state.galaxy.refresh_derived_masks()
+        
         # Get potential destinations based on taskforce composition
         candidate_destinations = self._get_candidate_destinations(
             player, current_location, original_destination, has_warships, has_unarmed_ships
@@ -51,14 +207,13 @@ class TaskforceDestinationSelector:
         if not candidate_destinations:
             return self._select_safe_fallback_destination(player, current_location)
             
-        # Evaluate and rank destinations
-        evaluated_destinations = self._evaluate_destinations(
+        # Select best destination (highest score)
+        best_destination = self._select_best_destination(
             player, candidate_destinations, current_location, combat_result
         )
         
-        if evaluated_destinations:
-            # Select best destination (highest score)
-            return evaluated_destinations[0][0]  # (destination, score) tuple
+        if best_destination:
+            return best_destination
         
         return self._select_safe_fallback_destination(player, current_location)
     
@@ -74,23 +229,24 @@ class TaskforceDestinationSelector:
         candidates = []
         
         # Avoid the original destination to prevent constant attempts to return
-        forbidden_locations = {original_destination, current_location}
+        forbidden_locations = frozenset((original_destination, current_location))
         
         # Get accessible star systems within communication range
-        star_systems = self.game_state.galaxy.star_systems
+        galaxy = self.game_state.galaxy
+        system_locations = galaxy.system_locations
         max_range = 8  # Command post range
+        in_range = self._get_command_range_mask(player, max_range)[galaxy.system_hex_indices]
+        is_safe = self._is_location_safe_for_unarmed
+        unarmed_only = not has_warships and has_unarmed_ships
         
-        for star_hex, star_system in star_systems.items():
+        for idx in np.flatnonzero(in_range):
+            star_hex = system_locations[idx]
             if star_hex in forbidden_locations:
                 continue
                 
-            # Check if within command post range
-            if not self._is_within_command_range(player, star_hex, max_range):
-                continue
-                
             # For taskforces with only unarmed ships, prioritize safe locations
-            if not has_warships and has_unarmed_ships:
-                if self._is_location_safe_for_unarmed(player, star_hex):
+            if unarmed_only:
+                if is_safe(player, star_hex):
                     candidates.append(star_hex)
             else:
                 # Warships can consider more aggressive destinations
@@ -98,184 +254,130 @@ class TaskforceDestinationSelector:
         
         return candidates
     
-    def _evaluate_destinations(
+    def _select_best_destination(
         self, 
         player: Player, 
         candidates: List[str], 
         current_location: str,
         combat_result: str
-    ) -> List[Tuple[str, float]]:
-        """Evaluate and rank potential destinations by strategic value."""
-        evaluated = []
-        
-        for destination in candidates:
-            score = self._calculate_destination_score(
-                player, destination, current_location, combat_result
-            )
-            evaluated.append((destination, score))
-        
-        # Sort by score (descending - highest score first)
-        evaluated.sort(key=lambda x: x[1], reverse=True)
-        return evaluated
-    
-    def _calculate_destination_score(
-        self, 
-        player: Player, 
-        destination: str, 
-        current_location: str,
-        combat_result: str
-    ) -> float:
-        """Calculate strategic value score for a destination."""
-        score = 0.0
-        
-        # Distance factor - prefer closer destinations for quick repositioning
-        distance = self.game_state.galaxy.calculate_distance(current_location, destination)
-        if distance <= 4:
-            score += 3.0  # Very close
-        elif distance <= 6:
-            score += 2.0  # Close
-        else:
-            score += 1.0  # Distant
+    ) -> Optional[str]:
+        """Pick the potential destination with the highest strategic value.
         
-        # Safety factor - avoid enemy-occupied systems
-        if self._has_enemy_presence(player, destination):
-            score -= 5.0  # Strong penalty for enemy presence
+        Each scoring factor is gathered into one array over all candidates and
+        the scores are combined and reduced to the best one by _score_and_argmax.
+        """
+        if not candidates:
+            return None
         
-        # Strategic value - unexplored systems have potential
-        star_system = self.game_state.galaxy.star_systems.get(destination)
-        if star_system and not star_system.is_explored:
-            score += 2.0  # Exploration opportunity
+        galaxy = self.game_state.galaxy
+        count = len(candidates)
         
-        # Friendly presence bonus
-        if self._has_friendly_presence(player, destination):
-            score += 1.5  # Safer with friendly forces nearby
+        indices = galaxy.hex_indices(candidates)
+        distance = galaxy.distances_from(current_location)[indices]
         
-        # Colonization opportunity
-        if self._has_colonization_potential(player, destination):
-            score += 2.5  # High value for colony opportunities
+        # Safety, exploration, friendly presence and colonization factors
+        enemy = self._get_enemy_occupied(player)[indices]
+        unexplored = galaxy.unexplored_hex_mask[indices]
+        friendly = self._get_fleet_location_mask(player)[indices]
+        colonizable = galaxy.colonizable_hex_mask[indices]
         
         # Adjust based on combat result
         if 'retreat' in combat_result:
             # After retreat, prefer safer, more defensive positions
-            score += self._get_defensive_position_bonus(player, destination)
+            bonus = _defensive_position_bonus(galaxy, indices, self._get_colony_hex_indices(player))
         elif 'barrage' in combat_result:
             # After taking losses to barrage, prefer positions with better protection
-            score += self._get_protection_bonus(player, destination)
+            bonus = np.fromiter((_protection_bonus(galaxy, player.player_id, d) for d in candidates),
+                                dtype=np.float64, count=count)
+        else:
+            bonus = np.zeros(count, dtype=np.float64)
         
-        return score
+        # Highest score wins; ties keep the first candidate
+        best_idx, _ = _score_and_argmax(distance, enemy, unexplored, friendly, colonizable, bonus)
+        return candidates[best_idx]
+    
+    def _get_command_range_mask(self, player: Player, max_range: int) -> np.ndarray:
+        """Bool array over board hexes within max_range of a command post or the entry hex.
+        
+        Keyed on the current command hexes, so a new or lost command post gets a fresh mask.
+        """
+        command_hexes = _command_hexes(self.game_state.galaxy, player)
+        key = (player.player_id, frozenset(command_hexes), max_range)
+        mask = self._command_range_masks.get(key)
+        if mask is None:
+            mask = self.game_state.galaxy.within_range_mask(command_hexes, max_range)
+            self._command_range_masks[key] = mask
+        return mask
     
     def _is_within_command_range(self, player: Player, destination: str, max_range: int) -> bool:
         """Check if destination is within command post range."""
-        # Check distance to all command posts
-        for command_post_hex in player.command_posts:
-            distance = self.game_state.galaxy.calculate_distance(destination, command_post_hex)
-            if distance <= max_range:
-                return True
-        
-        # Check distance to entry hex (acts as command post)
-        entry_hex = self.game_state.galaxy.entry_hexes.get(player.player_id)
-        if entry_hex:
-            distance = self.game_state.galaxy.calculate_distance(destination, entry_hex)
-            if distance <= max_range:
-                return True
-        
-        return False
+        idx = self.game_state.galaxy.hex_index(destination)
+        return idx is not None and bool(self._get_command_range_mask(player, max_range)[idx])
     
     def _is_location_safe_for_unarmed(self, player: Player, location: str) -> bool:
         """Check if location is safe for unarmed ships (scouts/transports)."""
         # Location is unsafe if enemies are present
         return not self._has_enemy_presence(player, location)
     
+    def _get_enemy_occupied(self, player: Player) -> np.ndarray:
+        """Bool array over board hexes marking where any other player has ships."""
+        mask = self._enemy_occupied.get(player.player_id)
+        if mask is None:
+            mask = self.game_state.galaxy.hex_mask(
+                fleet.location
+                for other_player in self.game_state.players.values()
+                if other_player.player_id != player.player_id
+                for fleet in other_player.fleets
+                if fleet.total_ships > 0
+            )
+            self._enemy_occupied[player.player_id] = mask
+        return mask
+    
     def _has_enemy_presence(self, player: Player, location: str) -> bool:
         """Check if location has enemy ships."""
-        for other_player in self.game_state.players.values():
-            if other_player.player_id == player.player_id:
-                continue
-            
-            fleet = other_player.get_fleet_at_location(location)
-            if fleet and fleet.total_ships > 0:
-                return True
-        
-        return False
+        idx = self.game_state.galaxy.hex_index(location)
+        return idx is not None and bool(self._get_enemy_occupied(player)[idx])
+    
+    def _get_fleet_location_mask(self, player: Player) -> np.ndarray:
+        """Bool array over board hexes marking where the player has ships."""
+        mask = self._fleet_location_masks.get(player.player_id)
+        if mask is None:
+            mask = self.game_state.galaxy.hex_mask(
+                fleet.location for fleet in player.fleets if fleet.total_ships > 0
+            )
+            self._fleet_location_masks[player.player_id] = mask
+        return mask
     
     def _has_friendly_presence(self, player: Player, location: str) -> bool:
         """Check if location has friendly ships."""
-        fleet = player.get_fleet_at_location(location)
-        return fleet is not None and fleet.total_ships > 0
-    
-    def _has_colonization_potential(self, player: Player, location: str) -> bool:
-        """Check if location has planets that can be colonized."""
-        star_system = self.game_state.galaxy.star_systems.get(location)
-        if not star_system:
-            return False
-        
-        # Check for uncolonized habitable planets
-        for planet in star_system.planets:
-            if planet.is_habitable and not planet.colony:
-                return True
-        
-        return False
-    
-    def _get_defensive_position_bonus(self, player: Player, destination: str) -> float:
-        """Get bonus score for defensive positioning."""
-        # Positions closer to friendly territory get higher bonus
-        min_distance_to_friendly = float('inf')
-        
-        for colony in player.colonies:
-            distance = self.game_state.galaxy.calculate_distance(destination, colony.location)
-            min_distance_to_friendly = min(min_distance_to_friendly, distance)
-        
-        if min_distance_to_friendly <= 2:
-            return 2.0  # Very close to friendly territory
-        elif min_distance_to_friendly <= 4:
-            return 1.0  # Moderately close
-        else:
-            return 0.0  # Far from friendly territory
+        idx = self.game_state.galaxy.hex_index(location)
+        return idx is not None and bool(self._get_fleet_location_mask(player)[idx])
     
-    def _get_protection_bonus(self, player: Player, destination: str) -> float:
-        """Get bonus score for protective positioning."""
-        # Systems with defensive structures or friendly fleets get bonus
-        star_system = self.game_state.galaxy.star_systems.get(destination)
-        if not star_system:
-            return 0.0
-        
-        protection_bonus = 0.0
-        
-        # Check for defensive colonies
-        for planet in star_system.planets:
-            if planet.colony and planet.colony.player_id == player.player_id:
-                if planet.colony.missile_bases > 0:
-                    protection_bonus += 1.5  # Missile base protection
-                if planet.colony.population > 5:  # 5M+ population
-                    protection_bonus += 1.0  # Strong colony protection
-        
-        return protection_bonus
+    def _get_colony_hex_indices(self, player: Player) -> np.ndarray:
+        """Board indices of the player's colonies, in colony order."""
+        indices = self._colony_hex_indices.get(player.player_id)
+        if indices is None:
+            indices = self.game_state.galaxy.hex_indices([colony.location for colony in player.colonies])
+            self._colony_hex_indices[player.player_id] = indices
+        return indices
     
     def _select_safe_fallback_destination(self, player: Player, current_location: str) -> Optional[str]:
         """Select a safe fallback destination when no good options exist."""
-        # Get adjacent hexes as last resort
-        adjacent_hexes = self.game_state.galaxy.get_adjacent_hexes(current_location)
-        
-        # Filter out enemy-occupied adjacent hexes
-        safe_adjacent = []
-        for hex_coord in adjacent_hexes:
-            if not self._has_enemy_presence(player, hex_coord):
-                safe_adjacent.append(hex_coord)
+        # Get adjacent hexes as last resort, filtering out enemy-occupied ones
+        galaxy = self.game_state.galaxy
+        adjacent = galaxy.adjacent_indices(current_location)
+        safe_adjacent = adjacent[~self._get_enemy_occupied(player)[adjacent]]
         
-        if safe_adjacent:
-            return random.choice(safe_adjacent)
+        if safe_adjacent.size:
+            return galaxy.hex_name(safe_adjacent[self._rng.randrange(safe_adjacent.size)])
         
         # If no safe adjacent hexes, find the closest friendly colony
-        closest_colony = None
-        min_distance = float('inf')
-        
-        for colony in player.colonies:
-            distance = self.game_state.galaxy.calculate_distance(current_location, colony.location)
-            if distance < min_distance:
-                min_distance = distance
-                closest_colony = colony.location
+        colony_indices = self._get_colony_hex_indices(player)
+        if not colony_indices.size:
+            return None
         
-        return closest_colony
+        distances = self.game_state.galaxy.distances_from(current_location)[colony_indices]
+        return player.colonies[int(np.argmin(distances))].location
 
 
 def handle_taskforce_combat_redirect(
@@ -285,26 +387,21 @@ def handle_taskforce_combat_redirect(
     current_location: str,
     original_destination: str,
     combat_result: str,
-    ship_types_present: Dict[ShipType, int]
+    ship_counts: np.ndarray
 ) -> Optional[str]:
     """
     Handle redirection of taskforce after combat event.
     
     This function should be called when a taskforce flees or is pushed out of combat
-    to automatically select a new strategic destination.
+    to automatically select a new strategic destination. ship_counts holds the
+    taskforce's ship count per type, indexed by SHIP_TYPE_INDEX.
     """
     # Analyze taskforce composition
-    has_warships = any(
-        ship_type in [ShipType.CORVETTE, ShipType.FIGHTER, ShipType.DEATH_STAR] 
-        for ship_type in ship_types_present.keys()
-    )
-    has_unarmed_ships = any(
-        ship_type in [ShipType.SCOUT, ShipType.COLONY_TRANSPORT] 
-        for ship_type in ship_types_present.keys()
-    )
+    has_warships = bool(ship_counts[_WARSHIP_IDX].any())
+    has_unarmed_ships = bool(ship_counts[_UNARMED_IDX].any())
     
-    # Get destination selector
-    selector = TaskforceDestinationSelector(game_state)
+    # Get the game's shared destination selector
+    selector = game_state.taskforce_destination_selector
     
     # Select new destination
     new_destination = selector.select_new_destination_after_combat(
@@ -312,7 +409,7 @@ def handle_taskforce_combat_redirect(
         combat_result, has_warships, has_unarmed_ships
     )
     
-    if new_destination:
+    if new_destination and game_state.is_logging("taskforce_redirected"):
         # Log the redirection decision
         game_state.log_action("taskforce_redirected", {
             "player_id": player.player_id,
@@ -321,7 +418,8 @@ def handle_taskforce_combat_redirect(
             "original_destination": original_destination,
             "new_destination": new_destination,
             "combat_result": combat_result,
-            "ship_composition": {st.value: count for st, count in ship_types_present.items()}
+            "ship_composition": {_SHIP_TYPE_VALUE_CACHE[i]: int(count)
+                                 for i, count in enumerate(ship_counts) if count}
         })
     
     return new_destination
\ No newline at end of file
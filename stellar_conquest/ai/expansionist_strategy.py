@@ -1,22 +1,116 @@
 """Expansionist AI strategy focused on rapid colonization and growth."""
 
-from typing import List, Dict, Any
+import heapq
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
-from .base_strategy import BaseStrategy, StrategyWeights, GamePhase, Priority
+import numpy as np
+
+from .base_strategy import BaseStrategy, StrategyWeights, GamePhase, Priority, AttackTargetInfo
 from ..game.game_state import GameState
 from ..entities.player import Player, Technology
 from ..entities.ship import ShipType
 from ..actions.base_action import BaseAction
-from ..actions.movement_action import MovementAction, MovementOrder
+from ..actions.movement_action import MovementAction, MovementOrder, make_order
 from ..actions.exploration_action import ExplorationAction
 from ..actions.colonization_action import ColonizationAction
+from ..core.constants import ALL_HEXES, HEX_TO_INDEX, SHIP_TYPE_INDEX
+from ..utils.hex_utils import calculate_hex_distance
+from ..utils.hex_utils_numba import njit
+
+
+# Ship types used throughout the planners, bound once at import
+_SCOUT = ShipType.SCOUT
+_COLONY_TX = ShipType.COLONY_TRANSPORT
+_CORVETTE = ShipType.CORVETTE
+_FIGHTER = ShipType.FIGHTER
+
+# Row type ids in the strategy's ship index
+_SCOUT_ID = SHIP_TYPE_INDEX[_SCOUT]
+_COLONY_TX_ID = SHIP_TYPE_INDEX[_COLONY_TX]
+
+# Ships sent per warship group, indexed by target defense strength (clamped to the last entry)
+_ATTACK_FORCE_BY_DEFENSE = (1, 1, 1, 2, 2, 2, 3)
+
+# Warships needed to reinforce a colony, indexed by threat level (clamped to the last entry)
+_DEFENSE_FORCE_BY_THREAT = (1, 1, 1, 2, 3)
+
+
+@dataclass(frozen=True, slots=True)
+class ExpansionistParams:
+    """Tuning constants for ExpansionistStrategy; costs and budgets are in IP."""
+    # How many ranked targets each planner acts on per turn
+    top_explore_early: int = 3
+    top_explore_mid: int = 2
+    top_explore_late: int = 1
+    top_colonization_targets: int = 3
+    top_vulnerable_colonies: int = 2
+    top_defense_needs: int = 3
+    top_vp_targets: int = 10
+    attacks_per_turn: int = 2  # Avoid overextension
+    
+    # Production
+    scout_budget: int = 6  # 2 scouts at 3 IP each
+    speed_research_cost: int = 15
+    corvette_cost: int = 8
+    fighter_cost: int = 20
+    missile_base_cost: int = 4
+    mid_factory_cap: int = 20
+    mid_transport_cap: int = 10
+    late_factory_budget: int = 12
+    late_factory_budget_threatened: int = 8
+    threat_military_bonus: int = 10  # Extra military IP per highly threatened colony
+    min_transports: int = 5
+    population_per_transport: int = 10  # Want enough transports to move about 10% of population
+    
+    # Fleet handling
+    high_threat_level: int = 3
+    min_attack_odds: float = 2.0
+    max_transports_per_order: int = 5
+    max_scouts_per_task_force: int = 5
+    redeployed_scouts_per_group: int = 2
+    critical_colony_value: float = 10.0
+
+
+_PARAMS = ExpansionistParams()
+
+
+@njit(cache=True)
+def _distribute_scouts(scout_counts: np.ndarray, n_targets: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split each scout row evenly over the top exploration targets.
+    
+    Every row starts again from the best target and uses at most one target
+    per scout. Returns parallel (row, target rank, scout count) arrays.
+    """
+    n_orders = 0
+    for i in range(scout_counts.shape[0]):
+        n_orders += min(n_targets, scout_counts[i])
+    
+    rows = np.empty(n_orders, dtype=np.int32)
+    targets = np.empty(n_orders, dtype=np.int32)
+    counts = np.empty(n_orders, dtype=np.int32)
+    k = 0
+    for i in range(scout_counts.shape[0]):
+        scouts_available = scout_counts[i]
+        available_targets = min(n_targets, scouts_available)
+        scouts_per_target = max(1, scouts_available // max(1, available_targets))
+        for target in range(available_targets):
+            if scouts_available <= 0:
+                break
+            scouts_to_send = min(scouts_per_target, scouts_available)
+            rows[k] = i
+            targets[k] = target
+            counts[k] = scouts_to_send
+            scouts_available -= scouts_to_send
+            k += 1
+    return rows[:k], targets[:k], counts[:k]
 
 
 class ExpansionistStrategy(BaseStrategy):
     """AI strategy focused on rapid expansion and colonization."""
     
-    def __init__(self):
+    def __init__(self, params: ExpansionistParams = _PARAMS):
+        self.params = params
         weights = StrategyWeights(
             exploration=1.5,    # High exploration to find colonies
             colonization=2.0,   # Highest priority on colonization
@@ -25,21 +119,26 @@ class ExpansionistStrategy(BaseStrategy):
             economy=1.3         # Strong economic focus
         )
         super().__init__("Expansionist", weights)
+        
+        # Production spending per game phase
+        self._phase_spenders = {
+            GamePhase.EARLY_EXPLORATION: self._spend_early,
+            GamePhase.MID_EXPANSION: self._spend_mid,
+            GamePhase.LATE_MILITARY: self._spend_late
+        }
     
     def decide_turn_actions(self, player: Player, game_state: GameState) -> List[BaseAction]:
         """Decide actions prioritizing exploration and colonization."""
-        actions = []
+        self._refresh_turn_caches(game_state)
         game_phase = self.get_game_phase(game_state)
         
         # Phase-specific action priorities
         if game_phase == GamePhase.EARLY_EXPLORATION:
-            actions.extend(self._early_exploration_actions(player, game_state))
+            return self._early_exploration_actions(player, game_state)
         elif game_phase == GamePhase.MID_EXPANSION:
-            actions.extend(self._mid_expansion_actions(player, game_state))
+            return self._mid_expansion_actions(player, game_state)
         else:  # LATE_MILITARY
-            actions.extend(self._late_military_actions(player, game_state))
-        
-        return actions
+            return self._late_military_actions(player, game_state)
     
     def _early_exploration_actions(self, player: Player, game_state: GameState) -> List[BaseAction]:
         """Actions for early game: aggressive exploration and initial colonization."""
@@ -56,10 +155,11 @@ class ExpansionistStrategy(BaseStrategy):
         
         # 3. Move colony transports toward promising systems
         colonization_moves = self._plan_colonization_movements(player, game_state)
-        actions.extend(colonization_moves)
+        if colonization_moves is not None:
+            actions.extend(colonization_moves)
         
         # 4. Explore reachable star systems
-        exploration_targets = self.evaluate_exploration_targets(player, game_state)[:3]  # Top 3
+        exploration_targets = self.evaluate_exploration_targets(player, game_state, k=self.params.top_explore_early)
         if exploration_targets:
             targets = [target[0] for target in exploration_targets]
             actions.append(ExplorationAction(player.player_id, targets))
@@ -80,7 +180,7 @@ class ExpansionistStrategy(BaseStrategy):
         actions.extend(scout_splitting_actions)
         
         # 2. Continue exploration but more selective
-        exploration_targets = self.evaluate_exploration_targets(player, game_state)[:2]
+        exploration_targets = self.evaluate_exploration_targets(player, game_state, k=self.params.top_explore_mid)
         if exploration_targets:
             targets = [target[0] for target in exploration_targets]
             actions.append(ExplorationAction(player.player_id, targets))
@@ -92,7 +192,8 @@ class ExpansionistStrategy(BaseStrategy):
         
         # 4. Start building some military for defense
         defensive_moves = self._plan_defensive_positioning(player, game_state)
-        actions.extend(defensive_moves)
+        if defensive_moves is not None:
+            actions.extend(defensive_moves)
         
         return actions
     
@@ -106,18 +207,21 @@ class ExpansionistStrategy(BaseStrategy):
         
         # Priority 2: Defend valuable colonies under threat
         defensive_actions = self._plan_enhanced_colony_defense(player, game_state)
-        actions.extend(defensive_actions)
+        if defensive_actions is not None:
+            actions.extend(defensive_actions)
         
         # Priority 3: Review security log and plan colony attacks
         colony_attack_actions = self._plan_colony_attacks(player, game_state)
-        actions.extend(colony_attack_actions)
+        if colony_attack_actions is not None:
+            actions.extend(colony_attack_actions)
         
         # Priority 4: Position scouts for victory point control (Rule C)
         victory_point_actions = self._plan_victory_point_control(player, game_state)
-        actions.extend(victory_point_actions)
+        if victory_point_actions is not None:
+            actions.extend(victory_point_actions)
         
         # Priority 5: Continue limited exploration for strategic advantage
-        exploration_targets = self.evaluate_exploration_targets(player, game_state)[:1]
+        exploration_targets = self.evaluate_exploration_targets(player, game_state, k=self.params.top_explore_late)
         if exploration_targets:
             targets = [target[0] for target in exploration_targets]
             actions.append(ExplorationAction(player.player_id, targets))
@@ -129,67 +233,58 @@ class ExpansionistStrategy(BaseStrategy):
         scout_orders = []
         
         # Find scouts and send them to different unexplored systems
-        for ship_group in player.ship_groups:
-            scouts = [ship for ship in ship_group.ships if ship.ship_type.value == "scout" and ship.count > 0]
-            if scouts:
-                # Find best unexplored target for scout distribution
-                exploration_targets = self.evaluate_exploration_targets(player, game_state)
-                
-                for scout_ship in scouts:
-                    scouts_available = scout_ship.count
-                    location = ship_group.location
-                    
-                    # Only use existing scouts for exploration (splitting handled separately)
-                    # Send small groups to maximize exploration coverage
-                    if scouts_available > 0 and exploration_targets:
-                        # Determine how many to send based on available targets
-                        available_targets = min(len(exploration_targets), scouts_available)
-                        scouts_per_target = max(1, scouts_available // max(1, available_targets))
-                        
-                        targets_used = 0
-                        for target_location, _ in exploration_targets:
-                            if targets_used >= available_targets or scouts_available <= 0:
-                                break
-                                
-                            scouts_to_send = min(scouts_per_target, scouts_available)
-                            if scouts_to_send > 0:
-                                scout_orders.append(MovementOrder(
-                                    location, ShipType.SCOUT, scouts_to_send, target_location
-                                ))
-                                scouts_available -= scouts_to_send
-                                targets_used += 1
+        index = self._get_ship_index(player, game_state)
+        scout_rows = np.flatnonzero((index.type_ids == _SCOUT_ID) & (index.counts > 0))
+        if scout_rows.size:
+            # Find best unexplored target for scout distribution
+            exploration_targets = self.evaluate_exploration_targets(player, game_state)
+            
+            # Only use existing scouts for exploration (splitting handled separately);
+            # small groups go to different targets to maximize coverage
+            rows, targets, counts = _distribute_scouts(index.counts[scout_rows], len(exploration_targets))
+            scout_orders = [
+                make_order(index.locations[scout_rows[row]], _SCOUT, int(count), exploration_targets[target][0])
+                for row, target, count in zip(rows, targets, counts)
+            ]
         
         return MovementAction(player.player_id, scout_orders) if scout_orders else None
     
-    def _plan_colonization_movements(self, player: Player, game_state: GameState) -> List[BaseAction]:
+    def _plan_colonization_movements(self, player: Player, game_state: GameState) -> Optional[List[BaseAction]]:
         """Move colony transports toward promising colonization targets."""
         actions = []
         
         # Identify best colonization targets
-        colonization_targets = self.evaluate_colonization_targets(player, game_state)[:3]
+        colonization_targets = self.evaluate_colonization_targets(player, game_state, k=self.params.top_colonization_targets)
         
         if not colonization_targets:
-            return actions
-        
-        # Move colony transports toward these targets
-        transport_orders = []
+            return None
         
-        for fleet in player.fleets:
-            transports = fleet.get_ships_by_type(ShipType.COLONY_TRANSPORT)
-            if transports and colonization_targets:
-                # Move transports toward best target
-                target_location = colonization_targets[0][0]
-                transport_count = sum(t.count for t in transports)
-                
-                transport_orders.append(MovementOrder(
-                    fleet.location, ShipType.COLONY_TRANSPORT, 
-                    min(5, transport_count), target_location
-                ))
+        # Move colony transports toward the best target
+        target_location = colonization_targets[0][0]
+        transport_orders = [
+            make_order(location, _COLONY_TX, min(self.params.max_transports_per_order, transport_count), target_location)
+            for location, transport_count in self._get_transport_locations(player, game_state)
+        ]
         
         if transport_orders:
             actions.append(MovementAction(player.player_id, transport_orders))
         
-        return actions
+        return actions or None
+    
+    def _get_transport_locations(self, player: Player, game_state: GameState) -> Tuple[Tuple[str, int], ...]:
+        """(location, transport count) for each location holding colony transports, built once per turn."""
+        self._refresh_turn_caches(game_state)
+        key = (game_state.current_turn, player.player_id, "transport_locations")
+        return self._cached(key, lambda: self._collect_transport_locations(player, game_state))
+    
+    def _collect_transport_locations(self, player: Player, game_state: GameState) -> Tuple[Tuple[str, int], ...]:
+        """Total the colony transport rows of the ship index by location, in ship group order."""
+        index = self._get_ship_index(player, game_state)
+        totals = {}
+        for row in np.flatnonzero(index.type_ids == _COLONY_TX_ID):
+            location = index.locations[row]
+            totals[location] = totals.get(location, 0) + int(index.counts[row])
+        return tuple(totals.items())
     
     def _plan_colonization(self, player: Player, game_state: GameState) -> ColonizationAction:
         """Plan colonization of available planets."""
@@ -197,7 +292,7 @@ class ExpansionistStrategy(BaseStrategy):
         # For now, return None as placeholder
         return None
     
-    def _plan_defensive_positioning(self, player: Player, game_state: GameState) -> List[BaseAction]:
+    def _plan_defensive_positioning(self, player: Player, game_state: GameState) -> Optional[List[BaseAction]]:
         """Position military ships to defend key colonies."""
         actions = []
         
@@ -205,38 +300,36 @@ class ExpansionistStrategy(BaseStrategy):
         vulnerable_colonies = self._identify_vulnerable_colonies(player, game_state)
         
         # Move available warships to defend them
-        for colony_location in vulnerable_colonies[:2]:  # Top 2 most vulnerable
+        for colony_location in vulnerable_colonies[:self.params.top_vulnerable_colonies]:
             defensive_orders = self._create_defensive_orders(colony_location, player, game_state)
             if defensive_orders:
                 actions.append(MovementAction(player.player_id, defensive_orders))
         
-        return actions
+        return actions or None
     
-    def _plan_colony_defense(self, player: Player, game_state: GameState) -> List[BaseAction]:
+    def _plan_colony_defense(self, player: Player, game_state: GameState) -> Optional[List[BaseAction]]:
         """Plan comprehensive colony defense for late game."""
         # Similar to defensive positioning but more comprehensive
-        return []
+        return None
     
-    def _plan_opportunistic_attacks(self, player: Player, game_state: GameState) -> List[BaseAction]:
+    def _plan_opportunistic_attacks(self, player: Player, game_state: GameState) -> Optional[List[BaseAction]]:
         """Look for weak enemy positions to attack."""
         actions = []
         
         # Find enemy colonies that are weakly defended
-        military_targets = self.evaluate_military_targets(player, game_state)
+        military_targets = self.evaluate_military_targets(player, game_state, k=1)
         
-        for target_location, score in military_targets[:1]:  # Only take best opportunity
-            if score > 2.0:  # Only if favorable odds
+        for target_location, score in military_targets:  # Only take best opportunity
+            if score > self.params.min_attack_odds:  # Only if favorable odds
                 attack_orders = self._create_attack_orders(target_location, player, game_state)
                 if attack_orders:
                     actions.append(MovementAction(player.player_id, attack_orders))
         
-        return actions
+        return actions or None
     
     def decide_production_spending(self, player: Player, game_state: GameState, 
                                  available_ip: int) -> Dict[str, int]:
         """Decide production spending with expansionist priorities."""
-        spending = {}
-        remaining_ip = available_ip
         game_phase = self.get_game_phase(game_state)
         
         # Expansionist priorities:
@@ -245,85 +338,14 @@ class ExpansionistStrategy(BaseStrategy):
         # 3. Factories for economic growth
         # 4. Speed research for faster expansion
         # 5. Military only when necessary
-        
-        if game_phase == GamePhase.EARLY_EXPLORATION:
-            # Early game: maximize exploration and colonization capability
-            
-            # Colony transports (high priority)
-            transport_need = self._calculate_transport_need(player, game_state)
-            transport_cost = min(transport_need, remaining_ip)
-            spending["colony_transports"] = transport_cost
-            remaining_ip -= transport_cost
-            
-            # Scouts for exploration
-            scout_cost = min(6, remaining_ip)  # 2 scouts at 3 IP each
-            spending["scouts"] = scout_cost
-            remaining_ip -= scout_cost
-            
-            # Speed research for faster expansion
-            if remaining_ip >= 15 and Technology.SPEED_3_HEX not in player.completed_technologies:
-                spending["research_speed_3"] = 15
-                remaining_ip -= 15
-            
-        elif game_phase == GamePhase.MID_EXPANSION:
-            # Mid game: balance expansion with economic development
-            
-            # Factories for economic growth
-            factory_investment = min(remaining_ip // 2, 20)
-            spending["factories"] = factory_investment  
-            remaining_ip -= factory_investment
-            
-            # More colony transports
-            transport_cost = min(remaining_ip // 3, 10)
-            spending["colony_transports"] = transport_cost
-            remaining_ip -= transport_cost
-            
-            # Some military for defense
-            if remaining_ip >= 8:
-                spending["corvettes"] = 8  # 1 corvette
-                remaining_ip -= 8
-            
-        else:  # LATE_MILITARY
-            # Late game: prepare for final military push while maintaining economy
-            
-            # Assess colony defense needs for production prioritization
-            defense_needs = self.evaluate_colony_defense_needs(player, game_state)
-            high_threat_colonies = len([d for d in defense_needs if d[1]['threat_level'] >= 3])
-            
-            # Adjust military budget based on threat level
-            base_military_budget = remaining_ip // 2
-            if high_threat_colonies > 0:
-                # Increase military budget when under threat
-                military_budget = min(remaining_ip * 2 // 3, base_military_budget + (high_threat_colonies * 10))
-            else:
-                military_budget = base_military_budget
-            
-            # Military buildup - prioritize based on what's available and effective
-            if player.can_build_ship_type(ShipType.FIGHTER):
-                fighter_count = military_budget // 20
-                spending["fighters"] = fighter_count * 20
-                remaining_ip -= fighter_count * 20
-            else:
-                corvette_count = military_budget // 8
-                spending["corvettes"] = corvette_count * 8
-                remaining_ip -= corvette_count * 8
-            
-            # Build missile bases for threatened colonies
-            if high_threat_colonies > 0 and player.can_build_ship_type(ShipType.CORVETTE):
-                missile_base_budget = min(remaining_ip // 3, high_threat_colonies * 4)  # 4 IP per missile base
-                spending["missile_bases"] = missile_base_budget
-                remaining_ip -= missile_base_budget
-            
-            # Continue factory building (but less if under threat)
-            factory_budget = min(remaining_ip, 12 if high_threat_colonies == 0 else 8)
-            spending["factories"] = factory_budget
-            remaining_ip -= factory_budget
+        spending = self._phase_spenders[game_phase](player, game_state, available_ip)
         
         # Invest any remaining IP in research
+        remaining_ip = available_ip - sum(spending.values())
         if remaining_ip > 0:
             spending["research_misc"] = remaining_ip
         
-        self.log_decision("production_spending", {
+        self._log("production_spending", lambda: {
             "game_phase": game_phase.value,
             "total_ip": available_ip,
             "spending": spending
@@ -331,20 +353,107 @@ class ExpansionistStrategy(BaseStrategy):
         
         return spending
     
+    def _spend_early(self, player: Player, game_state: GameState, available_ip: int) -> Dict[str, int]:
+        """Early game spending: maximize exploration and colonization capability."""
+        spending = {}
+        remaining_ip = available_ip
+        
+        # Colony transports (high priority)
+        transport_need = self._calculate_transport_need(player, game_state)
+        transport_cost = min(transport_need, remaining_ip)
+        spending["colony_transports"] = transport_cost
+        remaining_ip -= transport_cost
+        
+        # Scouts for exploration
+        scout_cost = min(self.params.scout_budget, remaining_ip)
+        spending["scouts"] = scout_cost
+        remaining_ip -= scout_cost
+        
+        # Speed research for faster expansion
+        research_cost = self.params.speed_research_cost
+        if remaining_ip >= research_cost and Technology.SPEED_3_HEX not in player.completed_technologies:
+            spending["research_speed_3"] = research_cost
+            remaining_ip -= research_cost
+        
+        return spending
+    
+    def _spend_mid(self, player: Player, game_state: GameState, available_ip: int) -> Dict[str, int]:
+        """Mid game spending: balance expansion with economic development."""
+        spending = {}
+        remaining_ip = available_ip
+        
+        # Factories for economic growth
+        factory_investment = min(remaining_ip // 2, self.params.mid_factory_cap)
+        spending["factories"] = factory_investment  
+        remaining_ip -= factory_investment
+        
+        # More colony transports
+        transport_cost = min(remaining_ip // 3, self.params.mid_transport_cap)
+        spending["colony_transports"] = transport_cost
+        remaining_ip -= transport_cost
+        
+        # Some military for defense
+        corvette_cost = self.params.corvette_cost
+        if remaining_ip >= corvette_cost:
+            spending["corvettes"] = corvette_cost  # 1 corvette
+            remaining_ip -= corvette_cost
+        
+        return spending
+    
+    def _spend_late(self, player: Player, game_state: GameState, available_ip: int) -> Dict[str, int]:
+        """Late game spending: prepare for the final military push while maintaining economy."""
+        spending = {}
+        remaining_ip = available_ip
+        
+        params = self.params
+        
+        # Assess colony defense needs for production prioritization
+        defense_needs = self.evaluate_colony_defense_needs(player, game_state)
+        high_threat_colonies = len([d for d in defense_needs if d[1]['threat_level'] >= params.high_threat_level])
+        
+        # Adjust military budget based on threat level
+        base_military_budget = remaining_ip // 2
+        if high_threat_colonies > 0:
+            # Increase military budget when under threat
+            military_budget = min(remaining_ip * 2 // 3, base_military_budget + (high_threat_colonies * params.threat_military_bonus))
+        else:
+            military_budget = base_military_budget
+        
+        # Military buildup - prioritize based on what's available and effective
+        if player.can_build_ship_type(_FIGHTER):
+            fighter_count = military_budget // params.fighter_cost
+            spending["fighters"] = fighter_count * params.fighter_cost
+            remaining_ip -= fighter_count * params.fighter_cost
+        else:
+            corvette_count = military_budget // params.corvette_cost
+            spending["corvettes"] = corvette_count * params.corvette_cost
+            remaining_ip -= corvette_count * params.corvette_cost
+        
+        # Build missile bases for threatened colonies
+        if high_threat_colonies > 0 and player.can_build_ship_type(_CORVETTE):
+            missile_base_budget = min(remaining_ip // 3, high_threat_colonies * params.missile_base_cost)
+            spending["missile_bases"] = missile_base_budget
+            remaining_ip -= missile_base_budget
+        
+        # Continue factory building (but less if under threat)
+        factory_budget = min(remaining_ip, params.late_factory_budget if high_threat_colonies == 0
+                             else params.late_factory_budget_threatened)
+        spending["factories"] = factory_budget
+        remaining_ip -= factory_budget
+        
+        return spending
+    
     def _calculate_transport_need(self, player: Player, game_state: GameState) -> int:
         """Calculate how many colony transports are needed."""
         # Count available transports
-        current_transports = 0
-        for fleet in player.fleets:
-            current_transports += sum(
-                s.count for s in fleet.ships if s.ship_type == ShipType.COLONY_TRANSPORT
-            )
+        index = self._get_ship_index(player, game_state)
+        current_transports = int(index.counts[index.type_ids == _COLONY_TX_ID].sum())
         
         # Estimate need based on colonies and population
         total_population = sum(c.population for c in player.colonies)
         
         # Want enough transports to move about 10% of population
-        desired_transports = max(5, total_population // 10)
+        desired_transports = max(self.params.min_transports, total_population // self.params.population_per_transport)
         
         return max(0, desired_transports - current_transports)
     
@@ -389,7 +498,7 @@ class ExpansionistStrategy(BaseStrategy):
             if warships and fleet.location != location:
                 # Move some warships to defend
                 for ship_group in warships[:1]:  # Move first available warship group
-                    orders.append(MovementOrder(
+                    orders.append(make_order(
                         fleet.location, ship_group.ship_type, 
                         min(2, ship_group.count), location
                     ))
@@ -412,47 +521,54 @@ class ExpansionistStrategy(BaseStrategy):
             source_location, ship_group = available_warships[0]
             attack_force = min(3, ship_group.count)  # Send moderate force
             
-            orders.append(MovementOrder(
+            orders.append(make_order(
                 source_location, ship_group.ship_type, 
                 attack_force, target_location
             ))
         
         return orders
     
-    def _plan_victory_point_control(self, player: Player, game_state: GameState) -> List[BaseAction]:
+    def _plan_victory_point_control(self, player: Player, game_state: GameState) -> Optional[List[BaseAction]]:
         """Position scouts and other ships to control systems for Rule C victory points."""
+        # Only scouts are deployed, so there is nothing to plan without any
+        index = self._get_ship_index(player, game_state)
+        scout_rows = np.flatnonzero((index.type_ids == _SCOUT_ID) & (index.counts > 0))
+        if scout_rows.size == 0:
+            return None
+        
         actions = []
         
         # Evaluate systems that could give victory points via Rule C
-        vp_targets = self.evaluate_victory_point_positions(player, game_state)[:10]  # Top 10 targets
+        vp_targets = self.evaluate_victory_point_positions(player, game_state, k=self.params.top_vp_targets)
         
         if not vp_targets:
-            return actions
+            return None
+        
+        # Hashed lookups for the target and occupied-location checks below
+        vp_target_locs = {target[0] for target in vp_targets}
+        ship_group_locs = {ship_group.location for ship_group in player.ship_groups}
         
         # Distribute scouts (max 1 per system for VP control)
         scout_orders = []
         available_scouts = []
         
         # Collect available scouts from all ship groups, limiting groups to 5 scouts max
-        for ship_group in player.ship_groups:
-            scouts = [ship for ship in ship_group.ships if ship.ship_type.value == "scout" and ship.count > 0]
-            if scouts:
-                for scout_ship in scouts:
-                    # If more than 5 scouts in one location, distribute them
-                    scouts_here = scout_ship.count
-                    location = ship_group.location
-                    
-                    # Keep max 5 scouts per task force, distribute the rest
-                    if scouts_here > 5:
-                        scouts_to_distribute = scouts_here - 5
-                        available_scouts.extend([(location, scouts_to_distribute)])
-                    
-                    # Also consider scouts from groups with <= 5 for redeployment
-                    elif scouts_here <= 5:
-                        # Only redeploy if this location doesn't need VP control
-                        location_needs_vp_control = any(target[0] == location for target in vp_targets)
-                        if not location_needs_vp_control:
-                            available_scouts.extend([(location, min(2, scouts_here))])  # Keep some scouts
+        max_scouts = self.params.max_scouts_per_task_force
+        for row in scout_rows:
+            # If more than 5 scouts in one location, distribute them
+            scouts_here = int(index.counts[row])
+            location = index.locations[row]
+            
+            # Keep max 5 scouts per task force, distribute the rest
+            if scouts_here > max_scouts:
+                scouts_to_distribute = scouts_here - max_scouts
+                available_scouts.append((location, scouts_to_distribute))
+            
+            # Also consider scouts from groups with <= 5 for redeployment
+            elif scouts_here <= max_scouts:
+                # Only redeploy if this location doesn't need VP control
+                if location not in vp_target_locs:
+                    available_scouts.append((location, min(self.params.redeployed_scouts_per_group, scouts_here)))  # Keep some scouts
         
         # Assign scouts to VP control targets
         scouts_assigned = 0
@@ -461,50 +577,53 @@ class ExpansionistStrategy(BaseStrategy):
                 break
                 
             # Check if we already have ships at target
-            has_ships = player.get_ship_group_at_location(target_location) is not None
-            if not has_ships and available_scouts:
+            if target_location not in ship_group_locs and available_scouts:
                 source_location, available_count = available_scouts[scouts_assigned]
                 scouts_to_send = min(1, available_count)  # Send only 1 scout per VP target
                 
-                scout_orders.append(MovementOrder(
-                    source_location, ShipType.SCOUT, scouts_to_send, target_location
+                scout_orders.append(make_order(
+                    source_location, _SCOUT, scouts_to_send, target_location
                 ))
                 scouts_assigned += 1
         
         if scout_orders:
             actions.append(MovementAction(player.player_id, scout_orders))
             
-            self.log_decision("victory_point_control", {
+            self._log("victory_point_control", lambda: {
                 "targets": [target[0] for target in vp_targets[:len(scout_orders)]],
                 "scouts_deployed": len(scout_orders)
             })
         
-        return actions
+        return actions or None
     
-    def _plan_colony_attacks(self, player: Player, game_state: GameState) -> List[BaseAction]:
+    def _plan_colony_attacks(self, player: Player, game_state: GameState) -> Optional[List[BaseAction]]:
         """Review discovered enemy colonies and plan attacks according to 4.2 rules."""
+        # Attacks need warships
+        if self._warship_rows(player, game_state).size == 0:
+            return None
+        
         actions = []
         
         # Get all potential colony attack targets
         attack_targets = self.evaluate_colony_attack_targets(player, game_state)
         
         if not attack_targets:
-            return actions
+            return None
         
         # Log security review decision
-        self.log_decision("security_review", {
+        self._log("security_review", lambda: {
             "targets_found": len(attack_targets),
-            "top_targets": [target[1]['enemy_player'] + " at " + target[0] for target in attack_targets[:3]]
+            "top_targets": [target[1].enemy_player + " at " + target[0] for target in attack_targets[:3]]
         })
         
-        # Select best targets for attack (limit to 2 per turn to avoid overextension)
-        for location, target_info in attack_targets[:2]:
+        # Select best targets for attack (limit per turn to avoid overextension)
+        for location, target_info in attack_targets[:self.params.attacks_per_turn]:
             # Check if we have sufficient warships available
             available_warships = self._get_available_warships_for_attack(player, location, game_state)
             
             if available_warships:
                 # Calculate required force based on target defenses
-                defense_strength = target_info['defense_strength']
+                defense_strength = target_info.defense_strength
                 required_warships = max(2, defense_strength + 1)  # Need superiority
                 
                 if len(available_warships) >= required_warships:
@@ -516,35 +635,50 @@ class ExpansionistStrategy(BaseStrategy):
                     if attack_orders:
                         actions.append(MovementAction(player.player_id, attack_orders))
                         
-                        self.log_decision("colony_attack_planned", {
-                            "target": target_info['enemy_player'] + " colony at " + location,
-                            "target_value": target_info['value_score'],
+                        self._log("colony_attack_planned", lambda: {
+                            "target": target_info.enemy_player + " colony at " + location,
+                            "target_value": target_info.value_score,
                             "defense_strength": defense_strength,
                             "warships_sent": len(attack_orders),
-                            "colony_details": f"{target_info['population']}M pop, {target_info['factories']} factories"
+                            "colony_details": f"{target_info.population}M pop, {target_info.factories} factories"
                         })
         
-        return actions
+        return actions or None
     
-    def _plan_enhanced_colony_defense(self, player: Player, game_state: GameState) -> List[BaseAction]:
+    def _plan_enhanced_colony_defense(self, player: Player, game_state: GameState) -> Optional[List[BaseAction]]:
         """Plan colony defense based on threat assessment and colony value."""
+        # Nothing to defend, or no warships to defend with
+        if not player.colonies or self._warship_rows(player, game_state).size == 0:
+            return None
+        
         actions = []
         
         # Get colonies that need defense
         defense_needs = self.evaluate_colony_defense_needs(player, game_state)
         
         if not defense_needs:
-            return actions
+            return None
+        
+        top_needs = defense_needs[:self.params.top_defense_needs]
+        
+        # Distance from every ship group to each of those colonies, computed once
+        sources = [ship_group.location for ship_group in player.ship_groups]
+        distances = np.array(
+            [[calculate_hex_distance(source, location) for source in sources] for location, _ in top_needs],
+            dtype=np.int32
+        ).reshape(len(top_needs), len(sources))
         
         # Prioritize defense for most valuable/threatened colonies
-        for location, defense_info in defense_needs[:3]:  # Top 3 threatened colonies
+        for row, (location, defense_info) in enumerate(top_needs):
             if defense_info['needs_warships'] and not defense_info['has_warships']:
                 # Send warships to defend
-                defensive_orders = self._create_enhanced_defensive_orders(location, defense_info, player, game_state)
+                defensive_orders = self._create_enhanced_defensive_orders(
+                    location, defense_info, player, game_state, distances[row]
+                )
                 if defensive_orders:
                     actions.append(MovementAction(player.player_id, defensive_orders))
                     
-                    self.log_decision("colony_defense_reinforcement", {
+                    self._log("colony_defense_reinforcement", lambda: {
                         "location": location,
                         "threat_level": defense_info['threat_level'],
                         "colony_value": defense_info['colony_value'],
@@ -552,43 +686,45 @@ class ExpansionistStrategy(BaseStrategy):
                         "colony_details": f"{defense_info['population']}M pop, {defense_info['factories']} factories on {defense_info['planet_type']}"
                     })
         
-        return actions
+        return actions or None
 
+    def _warship_rows(self, player: Player, game_state: GameState) -> np.ndarray:
+        """Ship index rows holding at least one warship."""
+        index = self._get_ship_index(player, game_state)
+        return np.flatnonzero(index.is_warship & (index.counts > 0))
+    
     def _get_available_warships_for_attack(self, player: Player, target_location: str, game_state: GameState) -> List[Tuple[str, Any]]:
         """Find available warships that can be used for colony attacks."""
         available_warships = []
+        index = self._get_ship_index(player, game_state)
+        rows = self._warship_rows(player, game_state)
         
-        for ship_group in player.ship_groups:
-            warships = [ship for ship in ship_group.ships if ship.is_warship and ship.count > 0]
-            if warships:
-                # Check if these warships are not critically needed for defense
-                location = ship_group.location
-                is_defending_critical_colony = self._is_location_critical_defense(location, player, game_state)
-                
-                if not is_defending_critical_colony:
-                    for warship in warships:
-                        # Keep some warships for local defense, send others for attack
-                        available_for_attack = max(0, warship.count - 1)  # Keep at least 1 if possible
-                        if available_for_attack > 0:
-                            available_warships.append((location, warship))
+        # Keep some warships for local defense, send others for attack
+        available_for_attack = np.maximum(0, index.counts[rows] - 1)  # Keep at least 1 if possible
+        
+        # Check in one pass which of these warships are critically needed for defense
+        candidate_rows = rows[available_for_attack > 0]
+        loc_ids = np.fromiter((HEX_TO_INDEX[index.locations[row]] for row in candidate_rows),
+                              dtype=np.intp, count=len(candidate_rows))
+        is_defending_critical_colony = self.critical_defense_mask(player, game_state, loc_ids)
+        
+        for row, is_critical in zip(candidate_rows, is_defending_critical_colony):
+            if not is_critical:
+                available_warships.append((index.locations[row], index.ships[row]))
         
         return available_warships
 
-    def _create_colony_attack_orders(self, target_location: str, target_info: Dict, 
+    def _create_colony_attack_orders(self, target_location: str, target_info: AttackTargetInfo, 
                                    available_warships: List, player: Player, 
                                    game_state: GameState) -> List[MovementOrder]:
         """Create movement orders for attacking an enemy colony."""
         orders = []
         
+        # Send appropriate force - more ships for better defended colonies
+        ships_to_send = _ATTACK_FORCE_BY_DEFENSE[min(target_info.defense_strength, len(_ATTACK_FORCE_BY_DEFENSE) - 1)]
+        
         for source_location, warship in available_warships:
-            # Send appropriate force - more ships for better defended colonies
-            ships_to_send = 1
-            if target_info['defense_strength'] > 2:
-                ships_to_send = 2
-            if target_info['defense_strength'] > 5:
-                ships_to_send = min(3, warship.count)
-            
-            orders.append(MovementOrder(
+            orders.append(make_order(
                 source_location, warship.ship_type, 
                 min(ships_to_send, warship.count), target_location
             ))
@@ -596,62 +732,72 @@ class ExpansionistStrategy(BaseStrategy):
         return orders
 
     def _create_enhanced_defensive_orders(self, location: str, defense_info: Dict, 
-                                        player: Player, game_state: GameState) -> List[MovementOrder]:
-        """Create movement orders to defend a threatened colony."""
-        orders = []
+                                        player: Player, game_state: GameState,
+                                        group_distances: Optional[np.ndarray] = None) -> List[MovementOrder]:
+        """Create movement orders to defend a threatened colony.
         
-        # Find nearest available warships
-        available_warships = []
-        from ..utils.hex_utils import calculate_hex_distance
-        
-        for ship_group in player.ship_groups:
-            warships = [ship for ship in ship_group.ships if ship.is_warship and ship.count > 0]
-            if warships and ship_group.location != location:
-                distance = calculate_hex_distance(ship_group.location, location)
-                for warship in warships:
-                    available_warships.append((ship_group.location, warship, distance))
+        group_distances holds the distance from each of player.ship_groups to
+        location; it is computed here when the caller has not precomputed it.
+        """
+        orders = []
         
-        # Sort by distance (closest first)
-        available_warships.sort(key=lambda x: x[2])
+        if group_distances is None:
+            group_distances = [calculate_hex_distance(ship_group.location, location)
+                               for ship_group in player.ship_groups]
         
         # Send appropriate number of warships based on threat
-        warships_needed = 1
-        if defense_info['threat_level'] >= 4:
-            warships_needed = 3
-        elif defense_info['threat_level'] >= 3:
-            warships_needed = 2
+        warships_needed = _DEFENSE_FORCE_BY_THREAT[min(defense_info['threat_level'], len(_DEFENSE_FORCE_BY_THREAT) - 1)]
+        
+        # Every group sends at least one ship, so the nearest warships_needed
+        # groups (ties broken by index row) are all that can be used
+        index = self._get_ship_index(player, game_state)
+        nearest_rows = heapq.nsmallest(
+            warships_needed,
+            (row for row in self._warship_rows(player, game_state) if index.locations[row] != location),
+            key=lambda row: (group_distances[index.group_ids[row]], row),
+        )
         
         warships_sent = 0
-        for source_location, warship, distance in available_warships:
+        for row in nearest_rows:
             if warships_sent >= warships_needed:
                 break
-                
+            
+            warship = index.ships[row]
             ships_to_send = min(2, warship.count)  # Send up to 2 ships per group
-            orders.append(MovementOrder(
-                source_location, warship.ship_type, 
+            orders.append(make_order(
+                index.locations[row], warship.ship_type, 
                 ships_to_send, location
             ))
             warships_sent += ships_to_send
         
         return orders
 
+    def critical_defense_mask(self, player: Player, game_state: GameState, loc_ids: np.ndarray) -> np.ndarray:
+        """Flag which board locations (HEX_TO_INDEX ids) are critical for defense.
+        
+        A location is critical when it holds one of the player's high-value
+        colonies or enemy ships; warships there shouldn't be moved away.
+        """
+        self._refresh_turn_caches(game_state)
+        key = (game_state.current_turn, player.player_id, "critical_defense", game_state.generation)
+        return self._cached(key, lambda: self._build_critical_defense_table(player, game_state))[loc_ids]
+    
+    def _build_critical_defense_table(self, player: Player, game_state: GameState) -> np.ndarray:
+        """Critical-defense flag for every board hex, from the game's spatial index."""
+        game_state.rebuild_spatial_index()
+        colony_max_value = np.zeros(len(ALL_HEXES))
+        enemy_ship_total = np.zeros(len(ALL_HEXES), dtype=np.int32)
+        
+        for (owner_id, location), colonies in game_state._colonies_by_loc.items():
+            if owner_id == player.player_id:
+                colony_max_value[HEX_TO_INDEX[location]] = max(self._get_colony_value(colony) for colony in colonies)
+        
+        for location, totals in game_state._ship_totals_by_loc.items():
+            enemy_ship_total[HEX_TO_INDEX[location]] = sum(
+                total_ships for other_id, total_ships in totals.items() if other_id != player.player_id)
+        
+        return (colony_max_value > self.params.critical_colony_value) | (enemy_ship_total > 0)
+
     def _is_location_critical_defense(self, location: str, player: Player, game_state: GameState) -> bool:
         """Check if a location is critical for defense and shouldn't have warships moved away."""
-        # Check if this location has a valuable colony
-        colonies_here = player.get_colonies_at_location(location)
-        if colonies_here:
-            for colony in colonies_here:
-                colony_value = self._get_colony_value(colony)
-                if colony_value > 10:  # High value colony
-                    return True
-        
-        # Check for immediate enemy threats
-        for other_player in game_state.players:
-            if other_player.player_id == player.player_id:
-                continue
-            
-            enemy_ship_group = other_player.get_ship_group_at_location(location)
-            if enemy_ship_group and enemy_ship_group.get_total_ships() > 0:
-                return True  # Under immediate threat
-        
-        return False
\ No newline at end of file
+        return bool(self.critical_defense_mask(player, game_state, HEX_TO_INDEX[location]))
@@ -1,8 +1,21 @@
 """Game constants for Stellar Conquest simulator."""
 
+import re
+from types import MappingProxyType
+from typing import Any, Dict, Tuple
+
 from .enums import ShipType, Technology, PlanetType, StarColor
 
 
+def _freeze(value: Any) -> Any:
+    """Read-only view of a constant table: dicts become mappingproxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 # Game Configuration Constants
 MAX_PLAYERS = 4
 MIN_PLAYERS = 2
@@ -12,11 +25,12 @@ PRODUCTION_TURN_INTERVAL = 4  # Production occurs every 4th turn
 HEX_DISTANCE_UNIT = 0.125  # Light-years per hex (from rules)
 
 # Starting Fleet Composition
-STARTING_FLEET = {
+STARTING_FLEET = _freeze({
     ShipType.SCOUT: 4,
     ShipType.CORVETTE: 4,
     ShipType.COLONY_TRANSPORT: 35
-}
+})
+STARTING_FLEET_ITEMS = tuple(STARTING_FLEET.items())  # Frozen (ship type, count) pairs
 
 # Starting Bonus Industrial Points
 STARTING_BONUS_IP = 25
@@ -40,26 +54,30 @@ MINERAL_RICH_MULTIPLIER = 2 # Production multiplier for mineral-rich planets
 BONUS_BASE = 3_000_000     # Base 3 million for bonus calculation
 BONUS_RATIO = 3            # 3 emigrants = 1 bonus population
 
+# Fixed ship type order for per-type count arrays (index = position in SHIP_TYPE_ORDER)
+SHIP_TYPE_ORDER = tuple(ShipType)
+SHIP_TYPE_INDEX = {ship_type: idx for idx, ship_type in enumerate(SHIP_TYPE_ORDER)}
+
 # Ship Costs (Industrial Points)
-SHIP_COSTS = {
+SHIP_COSTS = _freeze({
     ShipType.COLONY_TRANSPORT: 1,
     ShipType.SCOUT: 3,
     ShipType.CORVETTE: 8,
     ShipType.FIGHTER: 20,
     ShipType.DEATH_STAR: 40
-}
+})
 
 # Building Costs (Industrial Points)
-BUILDING_COSTS = {
+BUILDING_COSTS = _freeze({
     "factory": 4,
     "robotic_factory": 3,
     "missile_base": 4,
     "advanced_missile_base": 10,
     "planet_shield": 30
-}
+})
 
 # Technology Costs (Industrial Points)
-TECHNOLOGY_COSTS = {
+TECHNOLOGY_COSTS = _freeze({
     # Ship Speed Technologies
     Technology.SPEED_3_HEX: 15,
     Technology.SPEED_4_HEX: 40,
@@ -83,10 +101,10 @@ TECHNOLOGY_COSTS = {
     Technology.UNLIMITED_SHIP_RANGE: 60,
     Technology.UNLIMITED_SHIP_COMMUNICATION: 70,
     Technology.ROBOTIC_INDUSTRY: 100
-}
+})
 
 # Technology Prerequisites and Reduced Costs
-TECHNOLOGY_PREREQUISITES = {
+TECHNOLOGY_PREREQUISITES = _freeze({
     Technology.SPEED_4_HEX: (Technology.SPEED_3_HEX, 30),
     Technology.SPEED_5_HEX: (Technology.SPEED_4_HEX, 40),
     Technology.SPEED_6_HEX: (Technology.SPEED_5_HEX, 50),
@@ -97,61 +115,22 @@ TECHNOLOGY_PREREQUISITES = {
     Technology.IMPROVED_INDUSTRIAL_TECH: (Technology.INDUSTRIAL_TECHNOLOGY, 40),
     Technology.UNLIMITED_SHIP_RANGE: (Technology.SPEED_5_HEX, 40),  # Requires 5+ hex speed
     Technology.ROBOTIC_INDUSTRY: (Technology.INDUSTRIAL_TECHNOLOGY, 85)
-}
+})
 
 # Victory Points
-VICTORY_POINTS = {
+VICTORY_POINTS = _freeze({
     PlanetType.TERRAN: 3,
     PlanetType.SUB_TERRAN: 1,
     PlanetType.MINIMAL_TERRAN: 0,
     PlanetType.BARREN: 0
-}
-
-# Combat Values and Attack Tables
-COMBAT_VALUES = {
-    "scout": {"combat_strength": 0, "can_attack": False},
-    "colony_transport": {"combat_strength": 0, "can_attack": False},
-    "corvette": {"combat_strength": 1, "can_attack": True},
-    "fighter": {"combat_strength": 2, "can_attack": True},
-    "death_star": {"combat_strength": 4, "can_attack": True},
-    "missile_base": {"combat_strength": 1, "can_attack": True},
-    "advanced_missile_base": {"combat_strength": 2, "can_attack": True}
-}
-
-# Attack Table (attacker vs defender, die roll needed for kill)
-ATTACK_TABLE = {
-    # Format: (attacker, defender): (dice_count, success_range)
-    ("corvette", "scout"): (1, [1, 2, 3, 4]),
-    ("corvette", "colony_transport"): (1, [1, 2, 3, 4]),
-    ("corvette", "corvette"): (1, [1]),
-    ("corvette", "missile_base"): (1, [1]),
-    ("corvette", "fighter"): (2, [10]),
-    ("corvette", "advanced_missile_base"): (2, [10]),
-    ("corvette", "death_star"): (1, []),  # No effect
-    
-    ("fighter", "scout"): (1, [1, 2, 3, 4, 5]),
-    ("fighter", "colony_transport"): (1, [1, 2, 3, 4, 5]),
-    ("fighter", "corvette"): (1, [1, 2]),
-    ("fighter", "missile_base"): (1, [1, 2]),
-    ("fighter", "fighter"): (1, [1]),
-    ("fighter", "advanced_missile_base"): (1, [1]),
-    ("fighter", "death_star"): (2, [10]),
-    
-    ("death_star", "scout"): (1, [1, 2, 3, 4, 5, 6]),  # Automatic
-    ("death_star", "colony_transport"): (1, [1, 2, 3, 4, 5, 6]),  # Automatic
-    ("death_star", "corvette"): (1, [1, 2, 3, 4]),
-    ("death_star", "missile_base"): (1, [1, 2, 3, 4]),
-    ("death_star", "fighter"): (1, [1, 2, 3]),
-    ("death_star", "advanced_missile_base"): (1, [1, 2, 3]),
-    ("death_star", "death_star"): (1, [1, 2])
-}
+})
 
 # Colony Destruction Rates (population destroyed per turn per ship)
-DESTRUCTION_RATES = {
+DESTRUCTION_RATES = _freeze({
     ShipType.CORVETTE: 1_000_000,  # 1 million per turn
     ShipType.FIGHTER: 3_000_000,   # 3 million per turn
     ShipType.DEATH_STAR: 5_000_000 # 5 million per turn
-}
+})
 
 # Exploration Risk
 EXPLORATION_RISK_CHANCE = 1/6  # 1 in 6 chance of ship destruction
@@ -159,22 +138,22 @@ EXPLORATION_RISK_CHANCE = 1/6  # 1 in 6 chance of ship destruction
 # Map Board Configuration  
 BOARD_SIZE = 14  # 14x14 hex grid (simplified)
 HEX_GRID_SIZE = 14
-BOARD_DIMENSIONS = {
+BOARD_DIMENSIONS = _freeze({
     "columns": 32,  # A through Z, then AA through FF
     "odd_column_rows": 21,    # A, C, E, G, I, K, M, O, Q, S, U, W, Y, AA, CC, EE
     "even_column_rows": 20,   # B, D, F, H, J, L, N, P, R, T, V, X, Z, BB, DD, FF
-}
+})
 
 # Entry Hexes (corner positions for player starting locations)
-ENTRY_HEXES = {
+ENTRY_HEXES = _freeze({
     1: "A1",    # Top-left
     2: "A21",   # Bottom-left  
     3: "FF1",   # Top-right
     4: "FF20"   # Bottom-right
-}
+})
 
 # Gas Cloud Hexes (obstacles on the board) - from rules.txt
-GAS_CLOUD_HEXES = {
+GAS_CLOUD_HEXES = frozenset({
     'A10', 'A11', 'A12', 'A13', 'B10', 'B11', 'B12', 'C11', 
     'I7', 'I8', 'I13', 'I14', 'J6', 'J7', 'J8', 'J12', 'J13', 'J14', 
     'K6', 'K7', 'K14', 'K15', 'K16', 'L5', 'L15', 'O1', 'O20', 
@@ -182,7 +161,27 @@ GAS_CLOUD_HEXES = {
     'U6', 'V5', 'V6', 'V14', 'V15', 'W6', 'W7', 'W15', 
     'X6', 'X7', 'X8', 'X13', 'X14', 'Y12', 'Y13', 'Y14',
     'DD7', 'EE8', 'EE9', 'EE11', 'FF8', 'FF9', 'FF10', 'FF11'
-}
+})
+
+
+def _enumerate_hexes(dimensions: Dict[str, int]) -> Tuple[str, ...]:
+    """List every board hex in column-major order (A1, A2, ..., FF20)."""
+    hexes = []
+    for number in range(1, dimensions["columns"] + 1):
+        if number <= 26:
+            column = chr(ord('A') + number - 1)
+        else:
+            column = chr(ord('A') + number - 27) * 2
+        rows = dimensions["odd_column_rows"] if number % 2 else dimensions["even_column_rows"]
+        hexes.extend(f"{column}{row}" for row in range(1, rows + 1))
+    return tuple(hexes)
+
+
+# Dense integer ids for board hexes, so hot loops can index arrays instead of
+# hashing coordinate strings
+LocationId = int  # Position of a hex in ALL_HEXES
+ALL_HEXES: Tuple[str, ...] = _enumerate_hexes(BOARD_DIMENSIONS)
+HEX_TO_INDEX: Dict[str, LocationId] = {hex_coord: idx for idx, hex_coord in enumerate(ALL_HEXES)}
 
 # Fixed Star Locations (from rules.txt)
 FIXED_STAR_LOCATIONS = {
@@ -244,25 +243,25 @@ FIXED_STAR_LOCATIONS = {
 
 # Star System Counts
 TOTAL_STAR_SYSTEMS = len(FIXED_STAR_LOCATIONS)
-STAR_COLOR_DISTRIBUTION = {
+STAR_COLOR_DISTRIBUTION = _freeze({
     StarColor.BLUE: 8,    # blue stars in fixed locations
     StarColor.GREEN: 9,   # lime stars (green equivalent)
     StarColor.YELLOW: 18, # yellow stars
     StarColor.ORANGE: 9,  # orange stars  
     StarColor.RED: 18     # red stars
-}
+})
 
 # Color mapping from rules.txt to StarColor enum
-RULES_COLOR_TO_STARCOLOR = {
+RULES_COLOR_TO_STARCOLOR = _freeze({
     "blue": StarColor.BLUE,
     "lime": StarColor.GREEN,  # lime maps to green
     "yellow": StarColor.YELLOW,
     "orange": StarColor.ORANGE,
     "red": StarColor.RED
-}
+})
 
 # Planet Distribution Tendencies by Star Color
-PLANET_TENDENCIES = {
+PLANET_TENDENCIES = _freeze({
     StarColor.YELLOW: {
         "terran_chance": 0.7,
         "mineral_rich_chance": 0.2
@@ -283,18 +282,18 @@ PLANET_TENDENCIES = {
         "terran_chance": 0.2,
         "mineral_rich_chance": 0.3
     }
-}
+})
 
 # Gas Cloud Movement Rules
 GAS_CLOUD_ENTRY_RESTRICTION = True  # Must start adjacent to enter
 GAS_CLOUD_MOVEMENT_LIMIT = 1        # Only 1 hex per turn in clouds
 
 # Factory Limits
-FACTORY_LIMITS = {
+FACTORY_LIMITS = _freeze({
     "normal": 1,        # 1 factory per million population (Industrial Technology)
     "improved": 2,      # 2 factories per million population (Improved Industrial)
     "robotic": None     # No limit (Robotic Industry)
-}
+})
 
 # Task Force Limits
 MAX_TASK_FORCES_PER_PLAYER = 15
@@ -308,7 +307,7 @@ COMMAND_POST_REQUIRED_FOR_SHIPS = [
 ]  # Scouts exempt from command post range
 
 # AI Strategy Weights (default values)
-DEFAULT_STRATEGY_WEIGHTS = {
+DEFAULT_STRATEGY_WEIGHTS = _freeze({
     "expansionist": {
         "exploration": 1.5,
         "colonization": 2.0,
@@ -337,16 +336,16 @@ DEFAULT_STRATEGY_WEIGHTS = {
         "research": 1.0,
         "economy": 1.0
     }
-}
+})
 
 # Simulation Configuration
-DEFAULT_SIMULATION_CONFIG = {
+DEFAULT_SIMULATION_CONFIG = _freeze({
     "max_turns": MAX_TURNS,
     "debug_logging": False,
     "save_snapshots": True,
     "monte_carlo_iterations": 1000,
     "random_seed": None
-}
+})
 
 # Analysis Constants
 STATISTICAL_SIGNIFICANCE_THRESHOLD = 0.05
@@ -371,15 +370,16 @@ MIN_PLAYER_COUNT = 2
 MAX_GAME_NAME_LENGTH = 50
 MAX_PLAYER_NAME_LENGTH = 30
 VALID_HEX_PATTERN = r'^([A-Z]{1,2})(\d{1,2})$'
+VALID_HEX_RE = re.compile(VALID_HEX_PATTERN)
 
 # Star Card System
-STAR_CARD_RANGES = {
+STAR_CARD_RANGES = _freeze({
     StarColor.BLUE: (1, 11),     # Blue stars: cards 1-11
     StarColor.GREEN: (12, 23),   # Green stars: cards 12-23  
     StarColor.YELLOW: (24, 43),  # Yellow stars: cards 24-43
     StarColor.ORANGE: (44, 56),  # Orange stars: cards 44-56
     StarColor.RED: (57, 78)      # Red stars: cards 57-78
-}
+})
 
 # Star Cards Database (from rules.txt STAR CARDS TABLE)
 STAR_CARDS = {
@@ -663,7 +663,7 @@ STAR_CARDS = {
 }
 
 # Error Codes
-ERROR_CODES = {
+ERROR_CODES = _freeze({
     "INVALID_PLAYER": "E001",
     "GAME_ENDED": "E002",
     "INSUFFICIENT_RESOURCES": "E003",
@@ -672,4 +672,4 @@ ERROR_CODES = {
     "INVALID_ACTION": "E006",
     "VALIDATION_FAILED": "E007",
     "EXECUTION_FAILED": "E008"
-}
\ No newline at end of file
+})
\ No newline at end of file
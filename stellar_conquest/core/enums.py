@@ -1,9 +1,46 @@
 """Core enumerations for Stellar Conquest simulator."""
 
-from enum import Enum, IntEnum, auto
+from enum import Enum, EnumMeta, IntEnum, auto
 
 
-class ShipType(Enum):
+class _FastEnumMeta(EnumMeta):
+    """EnumMeta whose value lookup probes the value map before anything else.
+
+    ``ShipType("scout")`` normally goes through ``EnumMeta.__call__`` and
+    ``Enum.__new__``; a plain value hit is answered straight from
+    ``_value2member_map_``. Misses, member arguments and the functional API
+    fall through to the standard machinery unchanged.
+    """
+
+    def __call__(cls, value, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return cls._value2member_map_[value]
+            except (KeyError, TypeError):
+                pass
+        return super().__call__(value, *args, **kwargs)
+
+
+class IndexedEnum(Enum, metaclass=_FastEnumMeta):
+    """String-valued enum whose members also carry a dense integer ordinal.
+
+    The string values stay the public, serialized form. ``ordinal`` is the
+    member's position in definition order, suitable for int comparisons and
+    for indexing per-type arrays; ``from_str`` (an alias of ``from_value``)
+    maps a value string straight to its member. ``bit`` is
+    ``1 << ordinal``, so a set of members packs into a single int mask.
+    """
+
+    ordinal: int
+    bit: int
+
+    @property
+    def label(self) -> str:
+        """Human readable name, e.g. 'Colony Transport'."""
+        return type(self)._labels[self]
+
+
+class ShipType(IndexedEnum):
     """Types of ships in Stellar Conquest."""
     SCOUT = "scout"
     COLONY_TRANSPORT = "colony_transport"
@@ -12,7 +49,7 @@ class ShipType(Enum):
     DEATH_STAR = "death_star"
 
 
-class PlanetType(Enum):
+class PlanetType(IndexedEnum):
     """Types of planets that can be colonized."""
     TERRAN = "terran"
     SUB_TERRAN = "sub_terran"
@@ -20,7 +57,7 @@ class PlanetType(Enum):
     BARREN = "barren"
 
 
-class StarColor(Enum):
+class StarColor(IndexedEnum):
     """Star colors corresponding to spectral classes."""
     BLUE = "blue"
     GREEN = "green"
@@ -37,7 +74,7 @@ class PlayStyle(Enum):
     BALANCED = "balanced"
 
 
-class Technology(Enum):
+class Technology(IndexedEnum):
     """Available technologies in the game."""
     # Ship Speed Technologies
     SPEED_3_HEX = "speed_3_hex"
@@ -71,7 +108,7 @@ class TechnologyLevel(IntEnum):
     LEVEL_3 = 3
 
 
-class GamePhase(Enum):
+class GamePhase(IndexedEnum):
     """Game phases including setup and turn phases."""
     SETUP = "setup"
     MOVEMENT = "movement"
@@ -81,7 +118,7 @@ class GamePhase(Enum):
     PRODUCTION = "production"
 
 
-class TurnPhase(Enum):
+class TurnPhase(IndexedEnum):
     """Different phases within a single turn."""
     MOVEMENT = "movement"
     EXPLORATION = "exploration"
@@ -90,7 +127,7 @@ class TurnPhase(Enum):
     PRODUCTION = "production"
 
 
-class ActionResult(Enum):
+class ActionResult(IndexedEnum):
     """Result types for action execution."""
     SUCCESS = "success"
     FAILURE = "failure"
@@ -124,7 +161,7 @@ class Priority(IntEnum):
     CRITICAL = 5
 
 
-class CombatResult(Enum):
+class CombatResult(IndexedEnum):
     """Results of combat resolution."""
     ATTACKER_VICTORY = "attacker_victory"
     DEFENDER_VICTORY = "defender_victory"
@@ -133,7 +170,7 @@ class CombatResult(Enum):
     DEFENDER_RETREAT = "defender_retreat"
 
 
-class ColonyStatus(Enum):
+class ColonyStatus(IndexedEnum):
     """Status of a colony."""
     ACTIVE = "active"
     CONQUERED = "conquered"
@@ -141,7 +178,7 @@ class ColonyStatus(Enum):
     ABANDONED = "abandoned"
 
 
-class FleetStatus(Enum):
+class FleetStatus(IndexedEnum):
     """Status of a fleet."""
     ACTIVE = "active"
     IN_TRANSIT = "in_transit"
@@ -156,7 +193,7 @@ class ExplorationRisk(Enum):
     NAVIGATION_HAZARD = "navigation_hazard"
 
 
-class ResourceType(Enum):
+class ResourceType(IndexedEnum):
     """Types of resources in the game."""
     POPULATION = "population"
     INDUSTRIAL_POINTS = "industrial_points"
@@ -192,7 +229,7 @@ class PlayerAction(Enum):
     TRANSFER_POPULATION = "transfer_population"
 
 
-class TerrainType(Enum):
+class TerrainType(IndexedEnum):
     """Types of terrain on the game board."""
     EMPTY_SPACE = "empty_space"
     STAR_SYSTEM = "star_system"
@@ -234,58 +271,124 @@ class ExportFormat(Enum):
     XML = "xml"
 
 
+def _index_members(*enum_classes):
+    """Attach ordinals, bits and display labels to each enum."""
+    for enum_cls in enum_classes:
+        for ordinal, member in enumerate(enum_cls):
+            member.ordinal = ordinal
+            member.bit = 1 << ordinal
+        enum_cls._labels = {
+            member: member.value.replace("_", " ").title() for member in enum_cls
+        }
+
+
+_index_members(
+    ShipType, PlanetType, StarColor, Technology, GamePhase, TurnPhase,
+    ActionResult, CombatResult, ColonyStatus, FleetStatus, ResourceType,
+    TerrainType,
+)
+
+
+def _bind_lookups():
+    """Give every enum here from_value/from_name as bound dict lookups.
+
+    ``Cls.from_value(v)`` and ``Cls.from_name(n)`` are single dict probes
+    that raise KeyError on a miss; prefer them over ``Cls(v)`` / ``Cls[n]``
+    in AI and combat loops. Parsing of external data keeps ``Cls(v)`` so bad
+    input still raises ValueError.
+    """
+    for enum_cls in list(globals().values()):
+        if (isinstance(enum_cls, EnumMeta) and enum_cls.__module__ == __name__
+                and enum_cls._member_map_):
+            enum_cls.from_value = enum_cls._value2member_map_.__getitem__
+            enum_cls.from_name = enum_cls._member_map_.__getitem__
+            if issubclass(enum_cls, IndexedEnum):
+                enum_cls.from_str = enum_cls.from_value
+
+
+_bind_lookups()
+
+
+# Fixed enum groupings, built once at import
+SHIP_COMBAT_TYPES = (ShipType.CORVETTE, ShipType.FIGHTER, ShipType.DEATH_STAR)
+UNARMED_SHIP_TYPES = (ShipType.SCOUT, ShipType.COLONY_TRANSPORT)
+HABITABLE_PLANETS = frozenset({PlanetType.TERRAN, PlanetType.SUB_TERRAN, PlanetType.MINIMAL_TERRAN})
+GROWTH_PLANETS = frozenset({PlanetType.TERRAN, PlanetType.SUB_TERRAN})
+SPEED_TECHNOLOGIES = (
+    Technology.SPEED_3_HEX,
+    Technology.SPEED_4_HEX,
+    Technology.SPEED_5_HEX,
+    Technology.SPEED_6_HEX,
+    Technology.SPEED_7_HEX,
+    Technology.SPEED_8_HEX
+)
+WEAPON_TECHNOLOGIES = (
+    Technology.MISSILE_BASE,
+    Technology.FIGHTER_SHIP,
+    Technology.ADVANCED_MISSILE_BASE,
+    Technology.DEATH_STAR,
+    Technology.IMPROVED_SHIP_WEAPONRY,
+    Technology.PLANET_SHIELD
+)
+INDUSTRIAL_TECHNOLOGIES = (
+    Technology.CONTROLLED_ENVIRONMENT_TECH,
+    Technology.INDUSTRIAL_TECHNOLOGY,
+    Technology.IMPROVED_INDUSTRIAL_TECH,
+    Technology.UNLIMITED_SHIP_RANGE,
+    Technology.UNLIMITED_SHIP_COMMUNICATION,
+    Technology.ROBOTIC_INDUSTRY
+)
+
+
+def enum_mask(members) -> int:
+    """Pack IndexedEnum members into an int bitmask (OR of their bits)."""
+    mask = 0
+    for member in members:
+        mask |= member.bit
+    return mask
+
+
+# The same groupings as bitmasks; test membership with ``member.bit & MASK``
+SHIP_COMBAT_MASK = enum_mask(SHIP_COMBAT_TYPES)
+UNARMED_SHIP_MASK = enum_mask(UNARMED_SHIP_TYPES)
+HABITABLE_PLANET_MASK = enum_mask(HABITABLE_PLANETS)
+GROWTH_PLANET_MASK = enum_mask(GROWTH_PLANETS)
+SPEED_TECHNOLOGY_MASK = enum_mask(SPEED_TECHNOLOGIES)
+WEAPON_TECHNOLOGY_MASK = enum_mask(WEAPON_TECHNOLOGIES)
+INDUSTRIAL_TECHNOLOGY_MASK = enum_mask(INDUSTRIAL_TECHNOLOGIES)
+
+
 # Utility functions for enum operations
 def get_ship_combat_types():
     """Get ship types that can participate in combat."""
-    return [ShipType.CORVETTE, ShipType.FIGHTER, ShipType.DEATH_STAR]
+    return SHIP_COMBAT_TYPES
 
 
 def get_unarmed_ship_types():
     """Get ship types vulnerable to exploration risks."""
-    return [ShipType.SCOUT, ShipType.COLONY_TRANSPORT]
+    return UNARMED_SHIP_TYPES
 
 
 def get_habitable_planet_types():
     """Get planet types that can support colonies."""
-    return [PlanetType.TERRAN, PlanetType.SUB_TERRAN, PlanetType.MINIMAL_TERRAN]
+    return HABITABLE_PLANETS
 
 
 def get_growth_supporting_planets():
     """Get planet types that support population growth."""
-    return [PlanetType.TERRAN, PlanetType.SUB_TERRAN]
+    return GROWTH_PLANETS
 
 
 def get_speed_technologies():
     """Get all ship speed technologies in order."""
-    return [
-        Technology.SPEED_3_HEX,
-        Technology.SPEED_4_HEX,
-        Technology.SPEED_5_HEX,
-        Technology.SPEED_6_HEX,
-        Technology.SPEED_7_HEX,
-        Technology.SPEED_8_HEX
-    ]
+    return SPEED_TECHNOLOGIES
 
 
 def get_weapon_technologies():
     """Get all weapon-related technologies."""
-    return [
-        Technology.MISSILE_BASE,
-        Technology.FIGHTER_SHIP,
-        Technology.ADVANCED_MISSILE_BASE,
-        Technology.DEATH_STAR,
-        Technology.IMPROVED_SHIP_WEAPONRY,
-        Technology.PLANET_SHIELD
-    ]
+    return WEAPON_TECHNOLOGIES
 
 
 def get_industrial_technologies():
     """Get all industrial/economic technologies."""
-    return [
-        Technology.CONTROLLED_ENVIRONMENT_TECH,
-        Technology.INDUSTRIAL_TECHNOLOGY,
-        Technology.IMPROVED_INDUSTRIAL_TECH,
-        Technology.UNLIMITED_SHIP_RANGE,
-        Technology.UNLIMITED_SHIP_COMMUNICATION,
-        Technology.ROBOTIC_INDUSTRY
-    ]
\ No newline at end of file
+    return INDUSTRIAL_TECHNOLOGIES
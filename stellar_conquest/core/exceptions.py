@@ -1,25 +1,58 @@
 """Custom exceptions for Stellar Conquest simulator."""
 
+import re
+import sys
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Container, Dict, Optional, Pattern, Union
+
+# Default hex coordinate pattern for raise_if_invalid_hex
+_HEX_RE = re.compile(r'^[A-Z]+\d+$')
+
 
 class StellarConquestError(Exception):
-    """Base exception for all Stellar Conquest simulator errors."""
+    """Base exception for all Stellar Conquest simulator errors.
+    
+    context may be a dict or one of the *Context records below; either way
+    the context attribute reads back as a plain dict.
+    """
     
-    def __init__(self, message: str, error_code: str = None, context: dict = None):
+    def __init__(self, message: str, error_code: str = None, context: Any = None):
         super().__init__(message)
         self.message = message
-        self.error_code = error_code
-        self.context = context or {}
+        self.error_code = sys.intern(error_code) if type(error_code) is str else error_code
+        self._context = context
+    
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Error context as a dict, built from a context record on first access."""
+        context = self._context
+        if type(context) is not dict:
+            context = self._context = dict(_context_items(context)) if context else {}
+        return context
+    
+    @context.setter
+    def context(self, value: Dict[str, Any]) -> None:
+        self._context = value
     
     def __str__(self):
+        if not self.error_code and not self._context:
+            return self.message
         base_msg = self.message
         if self.error_code:
             base_msg = f"[{self.error_code}] {base_msg}"
-        if self.context:
-            context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
+        if self._context:
+            context_str = ", ".join([f"{k}={v}" for k, v in _context_items(self._context)])
             base_msg = f"{base_msg} (Context: {context_str})"
         return base_msg
 
 
+def _context_items(context):
+    """(key, value) pairs of a context given as a mapping or a context record."""
+    if is_dataclass(context):
+        return [(f.name, getattr(context, f.name)) for f in fields(context)]
+    return context.items()
+
+
 # Game State Exceptions
 class GameStateError(StellarConquestError):
     """Errors related to game state management."""
@@ -462,14 +495,57 @@ class DataExportError(AnalysisError):
     pass
 
 
+# Typed context records attached by the raise_if_* helpers
+@dataclass(frozen=True, slots=True)
+class InvalidPlayerContext:
+    """Context for InvalidPlayerError."""
+    player_id: int
+    valid_players: Container[int]
+    context: str
+
+
+@dataclass(frozen=True, slots=True)
+class GameEndedContext:
+    """Context for GameAlreadyEndedError."""
+    action: str
+    winner: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class InsufficientResourcesContext:
+    """Context for InsufficientResourcesError."""
+    required: int
+    available: int
+    resource_type: str
+
+
+@dataclass(frozen=True, slots=True)
+class InvalidHexContext:
+    """Context for InvalidHexError."""
+    hex_coord: str
+    pattern: str
+
+
+@dataclass(frozen=True, slots=True)
+class WrongPhaseContext:
+    """Context for InvalidPhaseError."""
+    current_phase: str
+    required_phase: str
+    action: str
+
+
 # Utility functions for exception handling
-def raise_if_invalid_player(player_id: int, valid_players: list, context: str = ""):
-    """Raise InvalidPlayerError if player ID is not valid."""
+def raise_if_invalid_player(player_id: int, valid_players: Container[int], context: str = ""):
+    """Raise InvalidPlayerError if player ID is not valid.
+
+    Any container supporting ``in`` is accepted; pass a set for a
+    constant-time check.
+    """
     if player_id not in valid_players:
         raise InvalidPlayerError(
             f"Player {player_id} is not valid",
             error_code="INVALID_PLAYER",
-            context={"player_id": player_id, "valid_players": valid_players, "context": context}
+            context=InvalidPlayerContext(player_id, valid_players, context)
         )
 
 
@@ -479,7 +555,7 @@ def raise_if_game_ended(game_state, action_name: str = "action"):
         raise GameAlreadyEndedError(
             f"Cannot perform {action_name} - game has already ended",
             error_code="GAME_ENDED",
-            context={"action": action_name, "winner": game_state.winner_id}
+            context=GameEndedContext(action_name, game_state.winner_id)
         )
 
 
@@ -489,18 +565,27 @@ def raise_if_insufficient_resources(required: int, available: int, resource_type
         raise InsufficientResourcesError(
             f"Insufficient {resource_type}: need {required}, have {available}",
             error_code="INSUFFICIENT_RESOURCES",
-            context={"required": required, "available": available, "resource_type": resource_type}
+            context=InsufficientResourcesContext(required, available, resource_type)
         )
 
 
-def raise_if_invalid_hex(hex_coord: str, valid_pattern: str = r'^[A-Z]+\d+$'):
-    """Raise InvalidHexError if hex coordinate is invalid."""
-    import re
-    if not re.match(valid_pattern, hex_coord):
+def raise_if_invalid_hex(hex_coord: str, valid_pattern: Union[str, Pattern] = _HEX_RE):
+    """Raise InvalidHexError if hex coordinate is invalid.
+
+    With the default pattern, single-letter board hexes such as 'E5' are
+    accepted without running the regex.
+    """
+    if (valid_pattern is _HEX_RE and 2 <= len(hex_coord) <= 3
+            and "A" <= hex_coord[0] <= "Z"
+            and hex_coord[1:].isascii() and hex_coord[1:].isdigit()):
+        return
+    if isinstance(valid_pattern, str):
+        valid_pattern = re.compile(valid_pattern)
+    if not valid_pattern.match(hex_coord):
         raise InvalidHexError(
             f"Invalid hex coordinate: {hex_coord}",
             error_code="INVALID_HEX",
-            context={"hex_coord": hex_coord, "pattern": valid_pattern}
+            context=InvalidHexContext(hex_coord, valid_pattern.pattern)
         )
 
 
@@ -510,5 +595,5 @@ def raise_if_wrong_phase(current_phase: str, required_phase: str, action_name: s
         raise InvalidPhaseError(
             f"Cannot perform {action_name} in {current_phase} phase, requires {required_phase}",
             error_code="WRONG_PHASE",
-            context={"current_phase": current_phase, "required_phase": required_phase, "action": action_name}
+            context=WrongPhaseContext(current_phase, required_phase, action_name)
         )
\ No newline at end of file
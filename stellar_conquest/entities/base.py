@@ -2,13 +2,30 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Set
+from typing import ClassVar, Dict, Any, Optional, List, Set
 from datetime import datetime
 import uuid
 
 from ..core.exceptions import ValidationError
 from ..utils.validation import Validator
 
+class MutationCounter:
+    """Mutation count shared by one game state and the entities it owns.
+    
+    GameState.generation reads it. Entities bound to it bump it from their
+    mutators, so changes made directly on players, ships or colonies also
+    advance their own game's generation.
+    """
+    
+    __slots__ = ("value",)
+    
+    def __init__(self) -> None:
+        self.value = 0
+    
+    def bump(self) -> None:
+        """Record that some entity changed; derived game-state indices go stale."""
+        self.value += 1
+
 
 @dataclass
 class BaseEntity(ABC):
@@ -18,6 +35,9 @@ class BaseEntity(ABC):
     created_at: datetime = field(default_factory=datetime.now)
     last_modified: datetime = field(default_factory=datetime.now)
     
+    # Mutation counter of the owning game state; None until bound to one
+    _mutations: ClassVar[Optional[MutationCounter]] = None
+    
     def __post_init__(self):
         """Post-initialization validation and setup."""
         self.validate()
@@ -36,11 +56,19 @@ class BaseEntity(ABC):
     def update_modified_time(self) -> None:
         """Update the last modified timestamp."""
         self.last_modified = datetime.now()
+        if self._mutations is not None:
+            self._mutations.bump()
+    
+    def bind_mutation_counter(self, counter: MutationCounter) -> None:
+        """Report later mutations of this entity to its game state's counter."""
+        self._mutations = counter
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert entity to dictionary representation."""
         result = {}
         for key, value in self.__dict__.items():
+            if key == "_mutations":
+                continue
             if isinstance(value, datetime):
                 result[key] = value.isoformat()
             elif hasattr(value, 'to_dict'):
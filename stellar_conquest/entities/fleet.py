@@ -5,7 +5,7 @@ from typing import List, Dict, Optional
 from .ship import Ship, ShipType
 
 
-@dataclass
+@dataclass(slots=True)
 class Fleet:
     """Represents a collection of ships at a specific location."""
     
@@ -2,9 +2,14 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
 import re
+
+import numpy as np
+
 from .colony import Planet, PlanetType
+from ..utils.hex_utils import calculate_hex_distance
+from ..utils.hex_utils_numba import hex_to_axial
 
 
 class StarColor(Enum):
@@ -47,11 +52,16 @@ class Galaxy:
     gas_cloud_hexes: Set[str] = field(default_factory=set)
     entry_hexes: Dict[int, str] = field(default_factory=dict)  # Player ID -> hex
     
+    # Fixed ordering used to encode star colors in system_color
+    STAR_COLORS: ClassVar[Tuple[StarColor, ...]] = tuple(StarColor)
+    
     def __post_init__(self):
         """Initialize the galaxy with standard Stellar Conquest setup."""
         self._initialize_entry_hexes()
         self._initialize_gas_clouds()
         self._initialize_star_systems()
+        self._build_hex_index()
+        self.rebuild_system_arrays()
     
     def _initialize_entry_hexes(self):
         """Set up the four corner entry hexes."""
@@ -96,8 +106,120 @@ class Galaxy:
         for location, color, name in star_data:
             self.star_systems[location] = StarSystem(location, color, name)
     
+    def _build_hex_index(self):
+        """Assign every board hex a dense index and cache gas-cloud membership."""
+        self._hex_idx: Dict[str, int] = {}
+        for col_num in range(1, 33):
+            col_str = self._number_to_column(col_num)
+            max_row = 21 if col_num % 2 == 1 else 20
+            for row in range(1, max_row + 1):
+                self._hex_idx[f"{col_str}{row}"] = len(self._hex_idx)
+        self._hex_names: List[str] = list(self._hex_idx)
+        
+        # Neighbour table: row i lists the board indices adjacent to hex i, -1 past the edge
+        self._adj_idx = np.full((len(self._hex_idx), 6), -1, dtype=np.int32)
+        for hex_coord, idx in self._hex_idx.items():
+            neighbours = [self._hex_idx[adj] for adj in self._compute_adjacent_hexes(hex_coord)]
+            self._adj_idx[idx, :len(neighbours)] = neighbours
+        
+        self._gas_cloud_mask = np.zeros(len(self._hex_idx), dtype=np.bool_)
+        for hex_coord in self.gas_cloud_hexes:
+            idx = self._hex_idx.get(hex_coord)
+            if idx is not None:
+                self._gas_cloud_mask[idx] = True
+        
+        # Dense hex-to-hex distance table; the board is 32 columns wide, so int8 suffices
+        axial = np.array([hex_to_axial(hex_coord) for hex_coord in self._hex_idx], dtype=np.int16)
+        dq = axial[:, 0, None] - axial[None, :, 0]
+        dr = axial[:, 1, None] - axial[None, :, 1]
+        self._hex_dist = np.maximum(np.maximum(np.abs(dq), np.abs(dr)), np.abs(dq + dr)).astype(np.int8)
+    
+    def rebuild_system_arrays(self):
+        """Mirror the star systems as parallel NumPy arrays (structure of arrays).
+        
+        Call again if systems are added to star_systems after construction.
+        """
+        self.systems_by_index: List[StarSystem] = list(self.star_systems.values())
+        self.system_locations: List[str] = list(self.star_systems.keys())
+        self.system_index: Dict[str, int] = {
+            location: idx for idx, location in enumerate(self.system_locations)
+        }
+        self.system_hex_indices = self.hex_indices(self.system_locations)
+        self.system_color = np.array(
+            [self.STAR_COLORS.index(system.color) for system in self.systems_by_index], dtype=np.int8
+        )
+        self._explored_masks: Dict[int, np.ndarray] = {}
+        self._planet_arrays: Optional[Dict[str, Any]] = None
+        self.refresh_derived_masks()
+    
+    def refresh_derived_masks(self):
+        """Rebuild the board-hex masks derived from system and planet state.
+        
+        unexplored_hex_mask marks systems nobody has explored; colonizable_hex_mask
+        marks systems with an uncolonized habitable planet. Call after colonies change.
+        """
+        self.unexplored_hex_mask = np.zeros(len(self._hex_idx), dtype=np.bool_)
+        self.unexplored_hex_mask[self.system_hex_indices] = [
+            not system.is_explored for system in self.systems_by_index
+        ]
+        self.colonizable_hex_mask = np.zeros(len(self._hex_idx), dtype=np.bool_)
+        self.colonizable_hex_mask[self.system_hex_indices] = [
+            any(planet.is_habitable and not planet.colony for planet in system.planets)
+            for system in self.systems_by_index
+        ]
+    
+    def explored_mask(self, player_id: int) -> np.ndarray:
+        """Bool array over systems_by_index: which systems player_id has explored."""
+        mask = self._explored_masks.get(player_id)
+        if mask is None:
+            mask = np.array(
+                [player_id in system.explored_by for system in self.systems_by_index], dtype=np.bool_
+            )
+            self._explored_masks[player_id] = mask
+        return mask
+    
+    def mark_explored(self, hex_coord: str, player_id: int):
+        """Record that a player explored the system, keeping the array views in sync."""
+        self.star_systems[hex_coord].explored_by.add(player_id)
+        self.explored_mask(player_id)[self.system_index[hex_coord]] = True
+        self.unexplored_hex_mask[self._hex_idx[hex_coord]] = False
+        self._planet_arrays = None  # Exploration may have revealed planets
+    
+    def planet_arrays(self) -> Dict[str, Any]:
+        """Flat table of every known planet, one row per planet across all systems."""
+        if self._planet_arrays is None:
+            rows = [(idx, planet) for idx, system in enumerate(self.systems_by_index)
+                    for planet in system.planets]
+            self._planet_arrays = {
+                "planets": [planet for _, planet in rows],
+                "system": np.array([idx for idx, _ in rows], dtype=np.int32),
+                "victory_points": np.array([planet.victory_points for _, planet in rows], dtype=np.int16),
+                "max_population": np.array([planet.max_population for _, planet in rows], dtype=np.int16),
+                "mineral_rich": np.array([planet.is_mineral_rich for _, planet in rows], dtype=np.bool_),
+            }
+        return self._planet_arrays
+    
     def get_adjacent_hexes(self, hex_coord: str) -> List[str]:
         """Get adjacent hex coordinates."""
+        idx = self._hex_idx.get(hex_coord)
+        if idx is None:
+            return self._compute_adjacent_hexes(hex_coord)
+        return [self._hex_names[adj] for adj in self._adj_idx[idx] if adj >= 0]
+    
+    def adjacent_indices(self, hex_coord: str) -> np.ndarray:
+        """Board indices of the hexes adjacent to hex_coord (empty if it is off the board)."""
+        idx = self._hex_idx.get(hex_coord)
+        if idx is None:
+            return np.empty(0, dtype=np.int32)
+        row = self._adj_idx[idx]
+        return row[row >= 0]
+    
+    def hex_name(self, idx: int) -> str:
+        """Hex coordinate for a board index."""
+        return self._hex_names[idx]
+    
+    def _compute_adjacent_hexes(self, hex_coord: str) -> List[str]:
+        """Work out adjacent hex coordinates from the grid geometry."""
         # Parse hex coordinate (e.g., "A1", "BB15")
         match = re.match(r'^([A-Z]+)(\d+)$', hex_coord)
         if not match:
@@ -163,13 +285,47 @@ class Galaxy:
     
     def calculate_distance(self, hex1: str, hex2: str) -> int:
         """Calculate hex distance between two coordinates."""
-        # Simplified Manhattan distance approximation
-        # Real hex distance calculation would be more complex
-        return abs(hash(hex1) % 20 - hash(hex2) % 20)  # Placeholder
+        idx1 = self._hex_idx.get(hex1)
+        idx2 = self._hex_idx.get(hex2)
+        if idx1 is None or idx2 is None:
+            return calculate_hex_distance(hex1, hex2)  # Raises for off-board hexes
+        return int(self._hex_dist[idx1, idx2])
+    
+    def distances_from(self, hex_coord: str) -> np.ndarray:
+        """Distances from hex_coord to every board hex, ordered by the hex index."""
+        return self._hex_dist[self._hex_idx[hex_coord]]
+    
+    def distance_table(self, from_indices: np.ndarray, to_indices: np.ndarray) -> np.ndarray:
+        """Distances between two batches of board indices, shaped (len(from), len(to))."""
+        return self._hex_dist[np.ix_(from_indices, to_indices)]
+    
+    def within_range_mask(self, hex_coords, max_range: int) -> np.ndarray:
+        """Bool array over board hexes within max_range of any of the given hexes."""
+        origins = [idx for idx in map(self._hex_idx.get, hex_coords) if idx is not None]
+        if not origins:
+            return np.zeros(len(self._hex_idx), dtype=np.bool_)
+        return (self._hex_dist[origins] <= max_range).any(axis=0)
+    
+    def hex_index(self, hex_coord: str) -> Optional[int]:
+        """Dense board index of a hex, or None if it is off the board."""
+        return self._hex_idx.get(hex_coord)
+    
+    def hex_mask(self, hex_coords) -> np.ndarray:
+        """Bool array over board hexes with the given hexes set; off-board hexes are ignored."""
+        mask = np.zeros(len(self._hex_idx), dtype=np.bool_)
+        indices = [idx for idx in map(self._hex_idx.get, hex_coords) if idx is not None]
+        mask[indices] = True
+        return mask
+    
+    def hex_indices(self, hex_coords: List[str]) -> np.ndarray:
+        """Dense board indices for a batch of hexes, for indexing per-hex arrays."""
+        return np.fromiter((self._hex_idx[hex_coord] for hex_coord in hex_coords),
+                           dtype=np.intp, count=len(hex_coords))
     
     def is_gas_cloud_hex(self, hex_coord: str) -> bool:
         """Check if hex contains gas/dust cloud."""
-        return hex_coord in self.gas_cloud_hexes
+        idx = self._hex_idx.get(hex_coord)
+        return idx is not None and bool(self._gas_cloud_mask[idx])
     
     def get_star_system(self, hex_coord: str) -> Optional[StarSystem]:
         """Get star system at hex coordinate."""
@@ -1,18 +1,18 @@
 """Player entity for Stellar Conquest."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, List, Set, Optional, Any, Tuple
 from collections import defaultdict
 
-from ..core.enums import PlayStyle, Technology, ShipType
+from ..core.enums import PlayStyle, Technology, ShipType, enum_mask
 from ..core.exceptions import ValidationError, InsufficientResourcesError, TechnologyNotAvailableError, InvalidActionError
 from ..core.constants import (
-    STARTING_FLEET, STARTING_BONUS_IP, TECHNOLOGY_COSTS, TECHNOLOGY_PREREQUISITES,
+    STARTING_FLEET, STARTING_FLEET_ITEMS, STARTING_BONUS_IP, TECHNOLOGY_COSTS, TECHNOLOGY_PREREQUISITES,
     SHIP_COSTS, DEFAULT_SHIP_SPEED, COMMAND_POST_RANGE
 )
 from ..data import get_technology_data
 from ..utils.validation import GameValidator, Validator
-from .base import GameEntity
+from .base import GameEntity, MutationCounter
 from .ship import Ship, ShipGroup
 from .colony import Colony
 
@@ -60,6 +60,9 @@ class Player(GameEntity):
     # Turn tracking
     turns_completed: int = 0
     
+    # Next unreserved task force ID (0 until first reservation)
+    _next_tf_id: int = field(default=0, init=False, repr=False)
+    
     def validate(self) -> None:
         """Validate player state."""
         super().validate()
@@ -142,6 +145,11 @@ class Player(GameEntity):
         
         return DEFAULT_SHIP_SPEED
     
+    @property
+    def technology_mask(self) -> int:
+        """Completed technologies packed as a bitmask of Technology.bit values."""
+        return enum_mask(self.completed_technologies)
+    
     @property
     def has_unlimited_range(self) -> bool:
         """Check if ships can move beyond command post limit."""
@@ -213,6 +221,21 @@ class Player(GameEntity):
                 return group
         return None
     
+    def reserve_task_force_ids(self, count: int = 1) -> int:
+        """Reserve count consecutive task force IDs and return the first one.
+        
+        IDs are handed out from a monotonic counter that starts above the
+        highest ID already in use, so reserving is O(1) after the first call.
+        """
+        if self._next_tf_id == 0:
+            used_ids = [ship.task_force_id for group in self.ship_groups
+                        for ship in group.ships if ship.task_force_id is not None]
+            self._next_tf_id = max(used_ids, default=0) + 1
+        
+        first_id = self._next_tf_id
+        self._next_tf_id += count
+        return first_id
+    
     def get_colonies_at_location(self, location: str) -> List[Colony]:
         """Get all colonies at a specific hex."""
         return [colony for colony in self.colonies if colony.location == location]
@@ -231,10 +254,20 @@ class Player(GameEntity):
         
         return locations
     
+    def bind_mutation_counter(self, counter: MutationCounter) -> None:
+        """Report later changes to this player, its ships and colonies to the game state's counter."""
+        super().bind_mutation_counter(counter)
+        for group in self.ship_groups:
+            group.bind_mutation_counter(counter)
+        for colony in self.colonies:
+            colony.bind_mutation_counter(counter)
+    
     def add_colony(self, colony: Colony) -> None:
         """Add a colony to this player."""
         colony.player_id = self.player_id
         colony.game_id = self.game_id
+        if self._mutations is not None:
+            colony.bind_mutation_counter(self._mutations)
         self.colonies.append(colony)
         self.update_modified_time()
     
@@ -253,6 +286,8 @@ class Player(GameEntity):
         group = self.get_ship_group_at_location(location)
         if not group:
             group = ShipGroup(location, self.player_id)
+            if self._mutations is not None:
+                group.bind_mutation_counter(self._mutations)
             self.ship_groups.append(group)
         
         # Create ships and add to group
@@ -379,18 +414,18 @@ class Player(GameEntity):
         
         return True
     
-    def _get_same_category_technologies(self, technology: Technology) -> List[Technology]:
+    def _get_same_category_technologies(self, technology: Technology) -> Tuple[Technology, ...]:
         """Get technologies in the same category."""
-        from ..core.enums import get_speed_technologies, get_weapon_technologies, get_industrial_technologies
-        
-        if technology in get_speed_technologies():
-            return get_speed_technologies()
-        elif technology in get_weapon_technologies():
-            return get_weapon_technologies()
-        elif technology in get_industrial_technologies():
-            return get_industrial_technologies()
+        from ..core.enums import SPEED_TECHNOLOGIES, WEAPON_TECHNOLOGIES, INDUSTRIAL_TECHNOLOGIES
+        
+        if technology in SPEED_TECHNOLOGIES:
+            return SPEED_TECHNOLOGIES
+        elif technology in WEAPON_TECHNOLOGIES:
+            return WEAPON_TECHNOLOGIES
+        elif technology in INDUSTRIAL_TECHNOLOGIES:
+            return INDUSTRIAL_TECHNOLOGIES
         else:
-            return [technology]
+            return (technology,)
     
     def build_ships(self, ship_type: ShipType, count: int, location: str, 
                    available_ip: int) -> Dict[str, Any]:
@@ -716,8 +751,12 @@ class Player(GameEntity):
         cleanup_results["ship_groups"] = initial_groups - len(self.ship_groups)
         
         # Remove abandoned colonies
+        initial_colonies = len(self.colonies)
         self.colonies = [c for c in self.colonies if c.status != c.status.ABANDONED]
         
+        if cleanup_results["ship_groups"] or len(self.colonies) != initial_colonies:
+            self.update_modified_time()
+        
         return cleanup_results
     
     def get_strategic_summary(self) -> Dict[str, Any]:
@@ -814,7 +853,7 @@ def create_starting_player(player_id: int, name: str, play_style: PlayStyle, ent
     player.player_id = player_id
     
     # Add starting fleet at entry hex
-    for ship_type, count in STARTING_FLEET.items():
+    for ship_type, count in STARTING_FLEET_ITEMS:
         player.add_ships_at_location(entry_hex, ship_type, count)
     
     return player
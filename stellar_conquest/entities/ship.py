@@ -4,12 +4,12 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
-from ..core.enums import ShipType
+from ..core.enums import ShipType, SHIP_COMBAT_MASK, UNARMED_SHIP_MASK
 from ..core.exceptions import ValidationError, InvalidActionError
 from ..core.constants import SHIP_COSTS, DESTRUCTION_RATES
 from ..data import SHIP_DATA, get_ship_data
 from ..utils.validation import GameValidator, Validator
-from .base import CombatEntity, LocationEntity
+from .base import CombatEntity, LocationEntity, MutationCounter
 
 
 @dataclass
@@ -58,12 +58,12 @@ class Ship(CombatEntity, LocationEntity):
     @property
     def is_warship(self) -> bool:
         """Check if this ship type can participate in combat."""
-        return self.ship_type in [ShipType.CORVETTE, ShipType.FIGHTER, ShipType.DEATH_STAR]
+        return bool(self.ship_type.bit & SHIP_COMBAT_MASK)
     
     @property
     def is_unarmed(self) -> bool:
         """Check if this ship type is vulnerable to exploration risks."""
-        return self.ship_type in [ShipType.SCOUT, ShipType.COLONY_TRANSPORT]
+        return bool(self.ship_type.bit & UNARMED_SHIP_MASK)
     
     @property
     def carries_population(self) -> bool:
@@ -293,10 +293,25 @@ class Ship(CombatEntity, LocationEntity):
 class ShipGroup:
     """Collection of ships at the same location, similar to original Fleet concept."""
     
+    __slots__ = ("location", "player_id", "ships", "_mutations")
+    
     def __init__(self, location: str, player_id: int):
         self.location = location
         self.player_id = player_id
         self.ships: List[Ship] = []
+        # Owning game state's mutation counter; None until bound to one
+        self._mutations: Optional[MutationCounter] = None
+    
+    def bind_mutation_counter(self, counter: MutationCounter) -> None:
+        """Report later changes to this group and its ships to the game state's counter."""
+        self._mutations = counter
+        for ship in self.ships:
+            ship.bind_mutation_counter(counter)
+    
+    def _mark_mutated(self) -> None:
+        """Record a change in the group's ship list."""
+        if self._mutations is not None:
+            self._mutations.bump()
     
     def add_ships(self, ship: Ship) -> None:
         """Add ships to the group."""
@@ -315,7 +330,10 @@ class ShipGroup:
                 return
         
         # Add as new ship group
+        if self._mutations is not None:
+            ship.bind_mutation_counter(self._mutations)
         self.ships.append(ship)
+        self._mark_mutated()
     
     def remove_ships(self, ship_type: ShipType, count: int) -> int:
         """Remove ships from group, returning actual count removed."""
@@ -337,6 +355,8 @@ class ShipGroup:
         # Remove destroyed ships
         for i in reversed(ships_to_remove):
             self.ships.pop(i)
+        if ships_to_remove:
+            self._mark_mutated()
         
         return removed
     
@@ -376,7 +396,10 @@ class ShipGroup:
         """Remove destroyed ships and return count removed."""
         initial_count = len(self.ships)
         self.ships = [ship for ship in self.ships if ship.is_active()]
-        return initial_count - len(self.ships)
+        removed = initial_count - len(self.ships)
+        if removed:
+            self._mark_mutated()
+        return removed
     
     def is_empty(self) -> bool:
         """Check if group has no active ships."""
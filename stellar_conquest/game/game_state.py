@@ -1,17 +1,20 @@
 """Central game state management for Stellar Conquest."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Set
+from functools import cached_property
+from typing import Dict, List, Optional, Any, Set, Tuple
 from enum import Enum
 import uuid
 from datetime import datetime
 
+import numpy as np
+
 from ..core.enums import GamePhase, PlayStyle
 from ..core.exceptions import GameStateError, ValidationError, InvalidActionError
 from ..core.constants import MAX_PLAYERS, MIN_PLAYERS, STARTING_VICTORY_POINTS_TARGET
 from ..utils.validation import GameValidator, Validator
 from ..entities.player import Player, create_starting_player
-from ..entities.base import EntityManager
+from ..entities.base import EntityManager, MutationCounter
 from .board import GameBoard
 
 
@@ -68,6 +71,7 @@ class GameState:
     # Game history
     turn_history: List[Dict[str, Any]] = field(default_factory=list)
     action_log: List[Dict[str, Any]] = field(default_factory=list)
+    muted_actions: Set[str] = field(default_factory=set)  # Action types left out of action_log
     
     # Timestamps
     created_at: datetime = field(default_factory=datetime.now)
@@ -75,14 +79,33 @@ class GameState:
     completed_at: Optional[datetime] = None
     last_action_at: datetime = field(default_factory=datetime.now)
     
+    # Randomness (seed None draws fresh entropy)
+    random_seed: Optional[int] = None
+    rng: np.random.Generator = field(init=False, repr=False)
+    
+    # Mutation counter shared with this game's entities; derived indices remember
+    # the generation they were built at
+    _mutations: MutationCounter = field(default_factory=MutationCounter, init=False, repr=False, compare=False)
+    
+    # Location indices for AI queries; rebuilt lazily once the generation has advanced
+    _colonies_by_loc: Dict[Tuple[int, str], List[Any]] = field(default_factory=dict, init=False, repr=False)
+    _enemy_ships_by_loc: Dict[str, Dict[int, Any]] = field(default_factory=dict, init=False, repr=False)
+    _ship_totals_by_loc: Dict[str, Dict[int, int]] = field(default_factory=dict, init=False, repr=False)
+    _spatial_index_gen: int = field(default=-1, init=False, repr=False)
+    
     def __post_init__(self):
         """Initialize game state."""
+        self.rng = np.random.default_rng(self.random_seed)
+        
         if not self.board:
             self.board = GameBoard(self.game_id)
         
         if not self.entity_manager:
             self.entity_manager = EntityManager(self.game_id)
             self._setup_entity_collections()
+        
+        for player in self.players:
+            player.bind_mutation_counter(self._mutations)
     
     def _setup_entity_collections(self) -> None:
         """Setup entity collections in the manager."""
@@ -119,6 +142,57 @@ class GameState:
         if self.board:
             self.board.validate()
     
+    def rebuild_spatial_index(self, force: bool = False) -> None:
+        """Index colonies and ship groups by location in one pass per player.
+        
+        _colonies_by_loc maps (player_id, location) to that player's colonies
+        there; _enemy_ships_by_loc maps location to {player_id: ship group}
+        and _ship_totals_by_loc holds each of those groups' get_total_ships()
+        as of the rebuild. The rebuild is skipped while the index is still
+        current for this generation unless force is set.
+        """
+        generation = self.generation
+        if not force and self._spatial_index_gen == generation:
+            return
+        
+        colonies_by_loc: Dict[Tuple[int, str], List[Any]] = {}
+        ships_by_loc: Dict[str, Dict[int, Any]] = {}
+        totals_by_loc: Dict[str, Dict[int, int]] = {}
+        for player in self.players:
+            for colony in player.colonies:
+                colonies_by_loc.setdefault((player.player_id, colony.location), []).append(colony)
+            for group in player.ship_groups:
+                # Keep the first group per location, as get_ship_group_at_location does
+                groups_here = ships_by_loc.setdefault(group.location, {})
+                if player.player_id not in groups_here:
+                    groups_here[player.player_id] = group
+                    totals_by_loc.setdefault(group.location, {})[player.player_id] = group.get_total_ships()
+        
+        self._colonies_by_loc = colonies_by_loc
+        self._enemy_ships_by_loc = ships_by_loc
+        self._ship_totals_by_loc = totals_by_loc
+        self._spatial_index_gen = generation
+    
+    @property
+    def generation(self) -> int:
+        """Mutation counter; changes whenever players, ships or colonies may have changed.
+        
+        The counter is shared with this game's players, ships and colonies: the
+        state bumps it for roster, turn and movement changes, and the entity
+        mutators bump it for changes made directly on them.
+        """
+        return self._mutations.value
+    
+    def bump_generation(self) -> None:
+        """Record a mutation so derived indices rebuild on their next use."""
+        self._mutations.bump()
+    
+    @cached_property
+    def taskforce_destination_selector(self):
+        """Shared selector for post-combat taskforce redirects, created on first use."""
+        from ..ai.destination_selector import TaskforceDestinationSelector
+        return TaskforceDestinationSelector(self)
+    
     @property
     def is_setup(self) -> bool:
         """Check if game is in setup phase."""
@@ -176,9 +250,11 @@ class GameState:
         player_id = len(self.players) + 1
         player = create_starting_player(player_id, name, play_style, entry_hex)
         player.game_id = self.game_id
+        player.bind_mutation_counter(self._mutations)
         
         self.players.append(player)
         self.player_order.append(player_id)
+        self.bump_generation()
         
         # Add to entity manager
         players_collection = self.entity_manager.get_collection("players")
@@ -200,6 +276,7 @@ class GameState:
         self.players.remove(player)
         if player_id in self.player_order:
             self.player_order.remove(player_id)
+        self.bump_generation()
         
         # Remove from entity manager
         players_collection = self.entity_manager.get_collection("players")
@@ -286,6 +363,7 @@ class GameState:
             return
         
         self.eliminated_players.add(player_id)
+        self.bump_generation()
         self._log_action("player_eliminated", {"player_id": player_id, "reason": reason})
         
         # Check if game should end
@@ -345,6 +423,12 @@ class GameState:
         self.current_turn += 1
         self.current_phase = GamePhase.MOVEMENT
         self.current_player_index = 0
+        self.bump_generation()
+        
+        # Drop redirect decisions cached for the previous turn
+        selector = self.__dict__.get("taskforce_destination_selector")
+        if selector is not None:
+            selector.clear_turn_caches()
         
         # Process end-of-turn activities
         self._process_end_of_turn()
@@ -389,8 +473,15 @@ class GameState:
         }
         self.turn_history.append(turn_state)
     
+    def is_logging(self, action_type: str) -> bool:
+        """Check whether actions of this type are recorded, so callers can skip building payloads."""
+        return action_type not in self.muted_actions
+    
     def _log_action(self, action_type: str, data: Dict[str, Any]) -> None:
         """Log a game action."""
+        if action_type in self.muted_actions:
+            return
+        
         action_entry = {
             "id": str(uuid.uuid4()),
             "timestamp": datetime.now().isoformat(),
@@ -469,12 +560,13 @@ class GameState:
 
 
 # Utility functions for game state management
-def create_game(settings: Optional[GameSettings] = None) -> GameState:
+def create_game(settings: Optional[GameSettings] = None,
+                random_seed: Optional[int] = None) -> GameState:
     """Create a new game with default or custom settings."""
     if settings is None:
         settings = GameSettings()
     
-    return GameState(settings=settings)
+    return GameState(settings=settings, random_seed=random_seed)
 
 
 def load_game(game_data: Dict[str, Any]) -> GameState:
@@ -8,9 +8,16 @@ This module handles all combat-related functionality including:
 - Colony attacks and conquest
 """
 
+import logging
 import random
+
+import numpy as np
+
+from stellar_conquest.core.constants import SHIP_TYPE_INDEX
 from stellar_conquest.core.enums import ShipType
 
+log = logging.getLogger(__name__)
+
 
 def check_enemy_ships_at_location(game_state, location, current_player):
     """Check if there are enemy ships at a given location."""
@@ -129,7 +136,8 @@ def resolve_ship_combat(game_state, location, attacker_player, defender_player):
     # Get ships at this location for both players
     attacker_ships = {}
     defender_ships = {}
-    attacker_taskforces = {}  # Track which ships belong to which taskforces
+    # Per-taskforce ship count arrays indexed by SHIP_TYPE_INDEX, for redirection
+    attacker_taskforces = {}
     defender_taskforces = {}
     
     for group in attacker_player.ship_groups:
@@ -142,10 +150,8 @@ def resolve_ship_combat(game_state, location, attacker_player, defender_player):
                 # Track taskforce composition for redirection
                 tf_id = ship.task_force_id
                 if tf_id not in attacker_taskforces:
-                    attacker_taskforces[tf_id] = {}
-                if ship.ship_type not in attacker_taskforces[tf_id]:
-                    attacker_taskforces[tf_id][ship.ship_type] = 0
-                attacker_taskforces[tf_id][ship.ship_type] += ship.count
+                    attacker_taskforces[tf_id] = np.zeros(len(SHIP_TYPE_INDEX), dtype=np.uint16)
+                attacker_taskforces[tf_id][SHIP_TYPE_INDEX[ship.ship_type]] += ship.count
     
     for group in defender_player.ship_groups:
         for ship in group.ships:
@@ -157,10 +163,8 @@ def resolve_ship_combat(game_state, location, attacker_player, defender_player):
                 # Track taskforce composition for redirection
                 tf_id = ship.task_force_id
                 if tf_id not in defender_taskforces:
-                    defender_taskforces[tf_id] = {}
-                if ship.ship_type not in defender_taskforces[tf_id]:
-                    defender_taskforces[tf_id][ship.ship_type] = 0
-                defender_taskforces[tf_id][ship.ship_type] += ship.count
+                    defender_taskforces[tf_id] = np.zeros(len(SHIP_TYPE_INDEX), dtype=np.uint16)
+                defender_taskforces[tf_id][SHIP_TYPE_INDEX[ship.ship_type]] += ship.count
     
     # Check if either side has only non-combat ships (Rule 4.1.3)
     combat_ship_types = {ShipType.CORVETTE, ShipType.FIGHTER, ShipType.DEATH_STAR}
@@ -306,7 +310,8 @@ def _handle_combat_redirection(game_state, player, taskforces_at_location, locat
         
         if new_destination and new_destination != original_destination:
             # Update movement plan with new destination
-            print(f"   🔄 TF{tf_id} redirected from {original_destination} to {new_destination} due to {combat_result}")
+            log.debug("TF%d redirected from %s to %s due to %s",
+                      tf_id, original_destination, new_destination, combat_result)
             
             # Calculate new path
             from stellar_conquest.utils.hex_utils import find_path
@@ -322,8 +327,11 @@ def _handle_combat_redirection(game_state, player, taskforces_at_location, locat
                     'redirected_at_location': location
                 })
             else:
-                print(f"   ❌ Could not find path to new destination {new_destination} for TF{tf_id}")
+                log.debug("Could not find path to new destination %s for TF%d",
+                          new_destination, tf_id)
         elif not new_destination:
-            print(f"   ⚠️  No suitable redirect destination found for TF{tf_id} after {combat_result}")
+            log.debug("No suitable redirect destination found for TF%d after %s",
+                      tf_id, combat_result)
         else:
-            print(f"   ➡️  TF{tf_id} continues toward original destination {original_destination}")
\ No newline at end of file
+            log.debug("TF%d continues toward original destination %s",
+                      tf_id, original_destination)
\ No newline at end of file
@@ -112,7 +112,7 @@ class StellarConquestSimulator:
         if settings is None:
             settings = GameSettings(max_turns=self.config.max_turns)
         
-        self.game_state = create_game(settings)
+        self.game_state = create_game(settings, self.config.random_seed)
         
         # Add players
         entry_hexes = ["A1", "A14", "N1", "N14", "G1", "H14"]  # Available entry points
@@ -858,7 +858,7 @@ class EnhancedMapGenerator:
         considering gas cloud movement restrictions.
         """
         from stellar_conquest.core.constants import GAS_CLOUD_HEXES
-        gas_cloud_hexes = set(GAS_CLOUD_HEXES)
+        gas_cloud_hexes = GAS_CLOUD_HEXES
         
         movement_this_turn = 0
         position_index = current_path_index
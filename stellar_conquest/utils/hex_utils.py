@@ -2,6 +2,7 @@
 
 import math
 import re
+from functools import lru_cache
 from typing import List, Tuple, Optional, Set, Dict
 from dataclasses import dataclass
 from ..core.exceptions import InvalidHexError, PathfindingError
@@ -194,7 +195,7 @@ class HexGrid:
     
     def _calculate_gas_cloud_move_cost(self, current_hex: str, next_hex: str) -> int:
         """Calculate movement cost considering gas cloud rules."""
-        gas_cloud_hexes = set(GAS_CLOUD_HEXES)
+        gas_cloud_hexes = GAS_CLOUD_HEXES
         
         # Standard movement cost is 1
         base_cost = 1
@@ -242,7 +243,7 @@ class HexGrid:
         This represents the actual number of movement points needed.
         """
         if gas_cloud_hexes is None:
-            gas_cloud_hexes = set(GAS_CLOUD_HEXES)
+            gas_cloud_hexes = GAS_CLOUD_HEXES
         
         if len(path) <= 1:
             return 0
@@ -336,14 +337,52 @@ hex_grid = HexGrid()
 
 
 # Utility functions
+def parse_hex(hex_coord: str) -> Optional[Tuple[int, int]]:
+    """Parse a hex string like 'E5' or 'AA12' into (column number, row).
+    
+    Hand-rolled rather than a regex: a single letter or a doubled letter
+    (AA-FF style) followed by digits. Returns None when the string does not
+    have that shape; board bounds are not checked here.
+    """
+    n = len(hex_coord)
+    if n < 2:
+        return None
+    
+    c0 = ord(hex_coord[0]) - 64
+    if not 1 <= c0 <= 26:
+        return None
+    column = c0
+    i = 1
+    c1 = ord(hex_coord[1]) - 64
+    if 1 <= c1 <= 26:
+        if c1 != c0:
+            return None
+        column = c0 + 26
+        i = 2
+    if i >= n:
+        return None
+    
+    row = 0
+    while i < n:
+        digit = ord(hex_coord[i]) - 48
+        if not 0 <= digit <= 9:
+            return None
+        row = row * 10 + digit
+        i += 1
+    return column, row
+
+
 def is_valid_hex(hex_coord: str) -> bool:
     """Check if hex coordinate is valid on the game board."""
-    try:
-        coord = HexCoordinate.from_string(hex_coord)
-        max_row = hex_grid.get_max_row(coord.column)
-        return 1 <= coord.row <= max_row
-    except (InvalidHexError, ValueError):
+    parsed = parse_hex(hex_coord)
+    if parsed is None:
         return False
+    
+    column, row = parsed
+    if column > hex_grid.total_columns:
+        return False
+    max_row = hex_grid.odd_column_rows if column % 2 == 1 else hex_grid.even_column_rows
+    return 1 <= row <= max_row
 
 
 def parse_hex_coordinate(hex_string: str) -> Optional[HexCoordinate]:
@@ -354,13 +393,20 @@ def parse_hex_coordinate(hex_string: str) -> Optional[HexCoordinate]:
         return None
 
 
+@lru_cache(maxsize=None)
+def _adjacent_hexes(hex_coord: str) -> Tuple[str, ...]:
+    """Memoized adjacency; the board never changes, so each hex is computed once."""
+    return tuple(hex_grid.get_adjacent_coordinates(hex_coord))
+
+
 def get_adjacent_hexes(hex_coord: str) -> List[str]:
     """Get adjacent hex coordinates."""
-    return hex_grid.get_adjacent_coordinates(hex_coord)
+    return list(_adjacent_hexes(hex_coord))
 
 
+@lru_cache(maxsize=16384)
 def calculate_hex_distance(hex1: str, hex2: str) -> int:
-    """Calculate distance between two hex coordinates."""
+    """Calculate distance between two hex coordinates (memoized; the board is fixed)."""
     return hex_grid.calculate_distance(hex1, hex2)
 
 
@@ -376,12 +422,12 @@ def get_hexes_in_range(center: str, range_limit: int, blocked_hexes: Set[str] =
 
 def is_adjacent(hex1: str, hex2: str) -> bool:
     """Check if two hexes are adjacent."""
-    return hex2 in get_adjacent_hexes(hex1)
+    return hex2 in _adjacent_hexes(hex1)
 
 
 def get_direction_to(from_hex: str, to_hex: str) -> Optional[int]:
     """Get direction index (0-5) from one hex to adjacent hex."""
-    adjacent = get_adjacent_hexes(from_hex)
+    adjacent = _adjacent_hexes(from_hex)
     try:
         return adjacent.index(to_hex)
     except ValueError:
@@ -397,7 +443,7 @@ def calculate_movement_turns(path: List[str], ship_speed: int, gas_cloud_hexes:
     4. Leaving gas cloud allows full speed movement
     """
     if gas_cloud_hexes is None:
-        gas_cloud_hexes = set(GAS_CLOUD_HEXES)
+        gas_cloud_hexes = GAS_CLOUD_HEXES
     
     if len(path) <= 1:
         return 0
@@ -461,7 +507,7 @@ def validate_movement_path(path: List[str], ship_speed: int,
                           gas_cloud_hexes: Set[str] = None) -> bool:
     """Validate that a movement path is legal for given ship speed."""
     if gas_cloud_hexes is None:
-        gas_cloud_hexes = set(GAS_CLOUD_HEXES)
+        gas_cloud_hexes = GAS_CLOUD_HEXES
     
     if len(path) <= 1:
         return True
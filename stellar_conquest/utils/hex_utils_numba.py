@@ -0,0 +1,50 @@
+"""Compiled hex-distance kernels for AI evaluation loops.
+
+Numba is an optional dependency. When it is not installed the kernels below
+run as ordinary NumPy/Python functions and return the same results.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from .hex_utils import hex_grid
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def hex_to_axial(hex_coord: str) -> Tuple[int, int]:
+    """Convert a hex coordinate like 'E5' to axial (q, r) integers."""
+    q, r, _ = hex_grid.hex_to_cube(hex_coord)
+    return q, r
+
+
+@njit(cache=True)
+def hex_distance(aq: int, ar: int, bq: int, br: int) -> int:
+    """Hex distance between two axial coordinates."""
+    dq = aq - bq
+    dr = ar - br
+    return max(abs(dq), abs(dr), abs(dq + dr))
+
+
+@njit(cache=True)
+def within_distance_mask(q: int, r: int, qs: np.ndarray, rs: np.ndarray,
+                         max_distance: int) -> np.ndarray:
+    """Flag which of the axial coordinates (qs, rs) lie within max_distance of (q, r)."""
+    n = qs.shape[0]
+    mask = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        if hex_distance(q, r, qs[i], rs[i]) <= max_distance:
+            mask[i] = True
+    return mask
@@ -1,7 +1,7 @@
 """Input validation utilities for Stellar Conquest simulator."""
 
 import re
-from typing import Any, List, Dict, Union, Optional, Type, Callable
+from typing import Any, List, Dict, Union, Optional, Pattern, Type, Callable
 from ..core.enums import ShipType, PlanetType, Technology, PlayStyle, StarColor, TurnPhase
 from ..core.exceptions import (
     ValidationError, InvalidInputError, RangeValidationError, 
@@ -9,7 +9,7 @@ from ..core.exceptions import (
 )
 from ..core.constants import (
     MAX_PLAYERS, MIN_PLAYER_COUNT, MAX_TURNS, MAX_GAME_NAME_LENGTH,
-    MAX_PLAYER_NAME_LENGTH, VALID_HEX_PATTERN, STARTING_FLEET
+    MAX_PLAYER_NAME_LENGTH, VALID_HEX_RE, STARTING_FLEET
 )
 
 
@@ -80,13 +80,14 @@ class Validator:
             )
     
     @staticmethod
-    def validate_pattern(value: str, pattern: str, field_name: str = "value") -> None:
-        """Validate string matches pattern."""
+    def validate_pattern(value: str, pattern: Union[str, Pattern[str]], field_name: str = "value") -> None:
+        """Validate string matches pattern (a regex string or a precompiled pattern)."""
         if not re.match(pattern, value):
+            pattern_text = getattr(pattern, "pattern", pattern)
             raise InvalidInputError(
-                f"{field_name} does not match required pattern {pattern}: {value}",
+                f"{field_name} does not match required pattern {pattern_text}: {value}",
                 error_code="PATTERN_MISMATCH",
-                context={"field": field_name, "value": value, "pattern": pattern}
+                context={"field": field_name, "value": value, "pattern": pattern_text}
             )
     
     @staticmethod
@@ -143,10 +144,10 @@ class GameValidator(Validator):
     def validate_hex_coordinate(hex_coord: str) -> None:
         """Validate hex coordinate format."""
         GameValidator.validate_type(hex_coord, str, "hex_coordinate")
-        GameValidator.validate_pattern(hex_coord, VALID_HEX_PATTERN, "hex_coordinate")
+        GameValidator.validate_pattern(hex_coord, VALID_HEX_RE, "hex_coordinate")
         
         # Additional validation for valid board positions
-        match = re.match(r'^([A-Z]{1,2})(\d+)$', hex_coord)
+        match = VALID_HEX_RE.match(hex_coord)
         if match:
             col_str, row_str = match.groups()
             row = int(row_str)
@@ -0,0 +1,24 @@
+"""Shared setup for the Stellar Conquest tests."""
+
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_DIR = ROOT / "stellar_conquest"
+
+# The simulation modules import their siblings as top-level packages
+# ("from simulation.combat_system import ..."), so both roots go on the path.
+for path in (str(PACKAGE_DIR), str(ROOT)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import stellar_conquest  # noqa: E402
+
+# stellar_conquest.ai/__init__ imports every strategy, some of which pull in
+# action modules with stale imports. Register the package without running
+# __init__ so the strategy modules under test can be imported on their own.
+if "stellar_conquest.ai" not in sys.modules:
+    _ai_package = types.ModuleType("stellar_conquest.ai")
+    _ai_package.__path__ = [str(PACKAGE_DIR / "ai")]
+    sys.modules["stellar_conquest.ai"] = _ai_package
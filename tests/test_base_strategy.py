@@ -0,0 +1,77 @@
+"""Tests for BaseStrategy planners."""
+
+from types import SimpleNamespace
+
+from stellar_conquest.ai.base_strategy import SCOUT_TASK_FORCE_LIMIT, BaseStrategy, StrategyWeights
+from stellar_conquest.core.enums import PlayStyle, ShipType
+from stellar_conquest.entities.player import create_starting_player
+from stellar_conquest.game.game_state import GameState
+
+
+class FixedTargetStrategy(BaseStrategy):
+    """Minimal concrete strategy with a fixed list of exploration targets."""
+
+    def decide_turn_actions(self, player, game_state):
+        return []
+
+    def decide_production_spending(self, player, game_state):
+        return {}
+
+    def evaluate_exploration_targets(self, player, game_state):
+        return [("B3", 5.0), ("C4", 4.0), ("D5", 3.0)]
+
+
+def make_game_state(players):
+    return SimpleNamespace(current_turn=1, generation=0, players=players)
+
+
+def test_split_oversized_scout_task_forces():
+    player = create_starting_player(1, "Scout", PlayStyle.EXPANSIONIST, "A1")
+    player.add_ships_at_location("A1", ShipType.SCOUT, 8)  # 4 starting + 8
+    strategy = FixedTargetStrategy("test", StrategyWeights())
+
+    actions = strategy.split_oversized_scout_task_forces(player, make_game_state([player]))
+
+    assert len(actions) == 1
+    orders = actions[0].movement_orders
+    assert [order.ship_count for order in orders] == [SCOUT_TASK_FORCE_LIMIT, 2]
+    assert [order.destination for order in orders] == ["B3", "C4"]
+    assert all(order.fleet_location == "A1" and order.ship_type is ShipType.SCOUT for order in orders)
+    task_force_ids = [order.task_force_id for order in orders]
+    assert task_force_ids[1] == task_force_ids[0] + 1
+
+
+def test_split_leaves_small_scout_groups_alone():
+    player = create_starting_player(1, "Scout", PlayStyle.EXPANSIONIST, "A1")
+    strategy = FixedTargetStrategy("test", StrategyWeights())
+
+    assert strategy.split_oversized_scout_task_forces(player, make_game_state([player])) == ()
+
+
+def test_ship_index_rebuilds_after_mid_turn_mutation():
+    game_state = GameState()
+    player = game_state.add_player("Scout", PlayStyle.EXPANSIONIST, "A1")
+    strategy = FixedTargetStrategy("test", StrategyWeights())
+
+    before = strategy._get_ship_index(player, game_state)
+    player.add_ships_at_location("C5", ShipType.CORVETTE, 3)
+    after = strategy._get_ship_index(player, game_state)
+
+    assert "C5" not in before.loc_to_rows
+    assert "C5" in after.loc_to_rows
+
+
+def test_scout_split_is_replanned_after_state_change():
+    game_state = GameState()
+    player = game_state.add_player("Scout", PlayStyle.EXPANSIONIST, "A1")
+    player.add_ships_at_location("A1", ShipType.SCOUT, 8)
+    strategy = FixedTargetStrategy("test", StrategyWeights())
+
+    first = strategy.split_oversized_scout_task_forces(player, game_state)
+    assert strategy.split_oversized_scout_task_forces(player, game_state) is first
+
+    # Carry out the split; the next call in the same turn must not resubmit it
+    for order in first[0].movement_orders:
+        player.move_ships(order.fleet_location, order.destination, order.ship_type, order.ship_count)
+
+    assert strategy.split_oversized_scout_task_forces(player, game_state) == ()
@@ -0,0 +1,44 @@
+"""Tests for combat redirection."""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from stellar_conquest.core.constants import SHIP_TYPE_INDEX
+from stellar_conquest.core.enums import ShipType
+from stellar_conquest.simulation.combat_system import _handle_combat_redirection
+
+
+class RecordingSelector:
+    """Destination selector double that records the composition flags it was given."""
+
+    def __init__(self, destination):
+        self.destination = destination
+        self.calls = []
+
+    def select_new_destination_after_combat(self, player, taskforce_id, current_location,
+                                            original_destination, combat_result,
+                                            has_warships, has_unarmed_ships):
+        self.calls.append((taskforce_id, has_warships, has_unarmed_ships))
+        return self.destination
+
+
+def test_handle_combat_redirection_redirects_taskforce_plan():
+    player = SimpleNamespace(player_id=1)
+    selector = RecordingSelector("E7")
+    game_state = SimpleNamespace(
+        taskforce_destination_selector=selector,
+        is_logging=lambda action_type: False,
+        movement_plans={1: {2: {"final_destination": "H9", "planned_path": ["B5", "H9"]}}},
+    )
+    ship_counts = np.zeros(len(SHIP_TYPE_INDEX), dtype=np.uint16)
+    ship_counts[SHIP_TYPE_INDEX[ShipType.SCOUT]] = 2
+
+    _handle_combat_redirection(game_state, player, {2: ship_counts}, "B5", "attacker_repelled")
+
+    assert selector.calls == [(2, False, True)]
+    plan = game_state.movement_plans[1][2]
+    assert plan["final_destination"] == "E7"
+    assert plan["planned_path"] == ["B5", "C6", "D6", "E7"]
+    assert plan["original_destination"] == "H9"
+    assert plan["redirected_due_to"] == "attacker_repelled"
@@ -0,0 +1,62 @@
+"""Tests for the post-combat taskforce destination selector."""
+
+from types import SimpleNamespace
+
+from stellar_conquest.ai.destination_selector import TaskforceDestinationSelector
+
+
+class CountingSelector(TaskforceDestinationSelector):
+    """Selector whose scan just counts how often it runs."""
+
+    __slots__ = ("scans",)
+
+    def __init__(self, game_state):
+        super().__init__(game_state)
+        self.scans = 0
+
+    def _select_destination(self, *args):
+        self.scans += 1
+        return "E7"
+
+
+def test_redirect_memo_is_dropped_when_state_changes():
+    game_state = SimpleNamespace(random_seed=1, current_turn=3, generation=0)
+    selector = CountingSelector(game_state)
+    player = SimpleNamespace(player_id=1)
+    args = (player, 2, "B5", "H9", "attacker_repelled", False, True)
+
+    selector.select_new_destination_after_combat(*args)
+    selector.select_new_destination_after_combat(*args)
+    assert selector.scans == 1
+
+    game_state.generation += 1
+    selector.select_new_destination_after_combat(*args)
+    assert selector.scans == 2
+
+
+class NoCandidateSelector(TaskforceDestinationSelector):
+    """Selector that finds no candidates, so only the mask refresh runs."""
+
+    __slots__ = ()
+
+    def _get_candidate_destinations(self, *args):
+        return []
+
+    def _select_safe_fallback_destination(self, player, current_location):
+        return None
+
+
+def test_derived_masks_rebuild_only_on_generation_change():
+    refreshes = []
+    galaxy = SimpleNamespace(refresh_derived_masks=lambda: refreshes.append(True))
+    game_state = SimpleNamespace(random_seed=1, current_turn=3, generation=0, galaxy=galaxy)
+    selector = NoCandidateSelector(game_state)
+    player = SimpleNamespace(player_id=1)
+
+    selector._select_destination(player, "B5", "H9", "attacker_repelled", False, True)
+    selector._select_destination(player, "C6", "H9", "defender_defeat", True, False)
+    assert len(refreshes) == 1
+
+    game_state.generation += 1
+    selector._select_destination(player, "B5", "H9", "attacker_repelled", False, True)
+    assert len(refreshes) == 2
@@ -0,0 +1,45 @@
+"""Tests for the simulator exception types and raise_if_* helpers."""
+
+import pickle
+
+import pytest
+
+from stellar_conquest.core.exceptions import (
+    InsufficientResourcesError,
+    InvalidPlayerError,
+    ValidationError,
+    raise_if_insufficient_resources,
+    raise_if_invalid_player,
+)
+
+
+def test_helper_context_reads_as_dict():
+    with pytest.raises(InvalidPlayerError) as excinfo:
+        raise_if_invalid_player(3, {1, 2}, "move")
+
+    context = excinfo.value.context
+    assert context["player_id"] == 3
+    assert context.get("context") == "move"
+    assert str(excinfo.value) == (
+        "[INVALID_PLAYER] Player 3 is not valid "
+        "(Context: player_id=3, valid_players={1, 2}, context=move)"
+    )
+
+
+def test_empty_context_is_a_mutable_dict():
+    error = ValidationError("bad input")
+
+    error.context["field"] = "name"
+
+    assert error.context == {"field": "name"}
+
+
+def test_errors_round_trip_through_pickle():
+    with pytest.raises(InsufficientResourcesError) as excinfo:
+        raise_if_insufficient_resources(10, 4, "IP")
+
+    for error in (excinfo.value, ValidationError("bad input")):
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is type(error)
+        assert str(restored) == str(error)
+        assert restored.context == error.context
@@ -0,0 +1,52 @@
+"""Tests for GameState's generation counter and spatial index."""
+
+from stellar_conquest.core.enums import PlayStyle, ShipType
+from stellar_conquest.game.game_state import GameState
+
+
+def make_two_player_game():
+    game_state = GameState()
+    first = game_state.add_player("First", PlayStyle.EXPANSIONIST, "A1")
+    second = game_state.add_player("Second", PlayStyle.WARLORD, "Z1")
+    return game_state, first, second
+
+
+def test_entity_mutations_advance_generation():
+    game_state, first, second = make_two_player_game()
+
+    generation = game_state.generation
+    second.add_ships_at_location("C5", ShipType.CORVETTE, 3)
+    assert game_state.generation > generation
+
+    generation = game_state.generation
+    second.remove_ships_from_location("C5", ShipType.CORVETTE, 3)
+    assert game_state.generation > generation
+
+
+def test_generation_is_per_game_state():
+    game_state, first, second = make_two_player_game()
+    other_game, other_first, other_second = make_two_player_game()
+
+    generation = game_state.generation
+    other_second.add_ships_at_location("C5", ShipType.CORVETTE, 3)
+    other_second.ship_groups[-1].ships[0].move_to_location("D5")
+    assert game_state.generation == generation
+
+    second.ship_groups[0].ships[0].move_to_location("B2")
+    assert game_state.generation > generation
+
+
+def test_ship_mutation_invalidates_spatial_index():
+    game_state, first, second = make_two_player_game()
+    game_state.rebuild_spatial_index()
+    assert "C5" not in game_state._enemy_ships_by_loc
+
+    second.add_ships_at_location("C5", ShipType.CORVETTE, 3)
+    game_state.rebuild_spatial_index()
+
+    assert game_state._ship_totals_by_loc["C5"] == {second.player_id: 3}
+
+    second.remove_ships_from_location("C5", ShipType.CORVETTE, 3)
+    game_state.rebuild_spatial_index()
+
+    assert "C5" not in game_state._ship_totals_by_loc
@@ -0,0 +1,20 @@
+"""Tests for movement actions."""
+
+from types import SimpleNamespace
+
+from stellar_conquest.actions.movement_action import FirstTurnEntryAction
+
+
+def test_first_turn_entry_validate_has_no_side_effects():
+    player = SimpleNamespace(player_id=1, turns_completed=0)
+    game_state = SimpleNamespace(
+        players={1: player},
+        galaxy=SimpleNamespace(entry_hexes={1: "A1"}),
+    )
+    action = FirstTurnEntryAction(1)
+
+    assert action.validate(game_state)
+    assert not action._prevalidated
+
+    player.turns_completed = 1
+    assert not action.validate(game_state)